@@ -7,11 +7,22 @@ Updated: December 2, 2025
 """
 
 import asyncio
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import partial
 import json
 
+import numpy as np
+
+# uvloop is not available on Windows - fall back to the default selector loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from models.report_data import (
     PipelineReportData,
     RealForecloseData,
@@ -45,15 +56,109 @@ from pipeline.title_risk_score import TitleRiskScorer, calculate_adjusted_max_bi
 from pipeline.municipal_lien_search import check_municipal_liens
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
-    """Pipeline configuration"""
+    """Pipeline configuration (immutable - use with_overrides to derive)"""
     enable_ml_prediction: bool = True
     enable_title_risk: bool = True
     enable_municipal_check: bool = True
     default_repair_contingency: float = 0.15  # 15% of ARV
     min_comparables: int = 3
     arv_confidence_threshold: float = 70.0
+    detailed_title_issues: bool = True  # False = cure totals only, no BlockingIssue list
+
+    def with_overrides(self, **overrides) -> "PipelineConfig":
+        """Return a new config with the given fields replaced"""
+        return replace(self, **overrides)
+
+
+class MLBatcher:
+    """
+    Coalesces Stage 6 requests from concurrent pipelines into one model call.
+    
+    Each submit() enqueues a feature row with a future; a background worker
+    drains up to max_batch rows (or whatever arrives within timeout seconds),
+    runs the model once on the stacked matrix and resolves every future.
+    """
+    
+    def __init__(
+        self,
+        predict_batch: Callable[[np.ndarray], List[MLPrediction]],
+        max_batch: int = 64,
+        timeout: float = 0.02
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+    
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        # Fail anything still waiting rather than leaving callers hung
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+    
+    async def submit(self, features: List[float]) -> MLPrediction:
+        """Queue one feature row and wait for its prediction"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[List[float], asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.timeout
+            try:
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Rows already taken off the queue are invisible to stop()'s drain
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+            
+            try:
+                predictions = self.predict_batch(np.array([f for f, _ in batch], dtype=np.float64))
+                if len(predictions) != len(batch):
+                    raise ValueError(
+                        f"predict_batch returned {len(predictions)} predictions for {len(batch)} rows"
+                    )
+            except Exception as e:
+                # Fail every waiting caller; an unresolved future would hang its case
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
 
 
 class PipelineOrchestrator:
@@ -76,34 +181,70 @@ class PipelineOrchestrator:
     13. Title Risk Score - Title assessment
     """
     
+    __slots__ = (
+        "config", "title_scorer", "stages_completed", "errors", "ml_batcher",
+        "_municipal_inflight", "_executor"
+    )
+    
     def __init__(self, config: PipelineConfig = None):
         self.config = config or PipelineConfig()
         self.title_scorer = TitleRiskScorer()
         self.stages_completed = []
         self.errors = []
+        self.ml_batcher = MLBatcher(self._predict_ml_batch)
+        self._municipal_inflight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    async def __aenter__(self):
+        # Bounded pool for sync work so it overlaps other cases' network I/O
+        self._executor = ThreadPoolExecutor(max_workers=16)
+        if self.config.enable_ml_prediction:
+            await self.ml_batcher.start()
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.ml_batcher.stop()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
-    async def run_pipeline(self, case_number: str) -> PipelineReportData:
+    async def _run_sync(self, func, *args):
+        """Run blocking work on the orchestrator's pool (default pool if not entered)"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    async def run_pipeline(
+        self,
+        case_number: str,
+        run_started_at: Optional[datetime] = None
+    ) -> PipelineReportData:
         """
         Execute full 13-stage pipeline for a single property
         
         Args:
             case_number: Foreclosure case number
+            run_started_at: Shared batch timestamp for report metadata
             
         Returns:
             PipelineReportData with all stages populated
         """
         report = PipelineReportData()
-        
+        await self._run_sources(report, case_number)
+        await self._run_analysis(report)
+        await self._run_scoring(report, run_started_at)
+        return report
+    
+    async def _run_sources(self, report: PipelineReportData, case_number: str):
+        """Stages 1-5: Fetch upstream source data"""
         # Stage 1: RealForeclose
         report.realforeclose = await self._stage_1_realforeclose(case_number)
         self.stages_completed.append("Stage 1: RealForeclose")
         
         # Stage 2: BCPAO
-        report.bcpao = await self._stage_2_bcpao(report.realforeclose)
+        report.bcpao = bcpao = await self._stage_2_bcpao(report.realforeclose)
         self.stages_completed.append("Stage 2: BCPAO")
         
         # Stage 3: AcclaimWeb
-        report.acclaimweb = await self._stage_3_acclaimweb(report.bcpao.parcel_id)
+        report.acclaimweb = await self._stage_3_acclaimweb(bcpao.parcel_id)
         self.stages_completed.append("Stage 3: AcclaimWeb")
         
         # Stage 4: BECA
@@ -111,8 +252,12 @@ class PipelineOrchestrator:
         self.stages_completed.append("Stage 4: BECA")
         
         # Stage 5: RealTDM
-        report.realtdm = await self._stage_5_realtdm(report.bcpao.parcel_id)
+        report.realtdm = await self._stage_5_realtdm(bcpao.parcel_id)
         self.stages_completed.append("Stage 5: RealTDM")
+    
+    async def _run_analysis(self, report: PipelineReportData):
+        """Stages 6-9 and 11: ML, valuation and market context"""
+        bcpao = report.bcpao
         
         # Stage 6: ML Prediction
         if self.config.enable_ml_prediction:
@@ -120,35 +265,42 @@ class PipelineOrchestrator:
             self.stages_completed.append("Stage 6: ML Prediction")
         
         # Stage 7: ARV Calculator
-        report.arv = await self._stage_7_arv(report.bcpao)
+        report.arv = arv = await self._stage_7_arv(bcpao)
         self.stages_completed.append("Stage 7: ARV Calculator")
         
         # Stage 8: Repair Estimator
-        report.repairs = await self._stage_8_repairs(report.bcpao, report.arv.arv)
+        report.repairs = await self._stage_8_repairs(bcpao, arv.arv)
         self.stages_completed.append("Stage 8: Repair Estimator")
         
         # Stage 9: Demographics
-        report.demographics = await self._stage_9_demographics(report.bcpao.zip_code)
+        report.demographics = await self._stage_9_demographics(bcpao.zip_code)
         self.stages_completed.append("Stage 9: Demographics")
         
         # Stage 11: Market Data (before Max Bid for context)
-        report.market = await self._stage_11_market(report.bcpao)
+        report.market = await self._stage_11_market(bcpao)
         self.stages_completed.append("Stage 11: Tool Search")
-        
+    
+    async def _run_scoring(
+        self,
+        report: PipelineReportData,
+        run_started_at: Optional[datetime] = None
+    ):
+        """Stages 13, 10 and 12: Title risk, max bid and report metadata"""
         # Stage 13: Title Risk Score (before Max Bid for cure costs)
         if self.config.enable_title_risk:
             report.title_risk = await self._stage_13_title_risk(report)
             self.stages_completed.append("Stage 13: Title Risk Score")
         
         # Stage 10: Max Bid Calculator (needs stages 7, 8, 13)
-        report.max_bid = self._stage_10_max_bid(report)
+        report.max_bid = await self._run_sync(self._stage_10_max_bid, report)
         self.stages_completed.append("Stage 10: Max Bid Calculator")
         
         # Stage 12: Report Metadata
-        report.metadata = ReportMetadata()
+        if run_started_at is not None:
+            report.metadata = ReportMetadata(generated_at=run_started_at)
+        else:
+            report.metadata = ReportMetadata()
         self.stages_completed.append("Stage 12: Report Generator")
-        
-        return report
     
     async def _stage_1_realforeclose(self, case_number: str) -> RealForecloseData:
         """Stage 1: Fetch auction data from RealForeclose"""
@@ -188,12 +340,32 @@ class PipelineOrchestrator:
     
     async def _stage_6_ml_prediction(self, report: PipelineReportData) -> MLPrediction:
         """Stage 6: Generate ML predictions"""
-        # In production, this calls the ML model
-        return MLPrediction(
-            third_party_probability=0.0,
-            predicted_winning_bid=0.0,
-            competition_level=CompetitionLevel.MODERATE
-        )
+        features = self._ml_features(report)
+        if self.ml_batcher.running:
+            return await self.ml_batcher.submit(features)
+        return self._predict_ml_batch(np.array([features], dtype=np.float64))[0]
+    
+    @staticmethod
+    def _ml_features(report: PipelineReportData) -> List[float]:
+        """Feature row for Stage 6 (one per case, stacked by MLBatcher)"""
+        return [
+            report.realforeclose.judgment_amount,
+            report.bcpao.tax_owed,
+            len(report.acclaimweb.liens),
+            len(report.realtdm.tax_certificates),
+        ]
+    
+    def _predict_ml_batch(self, features: np.ndarray) -> List[MLPrediction]:
+        """Run the ML model once over an (N, F) feature matrix"""
+        # In production, this calls the ML model on the whole matrix
+        return [
+            MLPrediction(
+                third_party_probability=0.0,
+                predicted_winning_bid=0.0,
+                competition_level=CompetitionLevel.MODERATE
+            )
+            for _ in range(len(features))
+        ]
     
     async def _stage_7_arv(self, bcpao: BCPAOData) -> ARVData:
         """Stage 7: Calculate ARV from comparables"""
@@ -235,18 +407,105 @@ class PipelineOrchestrator:
         """Stage 13: Calculate title risk score"""
         
         title_data = TitleRiskData()
+        bcpao = report.bcpao
+        realtdm = report.realtdm
+        acclaimweb = report.acclaimweb
+        
+        if self.config.detailed_title_issues:
+            blocking_issues = self._title_blocking_issues(bcpao, realtdm, acclaimweb)
+            issue_count = len(blocking_issues)
+        else:
+            # Summary mode: accumulate cure costs without building BlockingIssues
+            blocking_issues = []
+            certs = realtdm.tax_certificates
+            liens = acclaimweb.liens
+            total_cure = sum(cert.amount * 1.25 for cert in certs)
+            total_cure += sum(lien.amount for lien in liens)
+            issue_count = len(certs) + len(liens)
+            if bcpao.tax_owed > 0:
+                total_cure += bcpao.tax_owed
+                issue_count += 1
+            if acclaimweb.noc_active:
+                total_cure += 500
+                issue_count += 1
+        
+        # Municipal lien check
+        if self.config.enable_municipal_check:
+            municipal_check = await self._check_municipal_liens(bcpao, "vacant_maintained")
+            title_data.municipal_flag = municipal_check.get("municipality", "")
+            title_data.municipal_contingency = municipal_check.get("risk_contingency", 2500)
+        
+        title_data.blocking_issues = blocking_issues
+        if self.config.detailed_title_issues:
+            title_data.calculate_total_cure()
+        else:
+            title_data.total_cure_cost = total_cure
+        
+        # Calculate risk score
+        base_score = issue_count * 10
+        if realtdm.tax_deed_pending:
+            base_score += 30
+        if bcpao.tax_owed > 5000:
+            base_score += 10
+        
+        title_data.title_risk_score = min(base_score, 100)
+        
+        # Determine risk level
+        if title_data.title_risk_score <= 25:
+            title_data.risk_level = RiskLevel.LOW
+        elif title_data.title_risk_score <= 50:
+            title_data.risk_level = RiskLevel.MODERATE
+        elif title_data.title_risk_score <= 75:
+            title_data.risk_level = RiskLevel.HIGH
+        else:
+            title_data.risk_level = RiskLevel.CRITICAL
+        
+        return title_data
+    
+    async def _check_municipal_liens(self, bcpao: BCPAOData, property_condition: str) -> Dict:
+        """
+        Single-flight wrapper around check_municipal_liens
+        
+        Concurrent lookups with identical arguments (e.g. the same parcel
+        listed under more than one case) await one call. The key covers
+        every argument forwarded, so no case gets another parcel's result.
+        """
+        key = (bcpao.parcel_id, bcpao.property_address, bcpao.zip_code, property_condition)
+        task = self._municipal_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_sync(
+                partial(
+                    check_municipal_liens,
+                    parcel_id=bcpao.parcel_id,
+                    property_address=bcpao.property_address,
+                    zip_code=bcpao.zip_code,
+                    property_condition=property_condition
+                )
+            ))
+            self._municipal_inflight[key] = task
+            task.add_done_callback(lambda _: self._municipal_inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(task)
+    
+    @staticmethod
+    def _title_blocking_issues(
+        bcpao: BCPAOData,
+        realtdm: RealTDMData,
+        acclaimweb: AcclaimWebData
+    ) -> List[BlockingIssue]:
+        """Itemized Stage 13 blocking issues"""
         blocking_issues = []
         
         # Check tax delinquency (from Stage 2)
-        if report.bcpao.tax_owed > 0:
+        if bcpao.tax_owed > 0:
             blocking_issues.append(BlockingIssue(
-                issue=f"{report.bcpao.tax_status}",
-                cure_cost=report.bcpao.tax_owed,
+                issue=str(bcpao.tax_status),
+                cure_cost=bcpao.tax_owed,
                 data_source="BCPAO"
             ))
         
         # Check tax certificates (from Stage 5)
-        for cert in report.realtdm.tax_certificates:
+        for cert in realtdm.tax_certificates:
             blocking_issues.append(BlockingIssue(
                 issue=f"Tax Certificate #{cert.certificate_number}",
                 cure_cost=cert.amount * 1.25,  # Add 25% for interest
@@ -254,55 +513,22 @@ class PipelineOrchestrator:
             ))
         
         # Check recorded liens (from Stage 3)
-        for lien in report.acclaimweb.liens:
+        for lien in acclaimweb.liens:
             blocking_issues.append(BlockingIssue(
-                issue=f"{lien.lien_type}",
+                issue=str(lien.lien_type),
                 cure_cost=lien.amount,
                 data_source="AcclaimWeb"
             ))
         
         # Check NOC (from Stage 3)
-        if report.acclaimweb.noc_active:
+        if acclaimweb.noc_active:
             blocking_issues.append(BlockingIssue(
                 issue="Active Notice of Commencement",
                 cure_cost=500,
                 data_source="AcclaimWeb"
             ))
         
-        # Municipal lien check
-        if self.config.enable_municipal_check:
-            municipal_check = check_municipal_liens(
-                parcel_id=report.bcpao.parcel_id,
-                property_address=report.bcpao.property_address,
-                zip_code=report.bcpao.zip_code,
-                property_condition="vacant_maintained"
-            )
-            title_data.municipal_flag = municipal_check.get("municipality", "")
-            title_data.municipal_contingency = municipal_check.get("risk_contingency", 2500)
-        
-        title_data.blocking_issues = blocking_issues
-        title_data.calculate_total_cure()
-        
-        # Calculate risk score
-        base_score = len(blocking_issues) * 10
-        if report.realtdm.tax_deed_pending:
-            base_score += 30
-        if report.bcpao.tax_owed > 5000:
-            base_score += 10
-        
-        title_data.title_risk_score = min(base_score, 100)
-        
-        # Determine risk level
-        if title_data.title_risk_score <= 25:
-            title_data.risk_level = RiskLevel.LOW
-        elif title_data.title_risk_score <= 50:
-            title_data.risk_level = RiskLevel.MODERATE
-        elif title_data.title_risk_score <= 75:
-            title_data.risk_level = RiskLevel.HIGH
-        else:
-            title_data.risk_level = RiskLevel.CRITICAL
-        
-        return title_data
+        return blocking_issues
     
     def get_status(self) -> Dict:
         """Get pipeline execution status"""
@@ -314,27 +540,87 @@ class PipelineOrchestrator:
         }
 
 
-async def run_batch_pipeline(case_numbers: List[str]) -> List[PipelineReportData]:
+async def run_batch_pipeline(
+    case_numbers: List[str],
+    queue_size: int = 8,
+    workers_per_stage: int = 8,
+    config: PipelineConfig = None
+) -> List[PipelineReportData]:
     """
     Run pipeline for multiple properties
     
+    The batch flows through three stage groups (sources -> analysis ->
+    scoring) linked by bounded queues, so case N+1 can be fetching source
+    data while case N is in analysis. Full queues apply back-pressure to the
+    upstream group instead of letting in-flight reports pile up.
+    
     Args:
         case_numbers: List of foreclosure case numbers
+        queue_size: Max reports waiting between stage groups
+        workers_per_stage: Concurrent workers per stage group
+        config: Pipeline configuration (e.g. detailed_title_issues=False
+            for summary-only batches)
         
     Returns:
-        List of PipelineReportData for each property
+        List of PipelineReportData for each property (input order)
     """
-    orchestrator = PipelineOrchestrator()
-    results = []
+    count = len(case_numbers)
+    reports: List[Optional[PipelineReportData]] = [None] * count
+    run_started_at = datetime.now()  # One timestamp for every report in the batch
     
-    for case_num in case_numbers:
+    async with PipelineOrchestrator(config) as orchestrator:
+        phases = [
+            lambda index, report: orchestrator._run_sources(report, case_numbers[index]),
+            lambda index, report: orchestrator._run_analysis(report),
+            lambda index, report: orchestrator._run_scoring(report, run_started_at),
+        ]
+        queues = [asyncio.Queue(maxsize=queue_size) for _ in phases]
+        done: asyncio.Queue = asyncio.Queue()
+        outboxes = queues[1:] + [done]
+        
+        async def feed():
+            for index in range(count):
+                await queues[0].put((index, PipelineReportData()))
+        
+        async def worker(phase, inbox: asyncio.Queue, outbox: asyncio.Queue):
+            while True:
+                index, report = await inbox.get()
+                try:
+                    await phase(index, report)
+                except Exception as e:
+                    print(f"Error processing {case_numbers[index]}: {e}")
+                    await done.put((index, None))
+                else:
+                    await outbox.put((index, report))
+        
+        tasks = [asyncio.create_task(feed())]
+        for phase, inbox, outbox in zip(phases, queues, outboxes):
+            tasks.extend(
+                asyncio.create_task(worker(phase, inbox, outbox))
+                for _ in range(workers_per_stage)
+            )
+        
         try:
-            report = await orchestrator.run_pipeline(case_num)
-            results.append(report)
-        except Exception as e:
-            print(f"Error processing {case_num}: {e}")
+            for _ in range(count):
+                index, report = await done.get()
+                reports[index] = report
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
-    return results
+    return [report for report in reports if report is not None]
+
+
+def run_batch_pipeline_sync(case_numbers: List[str]) -> List[PipelineReportData]:
+    """
+    Entry point for running a batch outside an event loop
+    
+    Uses uvloop when installed (Linux/macOS); otherwise the default loop.
+    """
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(run_batch_pipeline(case_numbers))
 
 
 def generate_summary(reports: List[PipelineReportData]) -> Dict:
@@ -347,15 +633,35 @@ def generate_summary(reports: List[PipelineReportData]) -> Dict:
     Returns:
         Summary dictionary
     """
-    bid_count = sum(1 for r in reports if r.max_bid.recommendation == Recommendation.BID)
-    review_count = sum(1 for r in reports if r.max_bid.recommendation == Recommendation.REVIEW)
-    skip_count = sum(1 for r in reports if r.max_bid.recommendation == Recommendation.SKIP)
+    bid_count = review_count = skip_count = 0
+    total_judgment = total_max_bid = total_ratio = 0.0
+    total_risk_score = total_cure = 0.0
+    
+    # Single pass - this runs over every report in the auction
+    for r in reports:
+        mb = r.max_bid
+        tr = r.title_risk
+        rec = mb.recommendation
+        
+        if rec == Recommendation.BID:
+            bid_count += 1
+        elif rec == Recommendation.REVIEW:
+            review_count += 1
+        elif rec == Recommendation.SKIP:
+            skip_count += 1
+        
+        if rec != Recommendation.SKIP:
+            total_max_bid += mb.adjusted_max_bid
+        
+        total_judgment += r.realforeclose.judgment_amount
+        total_ratio += mb.bid_judgment_ratio
+        total_risk_score += tr.title_risk_score
+        total_cure += tr.total_cure_cost
     
-    total_judgment = sum(r.realforeclose.judgment_amount for r in reports)
-    total_max_bid = sum(r.max_bid.adjusted_max_bid for r in reports if r.max_bid.recommendation != Recommendation.SKIP)
+    count = len(reports)
     
     return {
-        "total_properties": len(reports),
+        "total_properties": count,
         "recommendations": {
             "BID": bid_count,
             "REVIEW": review_count,
@@ -363,10 +669,10 @@ def generate_summary(reports: List[PipelineReportData]) -> Dict:
         },
         "total_judgment_value": total_judgment,
         "total_max_bid_value": total_max_bid,
-        "average_bid_judgment_ratio": sum(r.max_bid.bid_judgment_ratio for r in reports) / len(reports) if reports else 0,
+        "average_bid_judgment_ratio": total_ratio / count if count else 0,
         "title_risk_summary": {
-            "average_score": sum(r.title_risk.title_risk_score for r in reports) / len(reports) if reports else 0,
-            "total_cure_costs": sum(r.title_risk.total_cure_cost for r in reports)
+            "average_score": total_risk_score / count if count else 0,
+            "total_cure_costs": total_cure
         }
     }
 
@@ -375,6 +681,8 @@ def generate_summary(reports: List[PipelineReportData]) -> Dict:
 __all__ = [
     "PipelineOrchestrator",
     "PipelineConfig",
+    "MLBatcher",
     "run_batch_pipeline",
+    "run_batch_pipeline_sync",
     "generate_summary"
 ]
@@ -23,14 +23,41 @@ Version: 14.4.2
 """
 
 import os
+import re
 import json
+import sys
 import httpx
 import asyncio
-from datetime import datetime, date
+import numpy as np
+import time
+import logging
+import logging.handlers
+from collections import OrderedDict
+from datetime import datetime, date, timezone
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+# orjson parses/serializes in native code; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba fuses the Stage 7 bid formula into one native loop for large batches
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from supabase import create_client
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    SUPABASE_AVAILABLE = False
+
 # Lien Discovery Agent V14.4.2
 from src.agents.lien_discovery_agent import (
     LienDiscoveryAgent,
@@ -42,6 +69,24 @@ from src.agents.lien_discovery_agent import (
     LienSearchResult
 )
 
+logger = logging.getLogger("UnifiedPipeline")
+
+
+def configure_logging(quiet: bool = False) -> logging.handlers.MemoryHandler:
+    """Buffer pipeline log lines and write them to stdout in batches.
+    
+    Stage output is flushed every 1024 records (or on ERROR) instead of
+    one locked stdout write per line. ``quiet`` keeps warnings and errors only.
+    """
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=stream)
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+    return handler
+
+
 # Configuration
 SUPABASE_URL = os.environ.get('SUPABASE_URL', 'https://mocerqjnksmhcjzxrewo.supabase.co')
 SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
@@ -49,9 +94,30 @@ SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
 # Fara V8 Endpoints
 FARA_V8_BASE = "https://brevardbidderai--brevardbidderai-fara-v8"
 FARA_ANALYZE = f"{FARA_V8_BASE}-analyze.modal.run"
+FARA_ANALYZE_BATCH = f"{FARA_V8_BASE}-analyze-batch.modal.run"
 FARA_HEALTH = f"{FARA_V8_BASE}-health.modal.run"
 
 
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode()
+
+
+def _shallow_fields(obj) -> Dict[str, Any]:
+    """Top-level dataclass fields as a dict, without asdict()'s recursive deep copy."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _lien_result_to_dict(result: LienSearchResult) -> Dict[str, Any]:
+    """Project a LienSearchResult (and its liens) into plain dicts."""
+    data = _shallow_fields(result)
+    data["liens"] = [_shallow_fields(lien) for lien in result.liens]
+    return data
+
+
 class PipelineStage(Enum):
     """Pipeline stage enumeration."""
     CALENDAR_SYNC = 1
@@ -75,7 +141,88 @@ class Recommendation(Enum):
     SKIP = "SKIP"
 
 
-@dataclass
+# Integer codes used by the vectorized Stage 7 bucketing
+REC_BID, REC_REVIEW, REC_SKIP = 0, 1, 2
+RECOMMENDATION_BY_CODE = (Recommendation.BID.value, Recommendation.REVIEW.value, Recommendation.SKIP.value)
+
+# Plaintiff aggressiveness scoring (Stage 6) - one alternation scans the name once
+AGGRESSIVE_PLAINTIFFS = ["WILMINGTON SAVINGS", "US BANK", "WELLS FARGO",
+                         "PENNYMAC", "NATIONSTAR", "MR COOPER", "SHELLPOINT"]
+AGGRESSIVE_PLAINTIFF_RE = re.compile("|".join(re.escape(p) for p in AGGRESSIVE_PLAINTIFFS))
+
+
+def _bid_arrays(
+    mv: np.ndarray,
+    jv: np.ndarray,
+    surviving: np.ndarray,
+    do_not_bid: np.ndarray,
+    hoa_high: np.ndarray
+):
+    """Stage 7 bid formula over whole arrays (returns max_bid, ratio, rec codes)."""
+    n = mv.shape[0]
+    
+    # ========================================
+    # Standard Max Bid Formula
+    # ========================================
+    arv = np.where(mv != 0, mv, jv)
+    repair_estimate = 10000  # Default
+    wholesale_discount = np.minimum(25000, arv * 0.15)
+    
+    # MaxBid = (ARV × 70%) - Repairs - $10K - MIN($25K, 15% × ARV)
+    base_max_bid = np.maximum(0, (arv * 0.70) - repair_estimate - 10000 - wholesale_discount)
+    
+    # Lien-Adjusted Max Bid: subtract surviving liens (senior mortgages, etc.)
+    max_bid = np.maximum(0, base_max_bid - surviving)
+    max_bid[do_not_bid] = 0
+    
+    # ========================================
+    # Calculate Ratio and Recommendation
+    # ========================================
+    ratio = np.divide(max_bid, jv, out=np.zeros(n), where=jv > 0)
+    rec = np.select(
+        [do_not_bid, jv <= 0, hoa_high, ratio >= 0.75, ratio >= 0.60],
+        [REC_SKIP, REC_REVIEW, REC_REVIEW, REC_BID, REC_REVIEW],
+        default=REC_SKIP
+    )
+    return max_bid, ratio, rec
+
+
+# Below this many properties the NumPy path beats the kernel's call overhead
+BID_KERNEL_MIN_N = 256
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _bid_kernel(mv, jv, surviving, do_not_bid, hoa_high, out_bid, out_ratio, out_rec):
+        """Same formula as _bid_arrays, fused into one loop with no temporaries."""
+        for i in range(mv.shape[0]):
+            if do_not_bid[i]:
+                out_bid[i] = 0.0
+                out_ratio[i] = 0.0
+                out_rec[i] = REC_SKIP
+                continue
+            
+            arv = mv[i] if mv[i] != 0 else jv[i]
+            base = max(0.0, arv * 0.70 - 10000.0 - 10000.0 - min(25000.0, arv * 0.15))
+            max_bid = max(0.0, base - surviving[i])
+            out_bid[i] = max_bid
+            
+            if jv[i] > 0:
+                ratio = max_bid / jv[i]
+                out_ratio[i] = ratio
+                if hoa_high[i]:
+                    out_rec[i] = REC_REVIEW
+                elif ratio >= 0.75:
+                    out_rec[i] = REC_BID
+                elif ratio >= 0.60:
+                    out_rec[i] = REC_REVIEW
+                else:
+                    out_rec[i] = REC_SKIP
+            else:
+                out_ratio[i] = 0.0
+                out_rec[i] = REC_REVIEW
+
+
+@dataclass(slots=True)
 class PipelineProperty:
     """Property flowing through pipeline."""
     # Core identifiers
@@ -133,14 +280,33 @@ class PipelineProperty:
     errors: Optional[List[str]] = None
     processed_at: Optional[str] = None
     
+    # Stage 8 request strings, built once after Stage 7 (see prepare_ai_payload)
+    _full_address: str = field(default="", repr=False)
+    _ai_context: str = field(default="", repr=False)
+    
     def __post_init__(self):
         if self.stages_completed is None:
             self.stages_completed = []
         if self.errors is None:
             self.errors = []
+    
+    def prepare_ai_payload(self):
+        """Build the Fara V8 address/context strings once so retries reuse them."""
+        context_parts = []
+        if self.market_value:
+            context_parts.append(f"Market Value: ${self.market_value:,.0f}")
+        if self.plaintiff:
+            context_parts.append(f"Plaintiff: {self.plaintiff}")
+        if self.xgboost_third_party_prob:
+            context_parts.append(f"Third-Party Prob: {self.xgboost_third_party_prob:.1%}")
+        if self.recommendation:
+            context_parts.append(f"Pipeline: {self.recommendation}")
+        
+        self._full_address = f"{self.address}, {self.city} FL {self.zip_code}"
+        self._ai_context = " | ".join(context_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result from pipeline run."""
     success: bool
@@ -162,11 +328,31 @@ class UnifiedPipeline:
     """
     
     VERSION = "14.4.0"
+    AI_CONCURRENCY = 8  # Max in-flight Fara V8 requests
+    AI_BATCH_SIZE = 8  # Properties per Fara V8 batch request
+    LIEN_CONCURRENCY = 5  # Max concurrent Stage 4 lien searches
+    INSIGHTS_BATCH_SIZE = 500  # Rows per bulk insert into insights
+    LOG_WORKERS = 2  # Concurrent insights writers when streaming Stages 9-12
+    FARA_HEALTH_TTL = 60  # Seconds a healthy Fara V8 probe stays valid
+    LIEN_CACHE_SIZE = 1024  # Cached lien searches kept across runs
+    STAGE_9_12_RESERVE_S = 60.0  # Budget held back from Stage 8 for logging (max)
     
-    def __init__(self):
+    def __init__(self, pipeline_budget_s: float = 600.0):
         self.supabase_url = SUPABASE_URL
         self.supabase_key = SUPABASE_KEY
+        self.pipeline_budget_s = pipeline_budget_s
+        self._deadline: Optional[float] = None  # perf_counter() deadline of the current run
         self.fara_healthy = None
+        self._fara_health_checked_at = 0.0
+        self._fara_batch_supported: Optional[bool] = None  # None = not probed yet
+        self._client: Optional[httpx.AsyncClient] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._supabase = None
+        # Per-run in-flight lookups, plus (parcel_id, day) -> result across runs
+        self._parcel_cache: Dict[str, asyncio.Task] = {}
+        self._lien_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        # Stage 1 conditional-request cache: auction_date -> (etag, last_modified, rows)
+        self._stage1_cache: Dict[Optional[str], tuple] = {}
         self.stats = {
             "bid": 0,
             "review": 0,
@@ -174,13 +360,60 @@ class UnifiedPipeline:
             "ai_analyzed": 0,
             "errors": 0
         }
+        self._start_prewarm()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP/2 client for Supabase and Fara (one handshake per host)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(30.0)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _remaining_budget(self, reserve: float = 0.0) -> float:
+        """Seconds left before the run deadline, less reserve (never negative)."""
+        now = time.perf_counter()
+        deadline = self._deadline if self._deadline is not None else now + self.pipeline_budget_s
+        return max(0.0, deadline - now - reserve)
+    
+    def _start_prewarm(self):
+        """Open the Supabase connection in the background (only inside a running loop)."""
+        if self._prewarm_task is not None:
+            return
+        try:
+            self._prewarm_task = asyncio.get_running_loop().create_task(self._prewarm())
+        except RuntimeError:
+            pass  # No event loop yet; run() starts it
+    
+    async def _prewarm(self):
+        """Pay TCP+TLS+ALPN once so Stage 1 and Stage 9-12 reuse the HTTP/2 connection."""
+        try:
+            await self.client.get(
+                f"{self.supabase_url}/rest/v1/",
+                headers={"apikey": self.supabase_key},
+                timeout=10.0
+            )
+        except Exception:
+            pass  # Best effort; the first real request will connect instead
     
     # ========================================
     # Stage 1: Calendar Sync
     # ========================================
     async def stage_1_calendar_sync(self, auction_date: Optional[str] = None) -> List[PipelineProperty]:
         """Fetch auctions from Supabase (simulating RealForeclose sync)."""
-        print(f"[Stage 1] Calendar Sync...")
+        logger.info(f"[Stage 1] Calendar Sync...")
         
         headers = {
             "apikey": self.supabase_key,
@@ -194,9 +427,24 @@ class UnifiedPipeline:
         if auction_date:
             params["auction_date"] = f"eq.{auction_date}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            data = response.json()
+        # Revalidate the last response instead of re-downloading unchanged rows
+        cached = self._stage1_cache.get(auction_date)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = await self.client.get(url, headers=headers, params=params, timeout=30.0)
+        if response.status_code == 304 and cached:
+            data = cached[2]
+        else:
+            data = _json_loads(response.content)
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            if etag or last_modified:
+                self._stage1_cache[auction_date] = (etag, last_modified, data)
         
         properties = []
         for row in data:
@@ -217,7 +465,7 @@ class UnifiedPipeline:
             prop.stages_completed.append(1)
             properties.append(prop)
         
-        print(f"   Found {len(properties)} properties")
+        logger.info(f"   Found {len(properties)} properties")
         return properties
     
     # ========================================
@@ -231,12 +479,33 @@ class UnifiedPipeline:
         Stage 3: BCPAO Property Enrichment (from Supabase)
         Stage 4: Lien Discovery - HOA detection, mechanical liens, senior lien analysis
         """
-        print(f"[Stage 2-4] Data Enrichment + Lien Discovery V14.4.2...")
+        logger.info(f"[Stage 2-4] Data Enrichment + Lien Discovery V14.4.2...")
         
         # Initialize Lien Discovery Agent
         lien_agent = LienDiscoveryAgent(supabase_client=self._get_supabase_client())
         
-        for prop in properties:
+        sem = asyncio.Semaphore(self.LIEN_CONCURRENCY)
+        await asyncio.gather(*(self._enrich_one(prop, lien_agent, sem) for prop in properties))
+        
+        # Summary
+        hoa_count = high_risk = 0
+        for p in properties:
+            hoa_count += p.is_hoa_foreclosure
+            high_risk += p.lien_risk_level in ("HIGH", "DO_NOT_BID")
+        logger.info(f"   ✅ Enriched {len(properties)} properties")
+        logger.info(f"   ⚠️  HOA Foreclosures: {hoa_count}")
+        logger.info(f"   🔴 High Risk: {high_risk}")
+        
+        return properties
+    
+    async def _enrich_one(
+        self,
+        prop: PipelineProperty,
+        lien_agent: LienDiscoveryAgent,
+        sem: asyncio.Semaphore
+    ):
+        """Stages 2-4 for one property (bounded by sem for AcclaimWeb/Browserless limits)."""
+        async with sem:
             # Stage 2-3: Data already in Supabase
             prop.stages_completed.extend([2, 3])
             
@@ -250,7 +519,7 @@ class UnifiedPipeline:
                 prop.hoa_detection_reason = reason
                 
                 if is_hoa:
-                    print(f"   ⚠️  HOA FORECLOSURE: {prop.case_number} - {reason}")
+                    logger.info(f"   ⚠️  HOA FORECLOSURE: {prop.case_number} - {reason}")
                     prop.lien_risk_level = "HIGH"
                     
                     # Get full case analysis
@@ -271,15 +540,15 @@ class UnifiedPipeline:
                         prop.senior_mortgage_amount = prop.market_value * 0.8
                         prop.total_surviving_liens = prop.senior_mortgage_amount
                         prop.lien_risk_level = "DO_NOT_BID"
-                        print(f"      Est. senior mortgage: ${prop.senior_mortgage_amount:,.0f}")
+                        logger.info(f"      Est. senior mortgage: ${prop.senior_mortgage_amount:,.0f}")
                 
                 # 4b. Search for actual liens (if we have parcel ID)
                 if prop.bcpao_account:
                     # Check cache first
-                    cached = await lien_agent.get_previous_lien_search(prop.bcpao_account)
+                    cached = await self._cached_lien_lookup(lien_agent, prop.bcpao_account)
                     if cached:
                         prop.lien_search_result = cached
-                        print(f"   ♻️  Using cached lien search for {prop.bcpao_account}")
+                        logger.info(f"   ♻️  Using cached lien search for {prop.bcpao_account}")
                     else:
                         # Full lien search
                         lien_result = await lien_agent.search_property(
@@ -287,7 +556,7 @@ class UnifiedPipeline:
                             owner_name=prop.defendant,
                             address=prop.address
                         )
-                        prop.lien_search_result = asdict(lien_result)
+                        prop.lien_search_result = _lien_result_to_dict(lien_result)
                         prop.liens_found = len(lien_result.liens)
                         prop.total_surviving_liens = lien_result.total_amount_surviving_foreclosure
                         
@@ -299,57 +568,76 @@ class UnifiedPipeline:
             except Exception as e:
                 prop.errors.append(f"Stage 4 lien discovery error: {str(e)}")
                 prop.stages_completed.append(4)  # Mark complete even with errors
-                print(f"   ❌ Lien discovery error for {prop.case_number}: {e}")
+                logger.error(f"   ❌ Lien discovery error for {prop.case_number}: {e}")
+    
+    async def _cached_lien_lookup(self, lien_agent: LienDiscoveryAgent, parcel_id: str) -> Optional[Dict]:
+        """
+        Coalesced get_previous_lien_search().
         
-        # Summary
-        hoa_count = sum(1 for p in properties if p.is_hoa_foreclosure)
-        high_risk = sum(1 for p in properties if p.lien_risk_level in ["HIGH", "DO_NOT_BID"])
-        print(f"   ✅ Enriched {len(properties)} properties")
-        print(f"   ⚠️  HOA Foreclosures: {hoa_count}")
-        print(f"   🔴 High Risk: {high_risk}")
+        Multi-parcel cases share a bcpao_account, so concurrent lookups for the
+        same parcel await one Supabase round trip. Hits are also kept in a
+        small LRU keyed by day so back-to-back runs skip the query.
+        """
+        lru_key = (parcel_id, date.today().isoformat())
+        if lru_key in self._lien_cache:
+            self._lien_cache.move_to_end(lru_key)
+            return self._lien_cache[lru_key]
         
-        return properties
+        task = self._parcel_cache.get(parcel_id)
+        if task is None:
+            task = asyncio.create_task(lien_agent.get_previous_lien_search(parcel_id))
+            self._parcel_cache[parcel_id] = task
+        result = await task
+        
+        if result:
+            self._lien_cache[lru_key] = result
+            if len(self._lien_cache) > self.LIEN_CACHE_SIZE:
+                self._lien_cache.popitem(last=False)
+        return result
     
     def _get_supabase_client(self):
-        """Get Supabase client for lien agent."""
-        if not self.supabase_key:
+        """Get Supabase client for lien agent (built once per pipeline)."""
+        if self._supabase is not None:
+            return self._supabase
+        if not self.supabase_key or not SUPABASE_AVAILABLE:
             return None
         try:
-            from supabase import create_client
-            return create_client(self.supabase_url, self.supabase_key)
+            self._supabase = create_client(self.supabase_url, self.supabase_key)
         except Exception:
             return None
+        return self._supabase
     
     # ========================================
     # Stage 5: XGBoost Prediction
     # ========================================
     async def stage_5_xgboost(self, properties: List[PipelineProperty]) -> List[PipelineProperty]:
         """Apply XGBoost third-party probability prediction."""
-        print(f"[Stage 5] XGBoost Prediction...")
+        logger.info(f"[Stage 5] XGBoost Prediction...")
         
         # Base rate from historical data
         BASE_THIRD_PARTY_RATE = 0.31
         
-        for prop in properties:
-            # Simplified prediction based on bid/judgment ratio
-            if prop.market_value > 0 and prop.judgment_amount > 0:
-                equity_ratio = prop.market_value / prop.judgment_amount
-                
-                # Higher equity = higher third-party interest
-                if equity_ratio > 1.5:
-                    prob = BASE_THIRD_PARTY_RATE * 1.5
-                elif equity_ratio > 1.2:
-                    prob = BASE_THIRD_PARTY_RATE * 1.2
-                else:
-                    prob = BASE_THIRD_PARTY_RATE
-                
-                prop.xgboost_third_party_prob = min(0.95, prob)
-            else:
-                prop.xgboost_third_party_prob = BASE_THIRD_PARTY_RATE
-            
+        n = len(properties)
+        mv = np.fromiter((p.market_value for p in properties), dtype=np.float64, count=n)
+        jv = np.fromiter((p.judgment_amount for p in properties), dtype=np.float64, count=n)
+        
+        # Simplified prediction based on equity ratio
+        has_values = (mv > 0) & (jv > 0)
+        equity_ratio = np.divide(mv, jv, out=np.zeros(n), where=has_values)
+        
+        # Higher equity = higher third-party interest
+        prob = np.where(
+            equity_ratio > 1.5, BASE_THIRD_PARTY_RATE * 1.5,
+            np.where(equity_ratio > 1.2, BASE_THIRD_PARTY_RATE * 1.2, BASE_THIRD_PARTY_RATE)
+        )
+        np.minimum(prob, 0.95, out=prob)
+        prob[~has_values] = BASE_THIRD_PARTY_RATE
+        
+        for prop, p in zip(properties, prob.tolist()):
+            prop.xgboost_third_party_prob = p
             prop.stages_completed.append(5)
         
-        print(f"   Predictions applied")
+        logger.info(f"   Predictions applied")
         return properties
     
     # ========================================
@@ -361,11 +649,7 @@ class UnifiedPipeline:
         
         V14.4.2: Uses HOA detection from Stage 4 Lien Discovery.
         """
-        print(f"[Stage 6] Plaintiff Analysis (V14.4.2)...")
-        
-        # Plaintiff aggressiveness scoring
-        AGGRESSIVE_PLAINTIFFS = ["WILMINGTON SAVINGS", "US BANK", "WELLS FARGO", 
-                                  "PENNYMAC", "NATIONSTAR", "MR COOPER", "SHELLPOINT"]
+        logger.info(f"[Stage 6] Plaintiff Analysis (V14.4.2)...")
         
         for prop in properties:
             plaintiff_upper = prop.plaintiff.upper()
@@ -374,14 +658,14 @@ class UnifiedPipeline:
             if prop.is_hoa_foreclosure:
                 prop.plaintiff_behavior_score = 0.2  # HOAs rarely bid aggressively
                 # But the RISK is high due to surviving liens
-            elif any(p in plaintiff_upper for p in AGGRESSIVE_PLAINTIFFS):
+            elif AGGRESSIVE_PLAINTIFF_RE.search(plaintiff_upper) is not None:
                 prop.plaintiff_behavior_score = 0.8  # Likely to bid high
             else:
                 prop.plaintiff_behavior_score = 0.5  # Neutral
             
             prop.stages_completed.append(6)
         
-        print(f"   ✅ Plaintiff scores applied")
+        logger.info(f"   ✅ Plaintiff scores applied")
         return properties
     
     # ========================================
@@ -393,173 +677,316 @@ class UnifiedPipeline:
         
         V14.4.2: Accounts for surviving liens from HOA foreclosures.
         """
-        print(f"[Stage 7] Bid Calculation (Lien-Adjusted)...")
+        logger.info(f"[Stage 7] Bid Calculation (Lien-Adjusted)...")
         
-        for prop in properties:
-            # ========================================
-            # Check for DO_NOT_BID from Lien Discovery
-            # ========================================
-            if prop.lien_risk_level == "DO_NOT_BID":
-                prop.max_bid = 0
-                prop.recommendation = Recommendation.SKIP.value
-                prop.bid_judgment_ratio = 0
-                self.stats["skip"] += 1
-                print(f"   ❌ {prop.case_number}: SKIP (HOA + Senior Mortgage)")
-                prop.stages_completed.append(7)
-                continue
-            
-            # ========================================
-            # Standard Max Bid Formula
-            # ========================================
-            arv = prop.market_value or prop.judgment_amount
-            repair_estimate = 10000  # Default
-            wholesale_discount = min(25000, arv * 0.15)
-            
-            # MaxBid = (ARV × 70%) - Repairs - $10K - MIN($25K, 15% × ARV)
-            base_max_bid = max(0, (arv * 0.70) - repair_estimate - 10000 - wholesale_discount)
-            
-            # ========================================
-            # Lien-Adjusted Max Bid
-            # ========================================
-            if prop.total_surviving_liens > 0:
-                # Subtract surviving liens (senior mortgages, etc.)
-                prop.max_bid = max(0, base_max_bid - prop.total_surviving_liens)
-                print(f"   ⚠️  {prop.case_number}: Lien adjustment -${prop.total_surviving_liens:,.0f}")
-            else:
-                prop.max_bid = base_max_bid
+        n = len(properties)
+        mv = np.fromiter((p.market_value for p in properties), dtype=np.float64, count=n)
+        jv = np.fromiter((p.judgment_amount for p in properties), dtype=np.float64, count=n)
+        surviving = np.fromiter((p.total_surviving_liens for p in properties), dtype=np.float64, count=n)
+        # DO_NOT_BID from Lien Discovery, and HOA foreclosures with HIGH risk
+        do_not_bid = np.fromiter((p.lien_risk_level == "DO_NOT_BID" for p in properties), dtype=bool, count=n)
+        hoa_high = np.fromiter(
+            (p.is_hoa_foreclosure and p.lien_risk_level == "HIGH" for p in properties),
+            dtype=bool, count=n
+        )
+        
+        if NUMBA_AVAILABLE and n >= BID_KERNEL_MIN_N:
+            max_bid = np.empty(n)
+            ratio = np.empty(n)
+            rec = np.empty(n, dtype=np.int8)
+            _bid_kernel(mv, jv, surviving, do_not_bid, hoa_high, max_bid, ratio, rec)
+        else:
+            max_bid, ratio, rec = _bid_arrays(mv, jv, surviving, do_not_bid, hoa_high)
+        
+        for i, prop in enumerate(properties):
+            recommendation = RECOMMENDATION_BY_CODE[rec[i]]
+            prop.max_bid = float(max_bid[i])
+            prop.recommendation = recommendation
+            self.stats[recommendation.lower()] += 1
             
-            # ========================================
-            # Calculate Ratio and Recommendation
-            # ========================================
-            if prop.judgment_amount > 0:
-                prop.bid_judgment_ratio = prop.max_bid / prop.judgment_amount
-                
-                # HOA foreclosures with HIGH risk → force REVIEW even if ratio is good
-                if prop.is_hoa_foreclosure and prop.lien_risk_level == "HIGH":
-                    prop.recommendation = Recommendation.REVIEW.value
-                    self.stats["review"] += 1
-                    print(f"   ⚠️  {prop.case_number}: REVIEW (HOA High Risk)")
-                elif prop.bid_judgment_ratio >= 0.75:
-                    prop.recommendation = Recommendation.BID.value
-                    self.stats["bid"] += 1
-                elif prop.bid_judgment_ratio >= 0.60:
-                    prop.recommendation = Recommendation.REVIEW.value
-                    self.stats["review"] += 1
-                else:
-                    prop.recommendation = Recommendation.SKIP.value
-                    self.stats["skip"] += 1
+            if do_not_bid[i]:
+                prop.bid_judgment_ratio = 0
+                logger.info(f"   ❌ {prop.case_number}: SKIP (HOA + Senior Mortgage)")
             else:
-                prop.recommendation = Recommendation.REVIEW.value
-                self.stats["review"] += 1
+                if surviving[i] > 0:
+                    logger.info(f"   ⚠️  {prop.case_number}: Lien adjustment -${prop.total_surviving_liens:,.0f}")
+                if jv[i] > 0:
+                    prop.bid_judgment_ratio = float(ratio[i])
+                    if hoa_high[i]:
+                        logger.info(f"   ⚠️  {prop.case_number}: REVIEW (HOA High Risk)")
             
+            prop.prepare_ai_payload()
             prop.stages_completed.append(7)
         
-        print(f"   ✅ Bids calculated (lien-adjusted)")
+        logger.info(f"   ✅ Bids calculated (lien-adjusted)")
         return properties
     
     # ========================================
     # Stage 8: Fara V8 AI Risk Assessment ⭐
     # ========================================
-    async def stage_8_ai_assessment(self, properties: List[PipelineProperty]) -> List[PipelineProperty]:
-        """Get AI risk assessment from Fara V8."""
-        print(f"[Stage 8] Fara V8 AI Assessment...")
+    async def stage_8_ai_assessment(
+        self,
+        properties: List[PipelineProperty],
+        completed: Optional[asyncio.Queue] = None
+    ) -> List[PipelineProperty]:
+        """
+        Get AI risk assessment from Fara V8.
         
-        # Check health first
-        async with httpx.AsyncClient() as client:
+        If completed is given, each property is put on it once its Stage 8
+        result is recorded.
+        """
+        logger.info(f"[Stage 8] Fara V8 AI Assessment...")
+        
+        # Check health first (reuse a recent healthy probe)
+        health_age = time.monotonic() - self._fara_health_checked_at
+        if not (self.fara_healthy and health_age < self.FARA_HEALTH_TTL):
             try:
-                health = await client.get(FARA_HEALTH, timeout=30.0)
-                self.fara_healthy = health.json().get("status") == "healthy"
+                health = await self.client.get(FARA_HEALTH, timeout=30.0)
+                self.fara_healthy = _json_loads(health.content).get("status") == "healthy"
             except:
                 self.fara_healthy = False
+            self._fara_health_checked_at = time.monotonic()
         
         if not self.fara_healthy:
-            print("   ⚠️ Fara V8 not available, skipping AI analysis")
+            logger.warning("   ⚠️ Fara V8 not available, skipping AI analysis")
             for prop in properties:
                 prop.stages_completed.append(8)
+                if completed is not None:
+                    await completed.put(prop)
             return properties
         
-        print(f"   ✅ Fara V8 healthy, analyzing {len(properties)} properties...")
-        
-        async with httpx.AsyncClient() as client:
-            for i, prop in enumerate(properties):
-                # Build context
-                context_parts = []
-                if prop.market_value:
-                    context_parts.append(f"Market Value: ${prop.market_value:,.0f}")
-                if prop.plaintiff:
-                    context_parts.append(f"Plaintiff: {prop.plaintiff}")
-                if prop.xgboost_third_party_prob:
-                    context_parts.append(f"Third-Party Prob: {prop.xgboost_third_party_prob:.1%}")
-                if prop.recommendation:
-                    context_parts.append(f"Pipeline: {prop.recommendation}")
-                
-                full_address = f"{prop.address}, {prop.city} FL {prop.zip_code}"
-                
-                try:
-                    response = await client.post(
-                        FARA_ANALYZE,
-                        json={
-                            "property_address": full_address,
-                            "case_number": prop.case_number,
-                            "judgment_amount": prop.judgment_amount,
-                            "context": " | ".join(context_parts)
-                        },
-                        timeout=180.0
+        logger.info(f"   ✅ Fara V8 healthy, analyzing {len(properties)} properties...")
+        
+        sem = asyncio.Semaphore(self.AI_CONCURRENCY)
+        size = self.AI_BATCH_SIZE
+        budget = self._remaining_budget(reserve=min(self.STAGE_9_12_RESERVE_S, self.pipeline_budget_s / 10))
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(self._analyze_batch(sem, start, properties[start:start + size], completed)
+                      for start in range(0, len(properties), size)),
+                    return_exceptions=True
+                ),
+                timeout=budget
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"   ⚠️ Stage 8 exceeded {budget:.0f}s budget, marking remaining as skipped")
+            for prop in properties:
+                if 8 not in prop.stages_completed:
+                    prop.errors.append("Fara skipped: Stage 8 budget exceeded")
+                    prop.stages_completed.append(8)
+                    if completed is not None:
+                        await completed.put(prop)
+        
+        logger.info(f"   AI analysis complete: {self.stats['ai_analyzed']} analyzed")
+        return properties
+    
+    async def _analyze_batch(
+        self,
+        sem: asyncio.Semaphore,
+        start: int,
+        chunk: List[PipelineProperty],
+        completed: Optional[asyncio.Queue] = None
+    ):
+        """
+        Analyze a chunk of properties with one Fara V8 batch request.
+        
+        Falls back to per-property requests if the batch endpoint is missing
+        (404 disables it for the rest of the pipeline's life) or fails.
+        """
+        if self._fara_batch_supported is not False:
+            results = None
+            try:
+                async with sem:
+                    response = await self.client.post(
+                        FARA_ANALYZE_BATCH,
+                        content=_json_dumps({"batch": [self._ai_payload(prop) for prop in chunk]}),
+                        headers={"Content-Type": "application/json"},
+                        timeout=300.0
                     )
-                    result = response.json()
-                    
-                    if "error" not in result:
-                        prop.ai_analysis = result.get("analysis", "")
-                        
-                        # Extract risk level
-                        analysis_upper = prop.ai_analysis.upper()
-                        if "HIGH" in analysis_upper:
-                            prop.ai_risk_level = "HIGH"
-                        elif "LOW" in analysis_upper:
-                            prop.ai_risk_level = "LOW"
-                        else:
-                            prop.ai_risk_level = "MEDIUM"
-                        
-                        self.stats["ai_analyzed"] += 1
-                        print(f"      [{i+1}] {prop.case_number}: {prop.ai_risk_level}")
-                    else:
-                        prop.errors.append(f"Fara error: {result.get('error')}")
+                if response.status_code == 404:
+                    self._fara_batch_supported = False
+                else:
+                    response.raise_for_status()
+                    results = _json_loads(response.content).get("results") or []
+                    if len(results) != len(chunk) or not all(isinstance(r, dict) for r in results):
+                        raise ValueError(f"expected {len(chunk)} result objects, got {len(results)}")
+                    self._fara_batch_supported = True
+            except Exception as e:
+                logger.warning(f"   ⚠️ Fara batch of {len(chunk)} failed, retrying per property: {e}")
+                results = None
+            
+            # Applied only once the whole response is valid, so a failure
+            # above never leaves part of the chunk already streamed
+            if results is not None:
+                for offset, (prop, result) in enumerate(zip(chunk, results)):
+                    try:
+                        self._apply_ai_result(start + offset, prop, result)
+                    except Exception as e:
+                        prop.errors.append(f"Fara exception: {str(e)}")
                         self.stats["errors"] += 1
-                        
-                except Exception as e:
-                    prop.errors.append(f"Fara exception: {str(e)}")
-                    self.stats["errors"] += 1
-                
-                prop.stages_completed.append(8)
-                
-                # Small delay between requests
-                await asyncio.sleep(0.5)
+                    prop.stages_completed.append(8)
+                    if completed is not None:
+                        await completed.put(prop)
+                return
         
-        print(f"   AI analysis complete: {self.stats['ai_analyzed']} analyzed")
-        return properties
+        await asyncio.gather(
+            *(self._analyze_one(sem, start + offset, prop, completed) for offset, prop in enumerate(chunk))
+        )
+    
+    async def _analyze_one(
+        self,
+        sem: asyncio.Semaphore,
+        i: int,
+        prop: PipelineProperty,
+        completed: Optional[asyncio.Queue] = None
+    ):
+        """Run Fara V8 analysis for one property (bounded by sem)."""
+        try:
+            async with sem:
+                response = await self.client.post(
+                    FARA_ANALYZE,
+                    content=_json_dumps(self._ai_payload(prop)),
+                    headers={"Content-Type": "application/json"},
+                    timeout=180.0
+                )
+            self._apply_ai_result(i, prop, _json_loads(response.content))
+        except Exception as e:
+            prop.errors.append(f"Fara exception: {str(e)}")
+            self.stats["errors"] += 1
+        
+        prop.stages_completed.append(8)
+        if completed is not None:
+            await completed.put(prop)
+    
+    @staticmethod
+    def _ai_payload(prop: PipelineProperty) -> Dict[str, Any]:
+        """Fara V8 request body for one property."""
+        if not prop._full_address:
+            prop.prepare_ai_payload()
+        
+        return {
+            "property_address": prop._full_address,
+            "case_number": prop.case_number,
+            "judgment_amount": prop.judgment_amount,
+            "context": prop._ai_context
+        }
+    
+    def _apply_ai_result(self, i: int, prop: PipelineProperty, result: Dict):
+        """Record one Fara V8 result on the property."""
+        if "error" not in result:
+            prop.ai_analysis = result.get("analysis", "")
+            
+            # Extract risk level
+            analysis_upper = prop.ai_analysis.upper()
+            if "HIGH" in analysis_upper:
+                prop.ai_risk_level = "HIGH"
+            elif "LOW" in analysis_upper:
+                prop.ai_risk_level = "LOW"
+            else:
+                prop.ai_risk_level = "MEDIUM"
+            
+            self.stats["ai_analyzed"] += 1
+            logger.info(f"      [{i+1}] {prop.case_number}: {prop.ai_risk_level}")
+        else:
+            prop.errors.append(f"Fara error: {result.get('error')}")
+            self.stats["errors"] += 1
     
     # ========================================
     # Stages 9-12: Output & Logging
     # ========================================
     async def stage_9_12_output(self, properties: List[PipelineProperty]) -> List[PipelineProperty]:
         """Generate reports, sync, log, and alert."""
-        print(f"[Stage 9-12] Output & Logging...")
+        logger.info(f"[Stage 9-12] Output & Logging...")
+        
+        # PostgREST bulk-inserts a JSON array in one request; chunk to stay
+        # under the request-size cap
+        size = self.INSIGHTS_BATCH_SIZE
+        chunks = [properties[i:i + size] for i in range(0, len(properties), size)]
+        await asyncio.gather(*(self._log_decisions(chunk) for chunk in chunks))
+        
+        logger.info(f"   Logged {len(properties)} decisions to Supabase")
+        return properties
+    
+    async def stage_8_12_streamed(self, properties: List[PipelineProperty]) -> List[PipelineProperty]:
+        """
+        Stage 8 AI assessment with Stages 9-12 logging overlapped.
+        
+        Stage 8 pushes each property onto a bounded queue as soon as its
+        analysis lands; log workers drain whatever is ready and bulk-insert
+        it, so wall time is max(stage 8, stage 9) rather than the sum.
+        """
+        logger.info(f"[Stage 9-12] Output & Logging (streaming with Stage 8)...")
         
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        
+        async def log_worker():
+            while True:
+                prop = await queue.get()
+                if prop is None:
+                    return
+                batch = [prop]
+                stop = False
+                while len(batch) < self.INSIGHTS_BATCH_SIZE and not queue.empty():
+                    prop = queue.get_nowait()
+                    if prop is None:
+                        stop = True
+                        break
+                    batch.append(prop)
+                await self._log_decisions(batch)
+                if stop:
+                    return
+        
+        workers = [asyncio.create_task(log_worker()) for _ in range(self.LOG_WORKERS)]
+        try:
+            properties = await self.stage_8_ai_assessment(properties, completed=queue)
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        
+        # A budget cutoff can cancel a property between Stage 8 and the queue
+        unlogged = [prop for prop in properties if 9 not in prop.stages_completed]
+        if unlogged:
+            await self._log_decisions(unlogged)
+        
+        logger.info(f"   Logged {len(properties)} decisions to Supabase")
+        return properties
+    
+    async def _log_decisions(self, chunk: List[PipelineProperty]):
+        """Bulk-insert decision logs for a chunk and mark Stages 9-12 done."""
         headers = {
             "apikey": self.supabase_key,
             "Authorization": f"Bearer {self.supabase_key}",
             "Content-Type": "application/json",
-            "Prefer": "return=representation"
+            "Prefer": "return=minimal"
         }
         
-        async with httpx.AsyncClient() as client:
-            for prop in properties:
-                # Save decision log to Supabase
-                log_data = {
-                    "user_id": 1,
-                    "insight_type": "PIPELINE_DECISION",
-                    "title": f"Pipeline Decision: {prop.case_number}",
-                    "description": f"""
+        try:
+            response = await self.client.post(
+                f"{self.supabase_url}/rest/v1/insights",
+                headers=headers,
+                content=_json_dumps([self._decision_log(prop) for prop in chunk]),
+                timeout=60.0
+            )
+            response.raise_for_status()
+        except Exception as e:
+            for prop in chunk:
+                prop.errors.append(f"Log error: {str(e)}")
+        
+        now_iso = datetime.now(timezone.utc).isoformat()
+        for prop in chunk:
+            prop.stages_completed.extend([9, 10, 11, 12])
+            prop.processed_at = now_iso
+    
+    @staticmethod
+    def _decision_log(prop: PipelineProperty) -> Dict[str, Any]:
+        """Build the insights row for one pipeline decision."""
+        return {
+            "user_id": 1,
+            "insight_type": "PIPELINE_DECISION",
+            "title": f"Pipeline Decision: {prop.case_number}",
+            "description": f"""
 Recommendation: {prop.recommendation}
 Address: {prop.address}, {prop.city} FL
 Judgment: ${prop.judgment_amount:,.0f}
@@ -567,27 +994,11 @@ Market Value: ${prop.market_value:,.0f}
 Max Bid: ${prop.max_bid:,.0f}
 Ratio: {prop.bid_judgment_ratio:.1%}
 AI Risk: {prop.ai_risk_level or 'N/A'}
-                    """.strip(),
-                    "priority": "High" if prop.recommendation == "BID" else "Medium",
-                    "status": "Active",
-                    "source": "unified_pipeline"
-                }
-                
-                try:
-                    await client.post(
-                        f"{self.supabase_url}/rest/v1/insights",
-                        headers=headers,
-                        json=log_data,
-                        timeout=30.0
-                    )
-                except Exception as e:
-                    prop.errors.append(f"Log error: {str(e)}")
-                
-                prop.stages_completed.extend([9, 10, 11, 12])
-                prop.processed_at = datetime.utcnow().isoformat()
-        
-        print(f"   Logged {len(properties)} decisions to Supabase")
-        return properties
+            """.strip(),
+            "priority": "High" if prop.recommendation == "BID" else "Medium",
+            "status": "Active",
+            "source": "unified_pipeline"
+        }
     
     # ========================================
     # Main Pipeline Runner
@@ -609,58 +1020,69 @@ AI Risk: {prop.ai_risk_level or 'N/A'}
         Returns:
             PipelineResult with all processed properties
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
+        self._deadline = start_time + self.pipeline_budget_s
         errors = []
         stages_completed = []
+        properties: List[PipelineProperty] = []
+        self._parcel_cache = {}
+        self._start_prewarm()
         
-        print(f"\n{'='*60}")
-        print(f"BidDeed.AI Unified Pipeline V{self.VERSION}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"BidDeed.AI Unified Pipeline V{self.VERSION}")
+        logger.info(f"{'='*60}\n")
         
         try:
-            # Stage 1: Calendar Sync
-            properties = await self.stage_1_calendar_sync(auction_date)
-            properties = properties[:limit]
-            stages_completed.append(1)
-            
-            # Stages 2-4: Enrichment
-            properties = await self.stage_2_4_enrichment(properties)
-            stages_completed.extend([2, 3, 4])
-            
-            # Stage 5: XGBoost
-            properties = await self.stage_5_xgboost(properties)
-            stages_completed.append(5)
-            
-            # Stage 6: Plaintiff Analysis
-            properties = await self.stage_6_plaintiff(properties)
-            stages_completed.append(6)
-            
-            # Stage 7: Bid Calculation
-            properties = await self.stage_7_bid_calculation(properties)
-            stages_completed.append(7)
-            
-            # Stage 8: AI Assessment
-            if not skip_ai:
-                properties = await self.stage_8_ai_assessment(properties)
-            stages_completed.append(8)
-            
-            # Stages 9-12: Output
-            properties = await self.stage_9_12_output(properties)
-            stages_completed.extend([9, 10, 11, 12])
+            # Global budget: a stuck stage is cancelled and reported, not awaited forever
+            async with asyncio.timeout(self.pipeline_budget_s):
+                await self._prewarm_task
+                
+                # Stage 1: Calendar Sync
+                properties = await self.stage_1_calendar_sync(auction_date)
+                properties = properties[:limit]
+                stages_completed.append(1)
+                
+                # Stages 2-4: Enrichment
+                properties = await self.stage_2_4_enrichment(properties)
+                stages_completed.extend([2, 3, 4])
+                
+                # Stage 5: XGBoost
+                properties = await self.stage_5_xgboost(properties)
+                stages_completed.append(5)
+                
+                # Stage 6: Plaintiff Analysis
+                properties = await self.stage_6_plaintiff(properties)
+                stages_completed.append(6)
+                
+                # Stage 7: Bid Calculation
+                properties = await self.stage_7_bid_calculation(properties)
+                stages_completed.append(7)
+                
+                # Stage 8: AI Assessment, streaming into Stages 9-12: Output
+                if not skip_ai:
+                    properties = await self.stage_8_12_streamed(properties)
+                else:
+                    properties = await self.stage_9_12_output(properties)
+                stages_completed.extend([8, 9, 10, 11, 12])
             
+        except TimeoutError:
+            errors.append(f"Pipeline exceeded {self.pipeline_budget_s:.0f}s budget")
         except Exception as e:
             errors.append(f"Pipeline error: {str(e)}")
+        finally:
+            self._deadline = None
+            await self.aclose()
         
-        runtime = (datetime.utcnow() - start_time).total_seconds()
+        runtime = time.perf_counter() - start_time
         
-        print(f"\n{'='*60}")
-        print(f"Pipeline Complete")
-        print(f"{'='*60}")
-        print(f"Properties: {len(properties)}")
-        print(f"BID: {self.stats['bid']} | REVIEW: {self.stats['review']} | SKIP: {self.stats['skip']}")
-        print(f"AI Analyzed: {self.stats['ai_analyzed']}")
-        print(f"Runtime: {runtime:.1f}s")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Pipeline Complete")
+        logger.info(f"{'='*60}")
+        logger.info(f"Properties: {len(properties)}")
+        logger.info(f"BID: {self.stats['bid']} | REVIEW: {self.stats['review']} | SKIP: {self.stats['skip']}")
+        logger.info(f"AI Analyzed: {self.stats['ai_analyzed']}")
+        logger.info(f"Runtime: {runtime:.1f}s")
+        logger.info(f"{'='*60}\n")
         
         return PipelineResult(
             success=len(errors) == 0,
@@ -681,7 +1103,9 @@ if __name__ == "__main__":
     parser.add_argument('--date', type=str, help='Auction date (YYYY-MM-DD)')
     parser.add_argument('--limit', type=int, default=10, help='Max properties')
     parser.add_argument('--skip-ai', action='store_true', help='Skip AI analysis')
+    parser.add_argument('--quiet', action='store_true', help='Only log warnings and errors')
     args = parser.parse_args()
+    log_handler = configure_logging(quiet=args.quiet)
     
     async def main():
         pipeline = UnifiedPipeline()
@@ -691,12 +1115,17 @@ if __name__ == "__main__":
             skip_ai=args.skip_ai
         )
         
-        print(json.dumps({
+        output = {
             "success": result.success,
             "properties": result.properties_processed,
             "summary": result.summary,
             "runtime": result.runtime_seconds
-        }, indent=2))
+        }
+        log_handler.flush()
+        if ORJSON_AVAILABLE:
+            print(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(output, indent=2))
     
     asyncio.run(main())
 
@@ -17,25 +17,63 @@ Author: Ariel Shapira, Solo Founder - Everest Capital USA
 """
 
 import os
+import gzip
 import json
+import hashlib
+import functools
 import re
 import time
+import random
+import threading
 import asyncio
 import httpx
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, List, Dict, Optional, Tuple
+from dataclasses import dataclass
 import logging
 
+# orjson parses/serializes in native code; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Local disk cache for repeat lien searches (optional)
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Modal + Playwright fallback (resolved once at import, not per fallback call)
+try:
+    from acclaimweb_scraper import search_acclaimweb_by_party
+except ImportError:
+    search_acclaimweb_by_party = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AcclaimWebScraper")
 
+# Document-type classification (hash probe instead of list scan)
+MORTGAGE_DOC_TYPES = frozenset({"MTG", "AMTG"})
+SATISFACTION_DOC_TYPES = frozenset({"SMTG"})
+
+# AcclaimWeb records don't change minute to minute; reuse searches for an hour
+LIEN_CACHE_DIR = os.getenv("LIEN_CACHE_DIR", "./.lien_cache")
+LIEN_CACHE_TTL = 3600
+_lien_cache = None
+
+# Cap concurrent Modal spawns; held in the worker thread, so not tied to one event loop
+MODAL_CONCURRENCY = 2
+_modal_semaphore = threading.BoundedSemaphore(MODAL_CONCURRENCY)
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LienRecord:
     """Structured lien record from AcclaimWeb"""
     document_number: str
@@ -49,13 +87,26 @@ class LienRecord:
     consideration: Optional[float] = None
     
     def is_mortgage(self) -> bool:
-        return self.document_type in ["MTG", "AMTG"]
+        return self.document_type in MORTGAGE_DOC_TYPES
     
     def is_satisfaction(self) -> bool:
-        return self.document_type == "SMTG"
+        return self.document_type in SATISFACTION_DOC_TYPES
+    
+    def to_dict(self) -> Dict:
+        return {
+            "document_number": self.document_number,
+            "document_type": self.document_type,
+            "recording_date": self.recording_date,
+            "book_page": self.book_page,
+            "grantor": self.grantor,
+            "grantee": self.grantee,
+            "amount": self.amount,
+            "legal_description": self.legal_description,
+            "consideration": self.consideration,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class LienSearchResult:
     """Complete search result with analysis"""
     search_party: str
@@ -71,6 +122,23 @@ class LienSearchResult:
     error: Optional[str] = None
     execution_method: str = "browserless"  # browserless or modal
     retry_count: int = 0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "search_party": self.search_party,
+            "search_role": self.search_role,
+            "search_timestamp": self.search_timestamp,
+            "records_found": self.records_found,
+            "mortgages": [r.to_dict() for r in self.mortgages],
+            "satisfactions": [r.to_dict() for r in self.satisfactions],
+            "other_liens": [r.to_dict() for r in self.other_liens],
+            "active_mortgages": [r.to_dict() for r in self.active_mortgages],
+            "total_active_mortgage_amount": self.total_active_mortgage_amount,
+            "success": self.success,
+            "error": self.error,
+            "execution_method": self.execution_method,
+            "retry_count": self.retry_count,
+        }
 
 
 # ============================================================================
@@ -88,33 +156,83 @@ class BrowserlessClient:
     BASE_URL = "https://chrome.browserless.io"
     CONNECT_URL = "wss://chrome.browserless.io"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrent: int = 3,
+        gzip_requests: Optional[bool] = None,
+    ):
+        """
+        Args:
+            api_key: Browserless API key (optional, uses env var)
+            http_client: Shared keep-alive client; one is created (and owned) if omitted
+            max_concurrent: Keep-alive pool size for an owned client
+            gzip_requests: gzip /function bodies (~3 KB script -> ~1 KB); defaults
+                to BROWSERLESS_GZIP_REQUESTS, since not every deployment inflates
+                request bodies
+        """
         self.api_key = api_key or os.getenv("BROWSERLESS_API_KEY")
         if not self.api_key:
             raise ValueError("BROWSERLESS_API_KEY not found in environment")
+        if gzip_requests is None:
+            gzip_requests = os.getenv("BROWSERLESS_GZIP_REQUESTS", "").lower() in ("1", "true")
+        self.gzip_requests = gzip_requests
+        self._owns_client = http_client is None
+        self._client = http_client or self.new_http_client(max_concurrent)
+    
+    @staticmethod
+    def new_http_client(max_concurrent: int = 3) -> httpx.AsyncClient:
+        """Keep-alive HTTP/2 client; concurrent searches multiplex over one TLS session."""
+        return httpx.AsyncClient(
+            timeout=120.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrent,
+                max_keepalive_connections=max_concurrent,
+                keepalive_expiry=30,
+            ),
+        )
+    
+    async def aclose(self):
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
     
-    async def execute_script(self, script: str, timeout: int = 60000) -> Dict:
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
+    async def execute_script(self, script: str, timeout: int = 60000, context: Optional[Dict] = None) -> Dict:
         """
         Execute a Puppeteer/Playwright script via Browserless function API.
         
         Args:
             script: JavaScript code to execute
             timeout: Timeout in milliseconds
+            context: Values passed to the script as ``context``
             
         Returns:
             Script execution result
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/function?token={self.api_key}",
-                json={
-                    "code": script,
-                    "context": {},
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            return response.json()
+        body = _function_body(script, context or {})
+        headers = {"Content-Type": "application/json"}
+        if self.gzip_requests:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        
+        response = await self._client.post(
+            f"{self.BASE_URL}/function?token={self.api_key}",
+            content=body,
+            headers=headers
+        )
+        logger.debug(f"[Browserless] /function over {response.http_version}")
+        if response.status_code == 429:
+            raise RateLimited(retry_after=_retry_after(response, 0.0))
+        response.raise_for_status()
+        return _json_loads(response.content)
     
     async def scrape_content(self, url: str, wait_selector: str = None) -> str:
         """
@@ -133,20 +251,73 @@ class BrowserlessClient:
             "gotoOptions": {"waitUntil": "networkidle2"},
         }
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/content?token={self.api_key}",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            return response.text
+        response = await self._client.post(
+            f"{self.BASE_URL}/content?token={self.api_key}",
+            content=_json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=60.0
+        )
+        response.raise_for_status()
+        return response.text
 
 
 # ============================================================================
 # RETRY LOGIC WITH EXPONENTIAL BACKOFF
 # ============================================================================
 
+class RateLimited(httpx.HTTPError):
+    """Browserless returned 429; retry_after is the server-requested wait in seconds."""
+    
+    def __init__(self, retry_after: float = 0.0):
+        super().__init__(f"Rate limited (Retry-After: {retry_after:g}s)")
+        self.retry_after = retry_after
+
+
+# Monotonic time before which no worker should hit Browserless again. One
+# worker's 429 pauses every concurrent search instead of each burning retries.
+_rate_limited_until = 0.0
+
+
+async def _wait_for_rate_limit():
+    """Sleep out any shared rate-limit pause."""
+    wait = _rate_limited_until - time.monotonic()
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+def _pause_for_rate_limit(seconds: float):
+    """Start (or extend) the shared rate-limit pause."""
+    global _rate_limited_until
+    _rate_limited_until = max(_rate_limited_until, time.monotonic() + seconds)
+
+
+class TokenBucket:
+    """
+    Token-bucket pacing: at most `rate` acquisitions per second on average,
+    with bursts up to `capacity`. Time spent in the request itself counts
+    toward the interval, unlike a fixed sleep between requests.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0.0
+                self.last = time.monotonic()
+            else:
+                self.tokens -= 1
+
+
 async def retry_with_backoff(
     func,
     max_retries: int = 3,
@@ -157,6 +328,10 @@ async def retry_with_backoff(
     """
     Execute async function with exponential backoff retry.
     
+    Delays are jittered (0.5x-1.5x) so parallel workers don't retry in
+    lockstep. A 429 with Retry-After waits exactly that long and pauses
+    all other retrying workers for the same window.
+    
     Args:
         func: Async function to execute
         max_retries: Maximum number of retry attempts
@@ -174,11 +349,17 @@ async def retry_with_backoff(
     
     for attempt in range(max_retries):
         try:
+            await _wait_for_rate_limit()
             return await func()
         except exceptions as e:
             last_exception = e
             if attempt < max_retries - 1:
-                delay = min(base_delay * (2 ** attempt), max_delay)
+                delay = min(base_delay * (2 ** attempt), max_delay) * (0.5 + random.random())
+                if isinstance(e, RateLimited) and e.retry_after > 0:
+                    delay = e.retry_after
+                    _pause_for_rate_limit(delay)
+                elif isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                    delay = _retry_after(e.response, delay)
                 logger.warning(
                     f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
                     f"Retrying in {delay:.1f}s..."
@@ -285,6 +466,7 @@ async def search_acclaimweb_browserless(
     date_from: str = None,
     date_to: str = None,
     api_key: str = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> LienSearchResult:
     """
     Search AcclaimWeb using Browserless.io with retry logic.
@@ -296,6 +478,7 @@ async def search_acclaimweb_browserless(
         date_from: Start date MM/DD/YYYY
         date_to: End date MM/DD/YYYY
         api_key: Browserless API key (optional, uses env var)
+        http_client: Shared keep-alive client (optional)
         
     Returns:
         LienSearchResult with search results
@@ -306,7 +489,7 @@ async def search_acclaimweb_browserless(
     result = LienSearchResult(
         search_party=party_name,
         search_role=role,
-        search_timestamp=datetime.utcnow().isoformat(),
+        search_timestamp=datetime.now(timezone.utc).isoformat(),
         records_found=0,
         mortgages=[],
         satisfactions=[],
@@ -318,7 +501,7 @@ async def search_acclaimweb_browserless(
     )
     
     try:
-        client = BrowserlessClient(api_key)
+        client = BrowserlessClient(api_key, http_client=http_client)
     except ValueError as e:
         result.error = str(e)
         return result
@@ -330,30 +513,23 @@ async def search_acclaimweb_browserless(
         retry_count += 1
         
         # Use Browserless function API
-        async with httpx.AsyncClient(timeout=120.0) as http_client:
-            response = await http_client.post(
-                f"{client.BASE_URL}/function?token={client.api_key}",
-                json={
-                    "code": ACCLAIMWEB_SEARCH_SCRIPT,
-                    "context": {
-                        "partyName": party_name,
-                        "role": role,
-                        "docTypes": doc_types,
-                        "dateFrom": date_from,
-                        "dateTo": date_to,
-                    },
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            return response.json()
+        return await client.execute_script(
+            ACCLAIMWEB_SEARCH_SCRIPT,
+            context={
+                "partyName": party_name,
+                "role": role,
+                "docTypes": doc_types,
+                "dateFrom": date_from,
+                "dateTo": date_to,
+            },
+        )
     
     try:
         search_result = await retry_with_backoff(
             execute_search,
             max_retries=3,
             base_delay=2.0,
-            exceptions=(httpx.HTTPError, httpx.TimeoutException, Exception)
+            exceptions=(httpx.HTTPError, httpx.TimeoutException)
         )
         
         result.retry_count = retry_count
@@ -385,17 +561,20 @@ async def search_acclaimweb_browserless(
         
         # Determine active mortgages
         satisfied_refs = {s.book_page for s in result.satisfactions if s.book_page}
+        # Uppercase each satisfaction grantor once; exact names hit the set directly
+        sat_grantors = [s.grantor.upper() for s in result.satisfactions]
+        sat_grantor_set = set(sat_grantors)
         
         for mtg in result.mortgages:
             is_satisfied = mtg.book_page in satisfied_refs
             
             # Also check grantor/grantee swap
             if not is_satisfied:
-                for sat in result.satisfactions:
-                    if (mtg.grantee.upper() in sat.grantor.upper() or
-                        sat.grantor.upper() in mtg.grantee.upper()):
-                        is_satisfied = True
-                        break
+                mtg_grantee = mtg.grantee.upper()
+                is_satisfied = mtg_grantee in sat_grantor_set or any(
+                    mtg_grantee in grantor or grantor in mtg_grantee
+                    for grantor in sat_grantors
+                )
             
             if not is_satisfied:
                 result.active_mortgages.append(mtg)
@@ -415,6 +594,8 @@ async def search_acclaimweb_browserless(
         result.error = f"All retries failed: {str(e)}"
         result.retry_count = retry_count
         logger.error(f"[AcclaimWeb] Error: {e}")
+    finally:
+        await client.aclose()
     
     return result
 
@@ -429,6 +610,8 @@ async def search_acclaimweb_with_fallback(
     doc_types: List[str] = None,
     date_from: str = None,
     date_to: str = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    no_cache: bool = False,
 ) -> LienSearchResult:
     """
     Search AcclaimWeb with Browserless primary and Modal fallback.
@@ -436,7 +619,35 @@ async def search_acclaimweb_with_fallback(
     Tries Browserless first (3 retries), falls back to Modal if:
     - BROWSERLESS_API_KEY not set
     - All Browserless retries fail
+    
+    Successful results are cached on disk for LIEN_CACHE_TTL seconds
+    (skip with no_cache=True). Pass http_client to reuse one keep-alive
+    connection across searches.
     """
+    cache = None if no_cache else _get_lien_cache()
+    if cache is not None:
+        key = _lien_cache_key(party_name, role, doc_types, date_from, date_to)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"[AcclaimWeb] Using cached search for {party_name}")
+            return _search_result_from_dict(cached)
+    
+    result = await _search_with_fallback(party_name, role, doc_types, date_from, date_to, http_client)
+    
+    if cache is not None and result.success:
+        cache.set(key, result.to_dict(), expire=LIEN_CACHE_TTL)
+    return result
+
+
+async def _search_with_fallback(
+    party_name: str,
+    role: str,
+    doc_types: Optional[List[str]],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    http_client: Optional[httpx.AsyncClient],
+) -> LienSearchResult:
+    """Browserless search, falling back to Modal (uncached)."""
     # Check for Browserless API key
     browserless_key = os.getenv("BROWSERLESS_API_KEY")
     
@@ -449,6 +660,7 @@ async def search_acclaimweb_with_fallback(
             date_from=date_from,
             date_to=date_to,
             api_key=browserless_key,
+            http_client=http_client,
         )
         
         if result.success:
@@ -460,10 +672,12 @@ async def search_acclaimweb_with_fallback(
     
     # Fallback to Modal
     try:
-        # Import Modal functions (lazy import to avoid dependency if not needed)
-        from acclaimweb_scraper import search_acclaimweb_by_party
+        if search_acclaimweb_by_party is None:
+            raise ImportError("Modal search_acclaimweb_by_party not available")
         
-        modal_result = search_acclaimweb_by_party.remote(
+        # .remote() blocks; run it off the event loop so Browserless retries keep going
+        modal_result = await asyncio.to_thread(
+            _modal_search,
             party_name=party_name,
             role=role,
             doc_types=doc_types or ["MTG", "SMTG", "AMTG"],
@@ -492,7 +706,7 @@ async def search_acclaimweb_with_fallback(
         return LienSearchResult(
             search_party=party_name,
             search_role=role,
-            search_timestamp=datetime.utcnow().isoformat(),
+            search_timestamp=datetime.now(timezone.utc).isoformat(),
             records_found=0,
             mortgages=[],
             satisfactions=[],
@@ -527,19 +741,29 @@ async def batch_search_defendants(
     Returns:
         List of search results with lien analysis
     """
-    results = []
+    # One keep-alive client for the whole batch instead of a handshake per search
+    http_client = BrowserlessClient.new_http_client(max_concurrent)
     
-    async def search_single(defendant: Dict) -> Dict:
-        # Extract last name
-        name = defendant.get("defendant_name", "")
-        last_name = name.split()[-1] if " " in name else name
-        
+    # Defendants sharing a last name ("John SMITH", "Jane SMITH") get
+    # identical AcclaimWeb searches; run each unique name once
+    by_last_name: Dict[str, str] = {}
+    for defendant in defendants:
+        last_name = _last_name(defendant.get("defendant_name", ""))
+        by_last_name.setdefault(last_name.upper(), last_name)
+    
+    async def search_name(last_name: str) -> Tuple[LienSearchResult, Dict]:
         # Search with fallback
         search_result = await search_acclaimweb_with_fallback(
             party_name=last_name,
             role="GRANTEE",
             doc_types=["MTG", "SMTG", "AMTG"] if include_mortgages else None,
+            http_client=http_client,
         )
+        # Serialize the result tree once; defendants with this name share it
+        return search_result, search_result.to_dict()
+    
+    def analyze(defendant: Dict, search_result: LienSearchResult, sr_dict: Dict) -> Dict:
+        name = defendant.get("defendant_name", "")
         
         # Analyze for HOA foreclosure
         plaintiff = defendant.get("plaintiff", "").upper()
@@ -551,8 +775,8 @@ async def batch_search_defendants(
             "defendant": name,
             "plaintiff": defendant.get("plaintiff"),
             "is_hoa_foreclosure": is_hoa,
-            "search_result": asdict(search_result),
-            "active_mortgages": [asdict(m) for m in search_result.active_mortgages],
+            "search_result": sr_dict,
+            "active_mortgages": sr_dict["active_mortgages"],
             "total_senior_liens": search_result.total_active_mortgage_amount if is_hoa else 0,
             "execution_method": search_result.execution_method,
             "retry_count": search_result.retry_count,
@@ -572,24 +796,47 @@ async def batch_search_defendants(
         
         return analysis
     
-    if parallel:
-        # Run in parallel with semaphore
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def bounded_search(defendant):
-            async with semaphore:
-                return await search_single(defendant)
-        
-        tasks = [bounded_search(d) for d in defendants]
-        results = await asyncio.gather(*tasks)
-    else:
-        # Sequential with delay
-        for idx, defendant in enumerate(defendants):
-            logger.info(f"[Batch] Processing {idx+1}/{len(defendants)}: {defendant.get('defendant_name')}")
-            result = await search_single(defendant)
-            results.append(result)
-            if idx < len(defendants) - 1:
-                await asyncio.sleep(3)
+    try:
+        if parallel:
+            # Run in parallel with semaphore
+            semaphore = asyncio.Semaphore(max_concurrent)
+            
+            async def bounded_search(last_name):
+                async with semaphore:
+                    return await search_name(last_name)
+            
+            # One failed search must not cancel its siblings
+            tasks = [bounded_search(n) for n in by_last_name.values()]
+            found = dict(zip(by_last_name, await asyncio.gather(*tasks, return_exceptions=True)))
+        else:
+            # Sequential, paced to one search start every 3s
+            found = {}
+            bucket = TokenBucket(rate=1 / 3.0, capacity=1)
+            for idx, (key, last_name) in enumerate(by_last_name.items()):
+                await bucket.acquire()
+                logger.info(f"[Batch] Searching {idx+1}/{len(by_last_name)}: {last_name}")
+                try:
+                    found[key] = await search_name(last_name)
+                except Exception as e:
+                    found[key] = e
+    finally:
+        await http_client.aclose()
+    
+    results = []
+    for defendant in defendants:
+        key = _last_name(defendant.get("defendant_name", "")).upper()
+        outcome = found[key]
+        if isinstance(outcome, BaseException):
+            logger.error(f"[Batch] Search failed for {defendant.get('defendant_name')}: {outcome}")
+            results.append({
+                "case_number": defendant.get("case_number"),
+                "defendant": defendant.get("defendant_name", ""),
+                "plaintiff": defendant.get("plaintiff"),
+                "recommendation": "MANUAL_REVIEW",
+                "reason": f"exception: {outcome}",
+            })
+        else:
+            results.append(analyze(defendant, *outcome))
     
     return results
 
@@ -598,46 +845,116 @@ async def batch_search_defendants(
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _last_name(name: str) -> str:
+    """Last token of a defendant name (the AcclaimWeb party search term)"""
+    return name.split()[-1] if " " in name else name
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=8)
+def _script_prefix(script: str) -> bytes:
+    """Encoded '{"code": ...' head of a /function body (scripts are constants)."""
+    return _json_dumps({"code": script})[:-1]
+
+
+def _function_body(script: str, context: Dict) -> bytes:
+    """/function body; only the small context is encoded per call."""
+    return _script_prefix(script) + b',"context":' + _json_dumps(context) + b'}'
+
+
+# Deletes every ASCII character except digits and '.' ("$1,234.56" -> "1234.56")
+_AMOUNT_STRIP = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in "0123456789."))
+_NON_AMOUNT_RE = re.compile(r'[^\d.]')
+
+
 def _parse_amount(amount_str: str) -> Optional[float]:
     """Parse dollar amount from string"""
     if not amount_str:
         return None
-    cleaned = re.sub(r'[^\d.]', '', amount_str)
+    cleaned = amount_str.translate(_AMOUNT_STRIP)
+    try:
+        return float(cleaned) if cleaned else None
+    except ValueError:
+        pass
+    # Rare non-ASCII leftovers (e.g. a euro sign): full regex cleanup
+    cleaned = _NON_AMOUNT_RE.sub('', amount_str)
     try:
         return float(cleaned) if cleaned else None
     except ValueError:
         return None
 
 
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """Seconds from a Retry-After header (delta-seconds form), else default"""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except ValueError:
+        return default
+
+
+def _modal_search(**kwargs) -> Dict:
+    """Blocking Modal call, bounded by MODAL_CONCURRENCY"""
+    with _modal_semaphore:
+        return search_acclaimweb_by_party.remote(**kwargs)
+
+
+def _get_lien_cache():
+    """Open the on-disk lien cache on first use (None if diskcache is missing)."""
+    global _lien_cache
+    if _lien_cache is None and DISKCACHE_AVAILABLE:
+        _lien_cache = Cache(LIEN_CACHE_DIR)
+    return _lien_cache
+
+
+def _lien_cache_key(party_name, role, doc_types, date_from, date_to) -> str:
+    """Stable key for one AcclaimWeb search."""
+    raw = json.dumps([party_name.upper(), role, sorted(doc_types or []), date_from, date_to])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _search_result_from_dict(data: Dict) -> LienSearchResult:
+    """Rebuild a LienSearchResult (with nested LienRecords) from to_dict() output."""
+    data = dict(data)
+    for key in ("mortgages", "satisfactions", "other_liens", "active_mortgages"):
+        data[key] = [LienRecord(**rec) for rec in data.get(key, [])]
+    return LienSearchResult(**data)
+
+
+HOA_KEYWORDS = (
+    "HOA", "HOMEOWNERS", "HOME OWNERS",
+    "ASSOCIATION", "ASSOC", "ASSN",
+    "CONDOMINIUM", "CONDO", "COA",
+    "PROPERTY OWNERS", "POA",
+    "COMMUNITY", "COMMUNITIES",
+    "ESTATES", "VILLAS", "LANDINGS",
+    "PRESERVE", "RESERVE", "CLUB"
+)
+
+BANK_KEYWORDS = (
+    "BANK", "MORTGAGE", "LENDING", "CREDIT UNION",
+    "LOAN", "FANNIE", "FREDDIE", "WELLS FARGO",
+    "JPMORGAN", "CHASE", "NATIONSTAR", "SERVICING"
+)
+
+# One alternation per list: a single C-level scan instead of a Python loop
+# of substring checks (substring semantics kept, so no word boundaries)
+_HOA_RE = re.compile("|".join(map(re.escape, HOA_KEYWORDS)))
+_BANK_RE = re.compile("|".join(map(re.escape, BANK_KEYWORDS)))
+
+
 def _detect_hoa(plaintiff: str) -> bool:
     """Detect if foreclosure is by HOA/COA"""
-    HOA_KEYWORDS = [
-        "HOA", "HOMEOWNERS", "HOME OWNERS",
-        "ASSOCIATION", "ASSOC", "ASSN",
-        "CONDOMINIUM", "CONDO", "COA",
-        "PROPERTY OWNERS", "POA",
-        "COMMUNITY", "COMMUNITIES",
-        "ESTATES", "VILLAS", "LANDINGS",
-        "PRESERVE", "RESERVE", "CLUB"
-    ]
-    
-    BANK_KEYWORDS = [
-        "BANK", "MORTGAGE", "LENDING", "CREDIT UNION",
-        "LOAN", "FANNIE", "FREDDIE", "WELLS FARGO",
-        "JPMORGAN", "CHASE", "NATIONSTAR", "SERVICING"
-    ]
-    
     plaintiff_upper = plaintiff.upper()
-    
-    for keyword in BANK_KEYWORDS:
-        if keyword in plaintiff_upper:
-            return False
-    
-    for keyword in HOA_KEYWORDS:
-        if keyword in plaintiff_upper:
-            return True
-    
-    return False
+    if _BANK_RE.search(plaintiff_upper):
+        return False
+    return _HOA_RE.search(plaintiff_upper) is not None
 
 
 # ============================================================================
@@ -14,6 +14,11 @@ ADDRESS_PATTERNS = [
     (r'(\d{2,5}\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Drive|Dr|Road|Rd|Lane|Ln|Way|Court|Ct)[^,\n]*,\s*FL\s*\d{5})', 0.85),
 ]
 
+# Compiled once at import instead of per document
+_COMPILED = [(re.compile(p, re.IGNORECASE), c) for p, c in ADDRESS_PATTERNS]
+_ZIP_RE = re.compile(r'\d{5}')
+_LEADS_WITH_NUM = re.compile(r'^\d+')
+
 BREVARD_ZIPS = {'32754','32780','32796','32901','32903','32904','32905','32907','32908','32909',
                 '32920','32922','32926','32927','32931','32935','32937','32940','32949','32950',
                 '32951','32952','32953','32955'}
@@ -23,14 +28,14 @@ def extract_address(text: str):
     if not text:
         return None
     
-    for pattern, confidence in ADDRESS_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            address = match.strip()
-            zip_match = re.search(r'(\d{5})', address)
-            if zip_match and zip_match.group(1) in BREVARD_ZIPS:
+    # finditer stops scanning at the first acceptable match
+    for pattern, confidence in _COMPILED:
+        for match in pattern.finditer(text):
+            address = match.group(1).strip()
+            zip_match = _ZIP_RE.search(address)
+            if zip_match and zip_match.group() in BREVARD_ZIPS:
                 return address
-            if zip_match and re.match(r'^\d+', address) and len(address) > 15:
+            if zip_match and _LEADS_WITH_NUM.match(address) and len(address) > 15:
                 return address
     
     return None
@@ -9,8 +9,12 @@ Author: BidDeed.AI
 Version: 13.2.0
 """
 
+import asyncio
+import httpx
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
@@ -19,6 +23,12 @@ logger = logging.getLogger('BCPAOScraper')
 
 BCPAO_API_URL = "https://gis.brevardfl.gov/gissrv/rest/services/Base_Map/Parcel_New_WKID2881/MapServer/5/query"
 
+# Only the attributes _parse_attributes reads
+BCPAO_OUT_FIELDS = (
+    "PARCEL,SITUS_ADDR,SITUS_CITY,SITUS_ZIP,OWNER_NAME,JUST_VAL,ASSESSED_VAL,LAND_VAL,"
+    "BLDG_VAL,YEAR_BUILT,LIVING_AREA,BEDROOMS,BATHROOMS,LOT_SIZE,USE_CODE"
+)
+
 
 @dataclass
 class PropertyData:
@@ -62,26 +72,42 @@ class PropertyData:
 class BCPAOScraper:
     """Scraper for Brevard County Property Appraiser data"""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, pool_size: int = 20):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'BidDeed.AI/13.2.0'
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Keep-alive pool sized for threaded callers, with retry on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    @staticmethod
+    def _address_params(address: str) -> Dict[str, str]:
+        """ArcGIS query params for an address search"""
+        # Clean address for search
+        clean_addr = address.upper().strip()
+        clean_addr = clean_addr.split(',')[0]  # Remove city/state
+        clean_addr = clean_addr.replace("'", "''")  # Escape SQL string literal
+        
+        return {
+            'where': f"UPPER(SITUS_ADDR) LIKE '%{clean_addr}%'",
+            'outFields': BCPAO_OUT_FIELDS,
+            'resultRecordCount': '1',
+            'returnGeometry': 'false',
+            'f': 'json'
+        }
     
     def search_by_address(self, address: str) -> Optional[PropertyData]:
         """Search for property by address"""
         try:
-            # Clean address for search
-            clean_addr = address.upper().strip()
-            clean_addr = clean_addr.split(',')[0]  # Remove city/state
-            
-            params = {
-                'where': f"UPPER(SITUS_ADDR) LIKE '%{clean_addr}%'",
-                'outFields': '*',
-                'returnGeometry': 'false',
-                'f': 'json'
-            }
+            params = self._address_params(address)
             
             response = self.session.get(BCPAO_API_URL, params=params, timeout=self.timeout)
             response.raise_for_status()
@@ -98,12 +124,34 @@ class BCPAOScraper:
             logger.error(f"Search failed for {address}: {e}")
             return None
     
+    async def search_by_address_async(self, client: httpx.AsyncClient, address: str) -> Optional[PropertyData]:
+        """Search for property by address on a shared async client"""
+        try:
+            params = self._address_params(address)
+            
+            response = await client.get(BCPAO_API_URL, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            
+            if data.get('features') and len(data['features']) > 0:
+                attrs = data['features'][0]['attributes']
+                return self._parse_attributes(attrs)
+            
+            logger.warning(f"No results for: {address}")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Search failed for {address}: {e}")
+            return None
+    
     def search_by_parcel(self, parcel_id: str) -> Optional[PropertyData]:
         """Search for property by parcel ID"""
         try:
+            parcel = parcel_id.replace("'", "''")
             params = {
-                'where': f"PARCEL = '{parcel_id}'",
-                'outFields': '*',
+                'where': f"PARCEL = '{parcel}'",
+                'outFields': BCPAO_OUT_FIELDS,
+                'resultRecordCount': '1',
                 'returnGeometry': 'false',
                 'f': 'json'
             }
@@ -149,18 +197,38 @@ class BCPAOScraper:
             return case_data
         
         prop = self.search_by_address(address)
+        return self._apply_enrichment(case_data, prop)
+    
+    @staticmethod
+    def _apply_enrichment(case_data: Dict[str, Any], prop: Optional[PropertyData]) -> Dict[str, Any]:
+        """Copy BCPAO fields onto a foreclosure case"""
         if prop:
             case_data['bcpao_value'] = prop.just_value
             case_data['year_built'] = prop.year_built
             case_data['living_area'] = prop.living_area
             case_data['parcel_id'] = prop.parcel_id
-            logger.info(f"✅ Enriched: {address} - ${prop.just_value:,.0f}")
+            logger.info(f"✅ Enriched: {case_data.get('address')} - ${prop.just_value:,.0f}")
         
         return case_data
     
+    async def enrich_batch_async(self, cases: List[Dict[str, Any]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Enrich multiple foreclosure cases concurrently over one HTTP/2 client"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with httpx.AsyncClient(http2=True, headers=self.headers, timeout=self.timeout) as client:
+            async def one(case_data: Dict[str, Any]) -> Dict[str, Any]:
+                address = case_data.get('address', '')
+                if not address:
+                    return case_data
+                async with semaphore:
+                    prop = await self.search_by_address_async(client, address)
+                return self._apply_enrichment(case_data, prop)
+            
+            return await asyncio.gather(*(one(c) for c in cases))
+    
     def enrich_batch(self, cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Enrich multiple foreclosure cases"""
-        return [self.enrich_foreclosure(c) for c in cases]
+        return asyncio.run(self.enrich_batch_async(cases))
 
 
 if __name__ == '__main__':
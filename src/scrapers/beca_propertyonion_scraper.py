@@ -14,301 +14,12 @@ Method:
 This bypasses BECA's anti-automation while getting the same data.
 """
 
-"""
-PropertyOnion API Client for BidDeed.AI
-=======================================
-Discovered API Endpoints:
-- Auth: POST https://propertyonion.com/api/auth/login
-- Search: POST https://propertyonion.com/api/search/api/search-by-county
-- Counties: GET https://propertyonion.com/api/common/county?fetchAll=true
-- Lookups: GET https://propertyonion.com/api/search/api/getlookups
-
-Usage:
-    client = PropertyOnionClient()
-    await client.login("email@example.com", "password")
-    results = await client.search_tax_deeds("Brevard", "2025-12-18")
-"""
-
 import asyncio
-import httpx
-import json
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import os
+import time
+from typing import Dict, Tuple
 
-
-class PropertyOnionClient:
-    """Complete PropertyOnion API client with authentication"""
-    
-    BASE_URL = "https://propertyonion.com/api"
-    
-    # Florida county FIPS codes (discovered from /api/common/county)
-    COUNTIES = {
-        "Brevard": {"id": 18, "fips": "12009"},
-        "Palm Beach": {"id": 1, "fips": "12099"},
-        "Broward": {"id": 2, "fips": "12011"},
-        "Miami-Dade": {"id": 3, "fips": "12086"},
-        "Orange": {"id": 10, "fips": "12095"},
-        "Hillsborough": {"id": 11, "fips": "12057"},
-        "Duval": {"id": 9, "fips": "12031"},
-        "Pinellas": {"id": 4, "fips": "12103"},
-        "Lee": {"id": 5, "fips": "12071"},
-        "Polk": {"id": 12, "fips": "12105"},
-        "Volusia": {"id": 13, "fips": "12127"},
-        "Seminole": {"id": 33, "fips": "12117"},
-        "Osceola": {"id": 34, "fips": "12097"},
-        "Sarasota": {"id": 19, "fips": "12115"},
-        "Manatee": {"id": 17, "fips": "12081"},
-        "Collier": {"id": 31, "fips": "12021"},
-        "Marion": {"id": 32, "fips": "12083"},
-        "Pasco": {"id": 15, "fips": "12101"},
-        "Lake": {"id": 35, "fips": "12069"},
-        "Escambia": {"id": 16, "fips": "12033"},
-        "St. Johns": {"id": 29, "fips": "12109"},
-        "Clay": {"id": 22, "fips": "12019"},
-        "Alachua": {"id": 28, "fips": "12001"},
-        "Charlotte": {"id": 14, "fips": "12015"},
-        "Indian River": {"id": 30, "fips": "12061"},
-        "Flagler": {"id": 20, "fips": "12035"},
-        "Hernando": {"id": 37, "fips": "12053"},
-        "Citrus": {"id": 23, "fips": "12017"},
-        "Martin": {"id": 6, "fips": "12085"},
-        "St. Lucie": {"id": 8, "fips": "12111"},
-        "Nassau": {"id": 38, "fips": "12089"},
-        "Putnam": {"id": 21, "fips": "12107"},
-        "Washington": {"id": 184, "fips": "12133"},
-        "Hendry": {"id": 188, "fips": "12051"},
-    }
-    
-    def __init__(self):
-        self.token: Optional[str] = None
-        self.user_info: Optional[Dict] = None
-        self._client: Optional[httpx.AsyncClient] = None
-    
-    @property
-    def headers(self) -> Dict[str, str]:
-        """Get request headers with auth token if available"""
-        h = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Origin": "https://www.propertyonion.com",
-            "Referer": "https://www.propertyonion.com/"
-        }
-        if self.token:
-            h["Authorization"] = f"Bearer {self.token}"
-        return h
-    
-    async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
-        return self
-    
-    async def __aexit__(self, *args):
-        if self._client:
-            await self._client.aclose()
-    
-    async def login(self, email: str, password: str) -> bool:
-        """
-        Authenticate with PropertyOnion
-        
-        Args:
-            email: Account email
-            password: Account password
-            
-        Returns:
-            True if login successful
-        """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/auth/login",
-                headers=self.headers,
-                json={"email": email, "password": password}
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.token = data.get("token") or data.get("accessToken")
-                self.user_info = data.get("user") or data
-                return bool(self.token)
-            
-            return False
-    
-    async def get_counties(self) -> List[Dict]:
-        """Get all available counties"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/common/county?fetchAll=true",
-                headers=self.headers
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("payload", data)
-            return []
-    
-    async def search_tax_deeds(
-        self,
-        county: str,
-        auction_date: Optional[str] = None,
-        status: str = "sold",
-        page: int = 1,
-        page_size: int = 100
-    ) -> Dict[str, Any]:
-        """
-        Search for tax deed auction results
-        
-        Args:
-            county: County name (e.g., "Brevard")
-            auction_date: Optional date filter (YYYY-MM-DD)
-            status: "sold", "active", "all"
-            page: Page number for pagination
-            page_size: Results per page (max 100)
-            
-        Returns:
-            Dict with properties list and metadata
-        """
-        county_info = self.COUNTIES.get(county, {"fips": "12009"})
-        
-        payload = {
-            "fips": county_info["fips"],
-            "state": "FL",
-            "county": county,
-            "listingType": "tax-deed-auction",
-            "auctionStatus": status,
-            "page": page,
-            "pageSize": page_size
-        }
-        
-        if auction_date:
-            payload["auctionDate"] = auction_date
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/search/api/search-by-county",
-                headers=self.headers,
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            
-            return {"error": response.status_code, "message": response.text}
-    
-    async def search_foreclosures(
-        self,
-        county: str,
-        auction_date: Optional[str] = None,
-        status: str = "sold",
-        page: int = 1,
-        page_size: int = 100
-    ) -> Dict[str, Any]:
-        """Search for foreclosure auction results"""
-        county_info = self.COUNTIES.get(county, {"fips": "12009"})
-        
-        payload = {
-            "fips": county_info["fips"],
-            "state": "FL",
-            "county": county,
-            "listingType": "foreclosure-auction",
-            "auctionStatus": status,
-            "page": page,
-            "pageSize": page_size
-        }
-        
-        if auction_date:
-            payload["auctionDate"] = auction_date
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/search/api/search-by-county",
-                headers=self.headers,
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            
-            return {"error": response.status_code}
-    
-    async def get_all_results(
-        self,
-        county: str,
-        listing_type: str = "tax-deed-auction",
-        auction_date: Optional[str] = None,
-        status: str = "sold"
-    ) -> List[Dict]:
-        """
-        Get ALL results with automatic pagination
-        
-        Args:
-            county: County name
-            listing_type: "tax-deed-auction" or "foreclosure-auction"
-            auction_date: Optional date filter
-            status: "sold", "active", "all"
-            
-        Returns:
-            List of all properties
-        """
-        all_properties = []
-        page = 1
-        
-        while True:
-            if listing_type == "tax-deed-auction":
-                result = await self.search_tax_deeds(county, auction_date, status, page)
-            else:
-                result = await self.search_foreclosures(county, auction_date, status, page)
-            
-            properties = result.get("properties", result.get("data", []))
-            if not properties:
-                break
-            
-            all_properties.extend(properties)
-            
-            # Check pagination
-            total = result.get("total", result.get("totalCount", 0))
-            if len(all_properties) >= total:
-                break
-            
-            page += 1
-            await asyncio.sleep(0.5)  # Rate limiting
-        
-        return all_properties
-
-
-# Example usage and test
-async def main():
-    import os
-    
-    email = os.getenv("PO_EMAIL", "Ms@property360re.com")
-    password = os.getenv("PO_PASSWORD", "Builder1")
-    
-    client = PropertyOnionClient()
-    
-    print("🔐 Logging in to PropertyOnion...")
-    if await client.login(email, password):
-        print(f"   ✅ Logged in! Token: {client.token[:20]}...")
-        
-        print("\n📊 Searching Brevard County tax deeds (Dec 18, 2025)...")
-        results = await client.search_tax_deeds("Brevard", "2025-12-18")
-        
-        if "error" not in results:
-            properties = results.get("properties", [])
-            total = results.get("total", len(properties))
-            volume = sum(p.get("soldPrice", 0) or p.get("sold_amount", 0) for p in properties)
-            
-            print(f"   Found: {total} properties")
-            print(f"   Volume: ${volume:,.0f}")
-            
-            for p in properties[:5]:
-                addr = p.get("address", "Unknown")
-                sold = p.get("soldPrice") or p.get("sold_amount", 0)
-                print(f"   - ${sold:,.0f}: {addr}")
-        else:
-            print(f"   ❌ Error: {results}")
-    else:
-        print("   ❌ Login failed")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+from src.scrapers.propertyonion_client import PropertyOnionClient
 
 
 # BECA-specific wrapper
@@ -319,6 +30,19 @@ class BECADataExtractor:
         self.client = PropertyOnionClient()
         self.email = po_email
         self.password = po_password
+        # county -> (built_at, {caseNumber: property}) for get_case_details
+        self._case_index: Dict[str, Tuple[float, Dict[str, Dict]]] = {}
+        self._case_index_lock = asyncio.Lock()
+    
+    async def aclose(self):
+        """Close the underlying PropertyOnion client"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.aclose()
     
     async def get_foreclosure_cases(
         self,
@@ -337,8 +61,8 @@ class BECADataExtractor:
         Returns:
             List of cases with BECA-equivalent data
         """
-        # Login to PropertyOnion
-        logged_in = await self.client.login(self.email, self.password)
+        # Login to PropertyOnion (reuses a saved token when still valid)
+        logged_in = await self.client._ensure_auth(self.email, self.password)
         if not logged_in:
             raise Exception("PropertyOnion login failed")
         
@@ -372,41 +96,50 @@ class BECADataExtractor:
         
         return cases
     
-    async def get_case_details(self, case_number: str):
+    async def get_case_details(self, case_number: str, county: str = "Brevard"):
         """Get detailed case information (BECA case lookup equivalent)"""
-        # PropertyOnion doesn't have per-case endpoint
-        # So we search by case number
-        results = await self.client.search_foreclosures(
-            county="Brevard",
-            page=1,
-            page_size=1  # Should return just this case
-        )
-        
-        # Find matching case
-        for prop in results.get("properties", []):
-            if prop.get("caseNumber") == case_number:
-                return prop
+        if not await self.client._ensure_auth(self.email, self.password):
+            raise Exception("PropertyOnion login failed")
         
-        return None
+        # PropertyOnion has no per-case endpoint or case-number filter, so
+        # index the county's foreclosures once and answer lookups from it
+        index = await self._get_case_index(county)
+        return index.get(case_number)
+    
+    async def _get_case_index(self, county: str) -> Dict[str, Dict]:
+        """caseNumber -> property for every foreclosure listing in a county"""
+        async with self._case_index_lock:
+            cached = self._case_index.get(county)
+            if cached and time.monotonic() - cached[0] < self.client.SEARCH_CACHE_TTL:
+                return cached[1]
+            
+            properties = await self.client.get_all_results(
+                county, listing_type="foreclosure-auction", status="all"
+            )
+            index = {p.get("caseNumber"): p for p in properties}
+            self._case_index[county] = (time.monotonic(), index)
+            return index
 
 
 # Usage Example
-async def main():
+async def _demo_beca_extractor():
     """Example usage"""
-    import asyncio
+    email = os.getenv("PO_EMAIL")
+    password = os.getenv("PO_PASSWORD")
+    if not email or not password:
+        print("Set PO_EMAIL and PO_PASSWORD to run the BECA extractor demo")
+        return
     
     # Initialize with PropertyOnion credentials
-    extractor = BECADataExtractor(
-        po_email="Ms@property360re.com",
-        po_password="Builder1"
-    )
+    extractor = BECADataExtractor(po_email=email, po_password=password)
     
     # Get Dec 17 auction cases
-    cases = await extractor.get_foreclosure_cases(
-        county="Brevard",
-        auction_date="2025-12-17",
-        status="all"
-    )
+    async with extractor:
+        cases = await extractor.get_foreclosure_cases(
+            county="Brevard",
+            auction_date="2025-12-17",
+            status="all"
+        )
     
     print(f"Found {len(cases)} cases for Dec 17 auction")
     
@@ -418,5 +151,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    asyncio.run(_demo_beca_extractor())
@@ -23,16 +23,25 @@ Version: 2.0
 
 import os
 import re
+import csv
 import time
 import json
 import logging
+import functools
+import shutil
 import requests
 import hashlib
+import threading
+import queue
+import sqlite3
+import zlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple, Any
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Tuple, Any, Callable
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # Selenium imports
 from selenium import webdriver
@@ -42,16 +51,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException,
-    StaleElementReferenceException,
     WebDriverException
 )
 from selenium.webdriver.common.action_chains import ActionChains
 
-# PDF extraction
-import pdfplumber
-
-# Data handling
-import pandas as pd
+# PDF extraction: PyMuPDF (C, fast plain-text) when installed, else pdfplumber
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    import pdfplumber
 
 # Optional: Supabase integration
 try:
@@ -86,9 +96,25 @@ OUTPUT_DIR = Path('./beca_output')
 PDF_DIR = OUTPUT_DIR / 'pdfs'
 LOG_DIR = OUTPUT_DIR / 'logs'
 DATA_DIR = OUTPUT_DIR / 'data'
+PDF_CACHE_DIR = DATA_DIR / 'pdf_text_cache'
+EXTRACTION_CACHE_DB = DATA_DIR / 'extraction_cache.db'
+# Whole case results are reused only this long: sales get rescheduled or
+# cancelled, so older results are scraped again for a fresh auction date/status
+CASE_RESULT_TTL_HOURS = float(os.environ.get('BECA_RESULT_TTL_HOURS', '12'))
+# BECA cookies from the last accepted disclaimer, restored to skip it next time
+BECA_COOKIE_FILE = DATA_DIR / 'beca_cookies.json'
+
+# Browser left running by a reuse_session scraper, for the next run to attach to
+BECA_SESSION_FILE = Path(os.environ.get('BECA_SESSION_FILE', Path.home() / '.beca_session.json'))
+
+# PDFs are streamed to disk in chunks of this size rather than buffered whole
+PDF_CHUNK_SIZE = 1 << 16
+
+# Rows per Supabase upsert (well under the request size limit)
+SUPABASE_BATCH_SIZE = 250
 
 # Create directories
-for d in [OUTPUT_DIR, PDF_DIR, LOG_DIR, DATA_DIR]:
+for d in [OUTPUT_DIR, PDF_DIR, LOG_DIR, DATA_DIR, PDF_CACHE_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 # Logging configuration
@@ -102,34 +128,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger('BECAScraper')
 
+# Browser identity shared by Chrome and the PDF download session
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# One keep-alive session for every PDF download; Selenium cookies are copied in
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
 # ============================================================================
 # REGEX PATTERNS - 12 PATTERNS (2x Manus AI)
 # ============================================================================
 
-JUDGMENT_PATTERNS = [
-    # Priority 1: Exact matches for total judgment
-    (r'Total\s+Estimated\s+Value\s+of\s+Claim[:\s]+\$?([\d,]+\.?\d*)', 'total_estimated_value', 100),
-    (r'TOTAL\s+JUDGMENT\s+AMOUNT[:\s]+\$?([\d,]+\.?\d*)', 'total_judgment_amount', 100),
-    (r'GRAND\s+TOTAL[:\s]+\$?([\d,]+\.?\d*)', 'grand_total', 95),
-    
-    # Priority 2: Common final judgment patterns
-    (r'Total\s+Amount\s+Due[:\s]+\$?([\d,]+\.?\d*)', 'total_amount_due', 90),
-    (r'Final\s+Judgment\s+Amount[:\s]+\$?([\d,]+\.?\d*)', 'final_judgment_amount', 90),
-    (r'TOTAL\s+DUE\s+TO\s+PLAINTIFF[:\s]+\$?([\d,]+\.?\d*)', 'total_due_plaintiff', 90),
-    
-    # Priority 3: Subtotal patterns
-    (r'(?:^|\n)\s*TOTAL[:\s]+\$?([\d,]+\.?\d*)', 'generic_total', 80),
-    (r'Total\s+Indebtedness[:\s]+\$?([\d,]+\.?\d*)', 'total_indebtedness', 85),
-    (r'Sum\s+Total[:\s]+\$?([\d,]+\.?\d*)', 'sum_total', 85),
-    
-    # Priority 4: Component patterns (use max as fallback)
-    (r'Principal\s+(?:Balance|Due|and\s+Interest)[:\s]+\$?([\d,]+\.?\d*)', 'principal', 70),
-    (r'Unpaid\s+Principal\s+Balance[:\s]+\$?([\d,]+\.?\d*)', 'unpaid_principal', 70),
-    
-    # Priority 5: Generic large dollar amount (last resort)
-    (r'\$\s?([\d,]{6,}\.?\d{0,2})', 'large_amount_fallback', 50),
+# Labelled amount patterns, scanned together as MASTER_RE
+PRIMARY_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE | re.MULTILINE), method, priority)
+    for pattern, method, priority in [
+        # Priority 1: Exact matches for total judgment
+        (r'Total\s+Estimated\s+Value\s+of\s+Claim[:\s]+\$?([\d,]+\.?\d*)', 'total_estimated_value', 100),
+        (r'TOTAL\s+JUDGMENT\s+AMOUNT[:\s]+\$?([\d,]+\.?\d*)', 'total_judgment_amount', 100),
+        (r'GRAND\s+TOTAL[:\s]+\$?([\d,]+\.?\d*)', 'grand_total', 95),
+
+        # Priority 2: Common final judgment patterns
+        (r'Total\s+Amount\s+Due[:\s]+\$?([\d,]+\.?\d*)', 'total_amount_due', 90),
+        (r'Final\s+Judgment\s+Amount[:\s]+\$?([\d,]+\.?\d*)', 'final_judgment_amount', 90),
+        (r'TOTAL\s+DUE\s+TO\s+PLAINTIFF[:\s]+\$?([\d,]+\.?\d*)', 'total_due_plaintiff', 90),
+
+        # Priority 3: Subtotal patterns
+        (r'(?:^|\n)\s*TOTAL[:\s]+\$?([\d,]+\.?\d*)', 'generic_total', 80),
+        (r'Total\s+Indebtedness[:\s]+\$?([\d,]+\.?\d*)', 'total_indebtedness', 85),
+        (r'Sum\s+Total[:\s]+\$?([\d,]+\.?\d*)', 'sum_total', 85),
+
+        # Priority 4: Component patterns (use max as fallback)
+        (r'Principal\s+(?:Balance|Due|and\s+Interest)[:\s]+\$?([\d,]+\.?\d*)', 'principal', 70),
+        (r'Unpaid\s+Principal\s+Balance[:\s]+\$?([\d,]+\.?\d*)', 'unpaid_principal', 70),
+    ]
+]
+
+# Loose patterns that match many incidental amounts; they rank below every
+# primary pattern, so they only run when all primary patterns miss
+FALLBACK_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE | re.MULTILINE), method, priority)
+    for pattern, method, priority in [
+        # Priority 5: Generic large dollar amount (last resort)
+        (r'\$\s?([\d,]{6,}\.?\d{0,2})', 'large_amount_fallback', 50),
+    ]
+]
+
+JUDGMENT_PATTERNS = PRIMARY_PATTERNS + FALLBACK_PATTERNS
+
+# Primary patterns unioned into one scan, highest priority first. The lookahead
+# keeps matches zero-width so patterns that overlap are each still found.
+MASTER_RE = re.compile(
+    '(?=' + '|'.join(
+        f'(?P<p{i}>{PRIMARY_PATTERNS[i][0].pattern})'
+        for i in sorted(range(len(PRIMARY_PATTERNS)), key=lambda i: -PRIMARY_PATTERNS[i][2])
+    ) + ')',
+    re.IGNORECASE | re.MULTILINE
+)
+# (method, priority, amount group) for each MASTER_RE branch p<i>
+META = [
+    (method, priority, MASTER_RE.groupindex[f'p{i}'] + 1)
+    for i, (_, method, priority) in enumerate(PRIMARY_PATTERNS)
 ]
 
+# A plausible amount from a pattern this confident ends PDF extraction early
+# (trades a possibly larger same-priority amount on a later page for speed;
+# BECA_PDF_FULL_PARSE=1 reads every page and re-parses early-stopped entries)
+EARLY_STOP_PRIORITY = 100
+PDF_EARLY_STOP = os.environ.get('BECA_PDF_FULL_PARSE') != '1'
+
+# Last-resort scan when no labelled pattern yields a plausible amount
+FALLBACK_AMOUNT_RE = re.compile(r'\$?\s*([\d,]{6,}\.?\d*)')
+
 # Document type priority (higher = better)
 DOCUMENT_PRIORITY = {
     'AMENDED FINAL JUDGMENT': 100,
@@ -145,11 +225,123 @@ DOCUMENT_PRIORITY = {
     'VERIFIED COMPLAINT': 40,
 }
 
+ZIP_CODE_RE = re.compile(r'\d{5}(-\d{4})?')
+
+# ============================================================================
+# PAGE LOCATORS
+# ============================================================================
+
+# Case number input names - vary across BECA versions, tried in order
+CASE_FIELD_MAPPINGS = (
+    # Standard field names
+    {'year': 'year', 'type': 'court_type', 'seq': 'sequence_no'},
+    # Alternative names
+    {'year': 'CaseNumber2', 'type': 'CaseNumber3', 'seq': 'CaseNumber4'},
+    # Legacy names
+    {'year': 'case_year', 'type': 'case_type', 'seq': 'case_seq'},
+)
+SEARCH_BUTTON_XPATH = "//input[@type='submit' or @name='search' or @value='Search']"
+RESULTS_TABLE_XPATH = "//table[contains(@class, 'result') or contains(@id, 'result')]"
+
+# Case page fields
+PLAINTIFF_XPATHS = (
+    "//td[contains(text(), 'PLAINTIFF')]/following-sibling::td[1]",
+    "//tr[contains(., 'PLAINTIFF')]//td[2]",
+    "//*[contains(@class, 'plaintiff')]",
+)
+DEFENDANT_XPATH = "//td[contains(text(), 'DEFENDANT')]/following-sibling::td[1]"
+# Look in defendant rows or specific address fields
+ADDRESS_XPATHS = (
+    "//td[contains(text(), 'DEFENDANT')]/following-sibling::td[last()]",
+    "//*[contains(text(), 'Property') or contains(text(), 'ADDRESS')]",
+    "//td[contains(text(), ', FL ')]",
+)
+CASE_STATUS_XPATH = "//*[contains(text(), 'DISPOSED') or contains(text(), 'OPEN')]"
+FILING_DATE_XPATH = "//td[contains(text(), 'Filing Date')]/following-sibling::td[1]"
+
+# Register of Actions rows naming one of the DOCUMENT_PRIORITY types (matched
+# case-insensitively, as the row text is uppercased), and their links
+_ROW_TEXT_UPPER = (
+    "translate(normalize-space(.), 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')"
+)
+# Types containing another type (e.g. AMENDED FINAL JUDGMENT) need no test of their own
+_ROW_TYPE_TERMS = [
+    doc_type for doc_type in DOCUMENT_PRIORITY
+    if not any(other != doc_type and other in doc_type for other in DOCUMENT_PRIORITY)
+]
+DOCUMENT_ROW_XPATH = (
+    "//table//tr[(contains(., 'JUDGMENT') or contains(., 'AFFIDAVIT') "
+    "or contains(., 'MORTGAGE') or contains(., 'WORKSHEET')) and ("
+    + " or ".join(f"contains({_ROW_TEXT_UPPER}, '{term}')" for term in _ROW_TYPE_TERMS)
+    + ")]"
+)
+DOCUMENT_LINK_XPATH = ".//a[contains(@href, 'View') or contains(@href, 'document') or contains(@href, 'Image')]"
+
+# Court Schedule rows for the foreclosure sale
+SALE_ROW_XPATHS = (
+    "//tr[contains(., 'FORECLOSURE SALE')]",
+    "//tr[contains(., 'SALE DATE')]",
+    "//tr[contains(., 'AUCTION')]",
+)
+
+# Case page fields read by extract_party_info, each a tuple of XPaths in
+# fallback order
+PARTY_XPATHS = {
+    'plaintiff': PLAINTIFF_XPATHS,
+    'defendants': (DEFENDANT_XPATH,),
+    'property_address': ADDRESS_XPATHS,
+    'case_status': (CASE_STATUS_XPATH,),
+    'filing_date': (FILING_DATE_XPATH,),
+}
+
+# Scripts that read many elements in one WebDriver round trip instead of
+# one find_element/.text call each.
+# {key: [xpath, ...]} -> {key: [[text of each match], ...]}
+XPATH_TEXTS_JS = '''
+const snapshot = xpath => document.evaluate(
+    xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = {};
+for (const [key, xpaths] of Object.entries(arguments[0])) {
+    out[key] = xpaths.map(xpath => {
+        const found = snapshot(xpath);
+        const texts = [];
+        for (let i = 0; i < found.snapshotLength; i++) {
+            texts.push(found.snapshotItem(i).innerText || '');
+        }
+        return texts;
+    });
+}
+return out;
+'''
+# (row xpath, link xpath, [[doc_type, priority], ...] highest first) ->
+# [{doc_type: first type named in the row or null, priority, cells: [td text],
+#   link: element or null}]
+DOCUMENT_ROWS_JS = '''
+const rows = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+    const row = rows.snapshotItem(i);
+    const text = (row.innerText || '').toUpperCase();
+    const match = arguments[2].find(([docType]) => text.includes(docType));
+    const link = document.evaluate(
+        arguments[1], row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    out.push({
+        doc_type: match ? match[0] : null,
+        priority: match ? match[1] : 0,
+        cells: Array.from(row.querySelectorAll('td'), td => td.innerText || ''),
+        link: link
+    });
+}
+return out;
+'''
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CaseResult:
     """Structured result for a single case extraction."""
     case_number: str
@@ -176,10 +368,10 @@ class CaseResult:
             self.errors = []
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {k: getattr(self, k) for k in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentInfo:
     """Information about a court document."""
     doc_type: str
@@ -190,6 +382,542 @@ class DocumentInfo:
     page_count: Optional[int] = None
 
 
+# ============================================================================
+# PDF EXTRACTION
+# ============================================================================
+
+def _page_texts(pdf_path: Path):
+    """Yield (page_count, page_text) lazily, via PyMuPDF or pdfplumber."""
+    if PYMUPDF_AVAILABLE:
+        with pymupdf.open(pdf_path) as doc:
+            for page in doc:
+                yield doc.page_count, page.get_text('text')
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                yield len(pdf.pages), page.extract_text()
+
+
+def extract_pdf_text(pdf_path: Path, stop_at_priority: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Extract PDF text page by page (PyMuPDF if available, else pdfplumber).
+    
+    With stop_at_priority, stop after the first page holding a plausible
+    judgment amount from a pattern of at least that priority. This is a
+    speed/accuracy trade-off: no later page can beat that priority, but
+    find_judgment_amount breaks priority ties by the larger amount, so a
+    bigger equal-priority total on a later page is missed.
+    
+    Returns:
+        Tuple of (full_text, complete), complete False if pages were skipped
+    """
+    full_text = ""
+    for i, (page_count, text) in enumerate(_page_texts(pdf_path)):
+        if text:
+            full_text += f"\n--- Page {i+1} ---\n{text}"
+            if stop_at_priority is not None and i + 1 < page_count and any(
+                c[2] >= stop_at_priority for c in _judgment_candidates(text)
+            ):
+                logger.debug(f"  Confident amount on page {i+1}/{page_count}, stopping")
+                return full_text, False
+    return full_text, True
+
+
+def _plausible_amount(amount_str: str) -> Optional[float]:
+    """Parse a matched amount; None unless it's a realistic judgment."""
+    try:
+        amount = float(amount_str.replace(',', '').replace('$', '').strip())
+    except ValueError:
+        return None
+    
+    # Sanity check: realistic judgment range
+    return amount if 10000 <= amount <= 5000000 else None
+
+
+def _judgment_candidates(text: str):
+    """Yield (amount, method, priority, -pattern_index) for every plausible amount."""
+    found = False
+    
+    # Apply all primary patterns in a single pass
+    for match in MASTER_RE.finditer(text):
+        index = int(match.lastgroup[1:])
+        method, priority, group = META[index]
+        amount = _plausible_amount(match.group(group))
+        if amount is not None:
+            found = True
+            yield amount, method, priority, -index
+    
+    if found:
+        return
+    
+    for index, (pattern, method, priority) in enumerate(FALLBACK_PATTERNS, len(PRIMARY_PATTERNS)):
+        for match in pattern.finditer(text):
+            amount = _plausible_amount(match.group(1))
+            if amount is not None:
+                yield amount, method, priority, -index
+
+
+def find_judgment_amount(text: str) -> Tuple[Optional[float], str, int]:
+    """
+    Pick the best judgment amount from extracted PDF text.
+    
+    Returns:
+        Tuple of (amount, extraction_method, confidence_score)
+    """
+    # Keep the best by priority, then by amount (prefer higher priority, then
+    # higher amount); equal candidates go to the pattern listed first in
+    # JUDGMENT_PATTERNS
+    best = None
+    for amount, method, priority, order in _judgment_candidates(text):
+        logger.debug(f"  Found: ${amount:,.2f} via {method}")
+        if best is None or (priority, amount, order) > (best[2], best[0], best[3]):
+            best = (amount, method, priority, order)
+    
+    if best is not None:
+        return best[:3]
+    
+    # Fallback: find maximum large number
+    best_amount = None
+    for amt_str in FALLBACK_AMOUNT_RE.findall(text):
+        try:
+            amount = float(amt_str.replace(',', ''))
+        except ValueError:
+            continue
+        if 10000 <= amount <= 5000000 and (best_amount is None or amount > best_amount):
+            best_amount = amount
+    
+    if best_amount is None:
+        return None, 'not_found', 0
+    return best_amount, 'fallback_max', 30
+
+
+def pdf_digest(pdf_path: Path) -> str:
+    """SHA-256 of a PDF's bytes, used to key the PDF cache."""
+    return hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+
+
+# Bump when cached entries change meaning; older entries are re-extracted
+PDF_CACHE_VERSION = 2
+
+
+@functools.lru_cache(maxsize=512)
+def _read_cached_extraction(digest: str) -> Dict:
+    with open(PDF_CACHE_DIR / f'{digest}.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_cached_extraction(digest: str) -> Optional[Dict]:
+    """Return the cached {'version', 'text', 'result', 'complete'} for a PDF digest, if any."""
+    if not (PDF_CACHE_DIR / f'{digest}.json').exists():
+        return None
+    cached = _read_cached_extraction(digest)
+    if cached.get('version') != PDF_CACHE_VERSION:
+        return None
+    return cached
+
+
+def store_cached_extraction(
+    digest: str,
+    text: str,
+    result: Tuple[Optional[float], str, int],
+    complete: bool = True
+):
+    """
+    Persist extracted text and the judgment result for a PDF digest.
+    
+    complete=False marks an early-stopped extraction, which a full parse
+    replaces.
+    """
+    path = PDF_CACHE_DIR / f'{digest}.json'
+    replacing = path.exists()
+    tmp_path = path.with_name(f'{digest}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': PDF_CACHE_VERSION, 'text': text,
+            'result': list(result), 'complete': complete
+        }, f)
+    os.replace(tmp_path, path)
+    if replacing:
+        # Drop the superseded entry from the in-process read cache
+        _read_cached_extraction.cache_clear()
+
+
+def extract_pdf(pdf_path: str, early_stop: bool = PDF_EARLY_STOP) -> Tuple[str, Tuple[Optional[float], str, int]]:
+    """
+    Extract text and the best judgment amount from a PDF, via the PDF cache.
+    
+    Top-level (picklable) so it can run in a ProcessPoolExecutor worker;
+    text extraction is CPU-bound (pdfplumber entirely so), so threads
+    would serialize on the GIL.
+    
+    Args:
+        pdf_path: PDF to extract
+        early_stop: Stop at the first page with an EARLY_STOP_PRIORITY
+            amount (see extract_pdf_text); False reads every page and
+            re-parses cached early-stopped extractions
+    
+    Returns:
+        Tuple of (full_text, (amount, extraction_method, confidence_score))
+    """
+    digest = pdf_digest(pdf_path)
+    cached = load_cached_extraction(digest)
+    if cached is not None and (early_stop or cached['complete']):
+        logger.debug(f"  PDF seen before ({digest[:12]}), reusing extraction")
+        return cached['text'], tuple(cached['result'])
+    
+    full_text, complete = extract_pdf_text(
+        pdf_path, stop_at_priority=EARLY_STOP_PRIORITY if early_stop else None
+    )
+    result = find_judgment_amount(full_text) if full_text else (None, 'no_text', 0)
+    store_cached_extraction(digest, full_text, result, complete)
+    return full_text, result
+
+
+def extract_pdf_amount(pdf_path: str) -> Tuple[Optional[float], str, int]:
+    """extract_pdf without the text, so workers don't ship it back."""
+    return extract_pdf(pdf_path)[1]
+
+
+def _extract_pdf_result(pdf_path: str) -> Tuple[Optional[float], str, int]:
+    """Worker entry point for batch extraction; errors become an 'error' result."""
+    try:
+        return extract_pdf_amount(pdf_path)
+    except Exception as e:
+        logger.error(f"❌ PDF extraction error ({pdf_path}): {e}")
+        return None, 'error', 0
+
+
+# ============================================================================
+# BROWSER SETUP
+# ============================================================================
+
+@functools.lru_cache(maxsize=1)
+def find_chromedriver() -> str:
+    """Find ChromeDriver executable (looked up once per process)."""
+    # Check environment variable first
+    if os.path.exists(CHROMEDRIVER_PATH):
+        return CHROMEDRIVER_PATH
+    
+    # Check alternative paths
+    for path in CHROMEDRIVER_PATHS:
+        if os.path.exists(path):
+            logger.info(f"Found ChromeDriver at: {path}")
+            return path
+    
+    # Try system PATH
+    chromedriver = shutil.which('chromedriver')
+    if chromedriver:
+        logger.info(f"Found ChromeDriver in PATH: {chromedriver}")
+        return chromedriver
+    
+    raise FileNotFoundError(
+        "ChromeDriver not found. Please install it or set CHROMEDRIVER_PATH environment variable.\n"
+        "Download from: https://googlechromelabs.github.io/chrome-for-testing/"
+    )
+
+
+class AttachedWebDriver(webdriver.Remote):
+    """
+    WebDriver bound to a browser session another process started.
+    
+    Skips the new-session handshake and adopts the saved session id, so
+    a short run can pick up a warm Chrome instead of cold-starting one.
+    """
+    
+    def __init__(self, command_executor: str, session_id: str):
+        self._attach_session_id = session_id
+        super().__init__(command_executor=command_executor, options=webdriver.ChromeOptions())
+    
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = self._attach_session_id
+        self.caps = {}
+
+
+def save_browser_session(driver: webdriver.Chrome, path: Path = BECA_SESSION_FILE):
+    """Record a driver's endpoint and session id for attach_browser_session."""
+    with open(path, 'w') as f:
+        json.dump({'url': driver.service.service_url, 'sid': driver.session_id}, f)
+
+
+def attach_browser_session(path: Path = BECA_SESSION_FILE) -> Optional[AttachedWebDriver]:
+    """Attach to the browser recorded in path; None if it's gone."""
+    try:
+        with open(path) as f:
+            saved = json.load(f)
+        driver = AttachedWebDriver(saved['url'], saved['sid'])
+        driver.current_url  # Probe: raises if the session has ended
+        return driver
+    except Exception as e:
+        logger.info(f"No reusable browser session ({type(e).__name__}), starting a new one")
+        return None
+
+
+# ============================================================================
+# WEBDRIVER POOL
+# ============================================================================
+
+class WebDriverPool:
+    """
+    Fixed set of pre-warmed WebDrivers shared by worker threads.
+    
+    Browsers are started (and prepared, e.g. taken past the BECA
+    disclaimers) once on entry and reused for every case, so a batch pays
+    Chrome's cold start per worker rather than per case.
+    """
+    
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome],
+        size: Optional[int] = None,
+        prepare: Optional[Callable[[webdriver.Chrome], bool]] = None
+    ):
+        """
+        Args:
+            factory: Starts a new WebDriver
+            size: Number of browsers (default: min(4, CPU count))
+            prepare: Readies a new browser; a False return discards it
+        """
+        self.factory = factory
+        self.size = size or min(4, os.cpu_count() or 1)
+        self.prepare = prepare
+        self.drivers: List[webdriver.Chrome] = []
+        self._idle: queue.Queue = queue.Queue()
+    
+    def _start_driver(self) -> Optional[webdriver.Chrome]:
+        driver = self.factory()
+        if self.prepare and not self.prepare(driver):
+            driver.quit()
+            return None
+        return driver
+    
+    def start(self) -> 'WebDriverPool':
+        """Start all browsers concurrently."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._start_driver) for _ in range(self.size)]
+            for future in as_completed(futures):
+                try:
+                    driver = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ WebDriver start failed: {e}")
+                    continue
+                if driver:
+                    self.drivers.append(driver)
+                    self._idle.put(driver)
+        
+        if not self.drivers:
+            raise RuntimeError("No WebDriver in the pool could be started")
+        
+        logger.info(f"✅ WebDriver pool ready ({len(self.drivers)}/{self.size})")
+        return self
+    
+    def acquire(self) -> webdriver.Chrome:
+        """Take an idle browser, waiting for one if all are busy."""
+        return self._idle.get()
+    
+    def release(self, driver: webdriver.Chrome, reset_cookies: bool = False):
+        """
+        Return a browser to the pool.
+        
+        The authenticated BECA session is kept unless reset_cookies is set.
+        """
+        if reset_cookies:
+            driver.delete_all_cookies()
+        self._idle.put(driver)
+    
+    def close(self):
+        """Quit every browser in the pool."""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers.clear()
+    
+    def __enter__(self) -> 'WebDriverPool':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# SUPABASE BATCH WRITER
+# ============================================================================
+
+class SupabaseBatchWriter:
+    """
+    Background thread that upserts rows into a Supabase table in batches.
+    
+    Rows are queued as cases finish and written batch_size at a time (or
+    after flush_interval seconds idle), so scraping never waits on a
+    per-row round trip.
+    """
+    
+    def __init__(
+        self,
+        client: Any,
+        table: str,
+        on_conflict: str = 'case_number',
+        batch_size: int = SUPABASE_BATCH_SIZE,
+        flush_interval: float = 5.0,
+        max_retries: int = 3
+    ):
+        self.client = client
+        self.table = table
+        self.on_conflict = on_conflict
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f'supabase-{table}', daemon=True)
+        self._thread.start()
+    
+    def put(self, row: Dict):
+        """Queue a row for the next batch."""
+        self._queue.put(row)
+    
+    def close(self):
+        """Write any queued rows and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _run(self):
+        batch = []
+        while True:
+            try:
+                row = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Idle: write what we have rather than holding it
+                if batch:
+                    self._flush(batch)
+                    batch = []
+                continue
+            
+            if row is None:
+                break
+            
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        
+        if batch:
+            self._flush(batch)
+    
+    def _flush(self, batch: List[Dict]):
+        # One upsert can't touch the same key twice; keep each key's latest row
+        rows = list({row[self.on_conflict]: row for row in batch}.values())
+        
+        for attempt in range(self.max_retries):
+            try:
+                self.client.table(self.table).upsert(rows, on_conflict=self.on_conflict).execute()
+                self.written += len(rows)
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Supabase upsert attempt {attempt + 1} failed: {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(2 ** attempt)
+        
+        logger.warning(f"⚠️ Supabase save failed for {len(rows)} rows")
+
+
+# ============================================================================
+# EXTRACTION CACHE
+# ============================================================================
+
+class ExtractionCache:
+    """
+    SQLite record of judgment amounts already extracted, keyed by
+    (case_number, doc_number), so re-runs skip the download and PDF work
+    for documents seen before. Clerk document numbers identify a filed
+    document, so a hit is trusted without re-fetching the PDF.
+    
+    Successful CaseResults are also kept whole, keyed by case_number, so
+    re-runs within CASE_RESULT_TTL_HOURS can skip those cases entirely.
+    
+    One connection is shared by all worker threads (WAL mode, serialized
+    by a lock).
+    """
+    
+    def __init__(self, path: Path = EXTRACTION_CACHE_DB):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS cases ('
+                'case_number TEXT, doc_number TEXT, judgment_amount REAL, '
+                'extraction_method TEXT, confidence INTEGER, pdf_sha256 TEXT, '
+                'pdf_path TEXT, extracted_at TEXT, '
+                'PRIMARY KEY (case_number, doc_number))'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS case_results ('
+                'case_number TEXT PRIMARY KEY, result TEXT, extracted_at TEXT)'
+            )
+            # Databases from before the TTL lack extracted_at; their rows read as expired
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(case_results)')}
+            if 'extracted_at' not in columns:
+                self._conn.execute('ALTER TABLE case_results ADD COLUMN extracted_at TEXT')
+            self._conn.commit()
+    
+    def get(self, case_number: str, doc_number: str) -> Optional[Tuple[float, str, int, Optional[str]]]:
+        """Return (amount, method, confidence, pdf_path) for a document, if cached."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT judgment_amount, extraction_method, confidence, pdf_path '
+                'FROM cases WHERE case_number = ? AND doc_number = ?',
+                (case_number, doc_number)
+            ).fetchone()
+    
+    def put(
+        self,
+        case_number: str,
+        doc_number: str,
+        amount: float,
+        method: str,
+        confidence: int,
+        pdf_sha256: str,
+        pdf_path: str
+    ):
+        """Record a successful extraction."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (case_number, doc_number, amount, method, confidence,
+                 pdf_sha256, pdf_path, datetime.now().isoformat())
+            )
+            self._conn.commit()
+    
+    def get_result(
+        self,
+        case_number: str,
+        max_age_hours: float = CASE_RESULT_TTL_HOURS
+    ) -> Optional[CaseResult]:
+        """Return the stored successful CaseResult for a case, if stored within max_age_hours."""
+        cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result FROM case_results WHERE case_number = ? AND extracted_at >= ?',
+                (case_number, cutoff)
+            ).fetchone()
+        return CaseResult(**json.loads(row[0])) if row else None
+    
+    def put_result(self, result: CaseResult):
+        """Record a successfully scraped case."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO case_results VALUES (?, ?, ?)',
+                (result.case_number, json.dumps(result.to_dict()), datetime.now().isoformat())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 # ============================================================================
 # BECA SCRAPER CLASS
 # ============================================================================
@@ -214,7 +942,11 @@ class BECAScraper:
         supabase_url: Optional[str] = None,
         supabase_key: Optional[str] = None,
         max_retries: int = 3,
-        request_delay: float = 3.0
+        request_delay: float = 3.0,
+        pdf_workers: Optional[int] = None,
+        use_extraction_cache: bool = True,
+        reuse_session: bool = False,
+        debug_text: bool = False
     ):
         """
         Initialize BECA scraper.
@@ -225,13 +957,32 @@ class BECAScraper:
             supabase_key: Supabase API key (optional)
             max_retries: Maximum retry attempts per operation
             request_delay: Delay between requests (rate limiting)
+            pdf_workers: Processes for PDF parsing (default: CPU count)
+            use_extraction_cache: Reuse amounts, and case results younger than
+                CASE_RESULT_TTL_HOURS, from earlier runs
+            reuse_session: Attach to the browser a previous run left open, and
+                leave this one open for the next run (serial scraping only)
+            debug_text: Save each PDF's extracted text beside it as .txt
+                (also enabled by BECA_DEBUG_TEXT=1)
         """
         self.headless = headless
         self.max_retries = max_retries
         self.request_delay = request_delay
+        # Each worker thread drives its own browser (see scrape_cases workers)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
         self.driver = None
         self.session_cookies = None
         self.supabase = None
+        self.pdf_workers = pdf_workers
+        self._pdf_pool = None
+        self._supabase_writer = None
+        self.extraction_cache = ExtractionCache() if use_extraction_cache else None
+        self.reuse_session = reuse_session
+        self._session_reused = False
+        # Index into CASE_FIELD_MAPPINGS of the input names this BECA uses
+        self._field_map_idx = None
+        self.debug_text = debug_text or os.environ.get('BECA_DEBUG_TEXT') == '1'
         
         # Initialize Supabase if credentials provided
         if SUPABASE_AVAILABLE and supabase_url and supabase_key:
@@ -252,37 +1003,140 @@ class BECAScraper:
             'end_time': None
         }
     
-    def _find_chromedriver(self) -> str:
-        """Find ChromeDriver executable."""
-        # Check environment variable first
-        if os.path.exists(CHROMEDRIVER_PATH):
-            return CHROMEDRIVER_PATH
-        
-        # Check alternative paths
-        for path in CHROMEDRIVER_PATHS:
-            if os.path.exists(path):
-                logger.info(f"Found ChromeDriver at: {path}")
-                return path
-        
-        # Try system PATH
-        import shutil
-        chromedriver = shutil.which('chromedriver')
-        if chromedriver:
-            logger.info(f"Found ChromeDriver in PATH: {chromedriver}")
-            return chromedriver
-        
-        raise FileNotFoundError(
-            "ChromeDriver not found. Please install it or set CHROMEDRIVER_PATH environment variable.\n"
-            "Download from: https://googlechromelabs.github.io/chrome-for-testing/"
-        )
+    @property
+    def driver(self) -> Optional[webdriver.Chrome]:
+        """WebDriver used by the current thread."""
+        return getattr(self._local, 'driver', None)
+    
+    @driver.setter
+    def driver(self, driver: Optional[webdriver.Chrome]):
+        self._local.driver = driver
+    
+    def _count(self, key: str, amount=1):
+        """Thread-safe increment of a stats counter."""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    @property
+    def pdf_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for CPU-bound PDF parsing, created on first use."""
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers or os.cpu_count())
+        return self._pdf_pool
+    
+    def close_pdf_pool(self):
+        """Shut down the PDF worker processes, if started."""
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown()
+            self._pdf_pool = None
+    
+    def extract_amounts_from_pdfs(self, pdf_paths: List[Path]) -> List[Tuple[Optional[float], str, int]]:
+        """
+        Extract judgment amounts from many PDFs in parallel worker processes.
+        
+        Returns:
+            List of (amount, extraction_method, confidence_score), in input order
+        """
+        logger.info(f"📖 Extracting {len(pdf_paths)} PDFs across worker processes...")
+        return list(self.pdf_pool.map(
+            _extract_pdf_result, [str(p) for p in pdf_paths], chunksize=4
+        ))
     
     def initialize_driver(self) -> webdriver.Chrome:
         """Initialize Chrome WebDriver with anti-detection measures."""
+        if self.reuse_session:
+            driver = attach_browser_session()
+            if driver:
+                logger.info("♻️ Attached to running browser session")
+                self._session_reused = True
+                self.driver = driver
+                return driver
+        
+        self.driver = self.build_driver()
+        if self.reuse_session:
+            save_browser_session(self.driver)
+        return self.driver
+    
+    def close_driver(self):
+        """Quit this thread's browser, or with reuse_session leave it running."""
+        if not self.driver:
+            return
+        if self.reuse_session:
+            # Keep chromedriver alive past this process for the next run
+            service = getattr(self.driver, 'service', None)
+            if service is not None:
+                service.process = None
+            logger.info("🔓 Leaving browser running for the next run")
+        else:
+            logger.info("🔒 Closing browser...")
+            self.driver.quit()
+        self.driver = None
+    
+    def open_search(self) -> bool:
+        """Reach the case search page, via the disclaimers unless already past them."""
+        if self._session_reused and self.search_page_ready():
+            logger.info("✅ Reused session is past the disclaimers")
+            return True
+        if self.try_restore_session():
+            return True
+        return self.accept_disclaimers()
+    
+    def try_restore_session(self) -> bool:
+        """Load saved BECA cookies; True if they get straight to the search form."""
+        try:
+            with open(BECA_COOKIE_FILE) as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        try:
+            # Cookies can only be added for the site currently loaded
+            self.driver.get(BECA_SPLASH_URL)
+            for c in cookies:
+                self.driver.add_cookie({
+                    k: c[k] for k in ('name', 'value', 'path', 'secure', 'httpOnly', 'expiry') if k in c
+                })
+        except WebDriverException as e:
+            logger.info(f"Saved BECA cookies not usable ({type(e).__name__})")
+            return False
+        
+        if not self.search_page_ready():
+            logger.info("Saved BECA session expired, accepting disclaimers")
+            return False
+        
+        self._sync_session_cookies()
+        logger.info("✅ Restored BECA session from saved cookies")
+        return True
+    
+    def save_session_cookies(self):
+        """Persist this browser's BECA cookies for try_restore_session."""
+        tmp_path = BECA_COOKIE_FILE.with_name(
+            f'{BECA_COOKIE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp'
+        )
+        with open(tmp_path, 'w') as f:
+            json.dump(self.driver.get_cookies(), f)
+        os.replace(tmp_path, BECA_COOKIE_FILE)
+    
+    def search_page_ready(self) -> bool:
+        """True if the case search form loads directly (disclaimers accepted)."""
+        try:
+            self.driver.get(BECA_SEARCH_URL)
+            return any(
+                self.driver.find_elements(By.NAME, fields['year'])
+                for fields in CASE_FIELD_MAPPINGS
+            )
+        except WebDriverException:
+            return False
+    
+    def build_driver(self, page_load_strategy: Optional[str] = None) -> webdriver.Chrome:
+        """Start a new anti-detection Chrome WebDriver and return it."""
         logger.info("🚀 Initializing Chrome WebDriver...")
         
-        chromedriver_path = self._find_chromedriver()
+        chromedriver_path = find_chromedriver()
         
         options = webdriver.ChromeOptions()
+        if page_load_strategy:
+            options.page_load_strategy = page_load_strategy
         
         # Headless mode
         if self.headless:
@@ -299,12 +1153,10 @@ class BECAScraper:
         options.add_argument('--disable-popup-blocking')
         options.add_argument('--start-maximized')
         options.add_argument('--window-size=1920,1080')
+        options.add_argument('--blink-settings=imagesEnabled=false')
         
         # User agent spoofing
-        options.add_argument(
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        options.add_argument(f'--user-agent={USER_AGENT}')
         
         # Exclude automation flags
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -316,16 +1168,21 @@ class BECAScraper:
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
             "plugins.always_open_pdf_externally": True,
-            "safebrowsing.enabled": True
+            "safebrowsing.enabled": True,
+            # Only DOM text and PDF links are read; skip loading page assets
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2
         }
         options.add_experimental_option("prefs", prefs)
         
         # Initialize driver
         service = webdriver.ChromeService(executable_path=chromedriver_path)
-        self.driver = webdriver.Chrome(service=service, options=options)
+        driver = webdriver.Chrome(service=service, options=options)
         
         # Additional anti-detection via JavaScript
-        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
             'source': '''
                 Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
                 Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
@@ -333,12 +1190,14 @@ class BECAScraper:
             '''
         })
         
-        # Set timeouts
-        self.driver.set_page_load_timeout(30)
-        self.driver.implicitly_wait(10)
+        # Set timeouts. No implicit wait: lookups that may legitimately miss
+        # (fallback locators, optional fields) would each stall for it;
+        # pages that need time are awaited explicitly with WebDriverWait
+        driver.set_page_load_timeout(30)
+        driver.implicitly_wait(0)
         
         logger.info("✅ WebDriver initialized successfully")
-        return self.driver
+        return driver
     
     def accept_disclaimers(self) -> bool:
         """Navigate through BECA disclaimers to reach search page."""
@@ -404,9 +1263,8 @@ class BECAScraper:
                     pass
                 
                 # Store session cookies
-                self.session_cookies = {
-                    c['name']: c['value'] for c in self.driver.get_cookies()
-                }
+                self._sync_session_cookies()
+                self.save_session_cookies()
                 
                 logger.info("✅ Disclaimers accepted successfully")
                 return True
@@ -418,6 +1276,13 @@ class BECAScraper:
         logger.error("❌ Failed to accept disclaimers after all retries")
         return False
     
+    def _sync_session_cookies(self):
+        """Copy the browser's cookies into the shared download SESSION."""
+        cookies = self.driver.get_cookies()
+        for c in cookies:
+            SESSION.cookies.set(c['name'], c['value'], domain=c.get('domain', ''), path=c.get('path', '/'))
+        self.session_cookies = {c['name']: c['value'] for c in cookies}
+    
     def search_case(self, year: str, case_type: str, seq_num: str) -> bool:
         """
         Search for a specific case number in BECA.
@@ -440,17 +1305,11 @@ class BECAScraper:
                 
                 # Fill case number fields
                 # Field names vary - try multiple approaches
-                field_mappings = [
-                    # Standard field names
-                    {'year': 'year', 'type': 'court_type', 'seq': 'sequence_no'},
-                    # Alternative names
-                    {'year': 'CaseNumber2', 'type': 'CaseNumber3', 'seq': 'CaseNumber4'},
-                    # Legacy names
-                    {'year': 'case_year', 'type': 'case_type', 'seq': 'case_seq'},
-                ]
-                
                 filled = False
-                for fields in field_mappings:
+                # Last working mapping first; the rest in their usual order
+                order = sorted(range(len(CASE_FIELD_MAPPINGS)), key=lambda i: i != self._field_map_idx)
+                for i in order:
+                    fields = CASE_FIELD_MAPPINGS[i]
                     try:
                         year_field = self.driver.find_element(By.NAME, fields['year'])
                         year_field.clear()
@@ -464,6 +1323,7 @@ class BECAScraper:
                         seq_field.clear()
                         seq_field.send_keys(seq_num)
                         
+                        self._field_map_idx = i
                         filled = True
                         break
                     except NoSuchElementException:
@@ -473,17 +1333,13 @@ class BECAScraper:
                     raise Exception("Could not find case number input fields")
                 
                 # Submit search
-                search_btn = self.driver.find_element(
-                    By.XPATH, "//input[@type='submit' or @name='search' or @value='Search']"
-                )
+                search_btn = self.driver.find_element(By.XPATH, SEARCH_BUTTON_XPATH)
                 search_btn.click()
                 
                 time.sleep(self.request_delay)
                 
                 # Verify results loaded
-                wait.until(EC.presence_of_element_located((
-                    By.XPATH, "//table[contains(@class, 'result') or contains(@id, 'result')]"
-                )))
+                wait.until(EC.presence_of_element_located((By.XPATH, RESULTS_TABLE_XPATH)))
                 
                 logger.info(f"✅ Case {case_id} found")
                 return True
@@ -504,68 +1360,38 @@ class BECAScraper:
         data = {}
         
         try:
-            # Extract plaintiff
-            plaintiff_patterns = [
-                "//td[contains(text(), 'PLAINTIFF')]/following-sibling::td[1]",
-                "//tr[contains(., 'PLAINTIFF')]//td[2]",
-                "//*[contains(@class, 'plaintiff')]",
-            ]
+            # Text of every candidate element, fetched in one round trip
+            found = self.driver.execute_script(XPATH_TEXTS_JS, PARTY_XPATHS)
             
-            for pattern in plaintiff_patterns:
-                try:
-                    elem = self.driver.find_element(By.XPATH, pattern)
-                    if elem.text.strip():
-                        data['plaintiff'] = elem.text.strip()
-                        break
-                except:
-                    continue
+            # Extract plaintiff
+            for texts in found['plaintiff']:
+                if texts and texts[0].strip():
+                    data['plaintiff'] = texts[0].strip()
+                    break
             
             # Extract defendants
-            defendant_cells = self.driver.find_elements(
-                By.XPATH,
-                "//td[contains(text(), 'DEFENDANT')]/following-sibling::td[1]"
-            )
-            defendants = [d.text.strip() for d in defendant_cells if d.text.strip()]
+            defendants = [t.strip() for t in found['defendants'][0] if t.strip()]
             if defendants:
                 data['defendants'] = '; '.join(defendants[:3])  # Limit to 3
             
             # Extract property address
-            # Look in defendant rows or specific address fields
-            address_patterns = [
-                "//td[contains(text(), 'DEFENDANT')]/following-sibling::td[last()]",
-                "//*[contains(text(), 'Property') or contains(text(), 'ADDRESS')]",
-                "//td[contains(text(), ', FL ')]",
-            ]
-            
-            for pattern in address_patterns:
-                try:
-                    elems = self.driver.find_elements(By.XPATH, pattern)
-                    for elem in elems:
-                        text = elem.text.strip()
-                        # Look for Florida address pattern
-                        if ', FL ' in text or re.search(r'\d{5}(-\d{4})?', text):
-                            data['property_address'] = text
-                            break
-                except:
-                    continue
+            for texts in found['property_address']:
+                for text in texts:
+                    text = text.strip()
+                    # Look for Florida address pattern
+                    if ', FL ' in text or ZIP_CODE_RE.search(text):
+                        data['property_address'] = text
+                        break
             
             # Extract case status
-            try:
-                status_elem = self.driver.find_element(
-                    By.XPATH, "//*[contains(text(), 'DISPOSED') or contains(text(), 'OPEN')]"
-                )
-                data['case_status'] = status_elem.text.strip()
-            except:
-                pass
+            status_texts = found['case_status'][0]
+            if status_texts:
+                data['case_status'] = status_texts[0].strip()
             
             # Extract filing date
-            try:
-                date_elem = self.driver.find_element(
-                    By.XPATH, "//td[contains(text(), 'Filing Date')]/following-sibling::td[1]"
-                )
-                data['filing_date'] = date_elem.text.strip()
-            except:
-                pass
+            date_texts = found['filing_date'][0]
+            if date_texts:
+                data['filing_date'] = date_texts[0].strip()
             
             logger.info(f"✅ Extracted: {data.get('plaintiff', 'N/A')[:40]}...")
             return data
@@ -602,49 +1428,38 @@ class BECAScraper:
                     pass
             
             # Find all document rows
-            doc_rows = self.driver.find_elements(
-                By.XPATH, "//table//tr[contains(., 'JUDGMENT') or contains(., 'AFFIDAVIT') or contains(., 'MORTGAGE') or contains(., 'WORKSHEET')]"
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.XPATH, DOCUMENT_ROW_XPATH))
+                )
+            except TimeoutException:
+                pass
+            # Document type, cell text and view link of every row in one round trip
+            doc_rows = self.driver.execute_script(
+                DOCUMENT_ROWS_JS, DOCUMENT_ROW_XPATH, DOCUMENT_LINK_XPATH,
+                list(DOCUMENT_PRIORITY.items())
             )
             
             for row in doc_rows:
-                try:
-                    row_text = row.text.upper()
-                    
-                    # Check against priority document types
-                    for doc_type, priority in DOCUMENT_PRIORITY.items():
-                        if doc_type in row_text:
-                            # Find the view/download link
-                            try:
-                                link = row.find_element(
-                                    By.XPATH, ".//a[contains(@href, 'View') or contains(@href, 'document') or contains(@href, 'Image')]"
-                                )
-                                
-                                # Extract document number and date
-                                cells = row.find_elements(By.TAG_NAME, 'td')
-                                doc_date = cells[0].text.strip() if cells else ''
-                                doc_num = ''
-                                for cell in cells:
-                                    if cell.text.strip().isdigit():
-                                        doc_num = cell.text.strip()
-                                        break
-                                
-                                doc_info = DocumentInfo(
-                                    doc_type=doc_type,
-                                    doc_number=doc_num,
-                                    doc_date=doc_date,
-                                    element=link,
-                                    priority=priority
-                                )
-                                documents.append(doc_info)
-                                logger.info(f"  Found: {doc_type} (Priority: {priority})")
-                                
-                            except NoSuchElementException:
-                                continue
-                            
-                            break  # Found matching type for this row
-                            
-                except StaleElementReferenceException:
+                # Rows without a view/download link can't be fetched
+                if row['doc_type'] is None or row['link'] is None:
                     continue
+                doc_type, priority = row['doc_type'], row['priority']
+                
+                # Extract document number and date
+                cells = [cell.strip() for cell in row['cells']]
+                doc_date = cells[0] if cells else ''
+                doc_num = next((cell for cell in cells if cell.isdigit()), '')
+                
+                doc_info = DocumentInfo(
+                    doc_type=doc_type,
+                    doc_number=doc_num,
+                    doc_date=doc_date,
+                    element=row['link'],
+                    priority=priority
+                )
+                documents.append(doc_info)
+                logger.info(f"  Found: {doc_type} (Priority: {priority})")
             
             # Sort by priority (highest first)
             documents.sort(key=lambda x: x.priority, reverse=True)
@@ -663,6 +1478,53 @@ class BECAScraper:
         """
         logger.info(f"📥 Downloading PDF: {doc_info.doc_type}...")
         
+        pdf_url = self.resolve_pdf_url(doc_info)
+        if not pdf_url:
+            return None
+        
+        try:
+            # Download PDF over the shared session with this browser's cookies
+            # (the viewer may issue new ones, and pooled browsers differ)
+            with SESSION.get(pdf_url, cookies=self._driver_cookies(), timeout=30, stream=True) as response:
+                if response.status_code == 200:
+                    return self._save_pdf(pdf_url, response.iter_content(PDF_CHUNK_SIZE))
+                else:
+                    logger.warning(f"⚠️ PDF download failed: HTTP {response.status_code}")
+                    return None
+                
+        except Exception as e:
+            logger.warning(f"⚠️ PDF download error: {e}")
+            return None
+    
+    def _driver_cookies(self) -> Dict[str, str]:
+        """Current cookies of this thread's browser, as a plain dict."""
+        return {c['name']: c['value'] for c in self.driver.get_cookies()}
+    
+    def _save_pdf(self, pdf_url: str, chunks) -> Path:
+        """Stream downloaded PDF chunks to a unique file in PDF_DIR."""
+        # Generate unique filename
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"judgment_{timestamp}_{zlib.crc32(pdf_url.encode()):08x}.pdf"
+        pdf_path = PDF_DIR / filename
+        
+        # Write to a .part file so a failed download never looks complete
+        part_path = pdf_path.with_suffix('.part')
+        try:
+            with open(part_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, pdf_path)
+        
+        logger.info(f"✅ PDF saved: {pdf_path.name}")
+        self._count('pdfs_downloaded')
+        
+        return pdf_path
+    
+    def resolve_pdf_url(self, doc_info: DocumentInfo) -> Optional[str]:
+        """Open a document in the viewer and return the URL of its PDF."""
         original_window = self.driver.current_window_handle
         
         try:
@@ -703,33 +1565,10 @@ class BECAScraper:
                 return None
             
             logger.info(f"  PDF URL: {pdf_url[:80]}...")
-            
-            # Download PDF with session cookies
-            session = requests.Session()
-            for cookie in self.driver.get_cookies():
-                session.cookies.set(cookie['name'], cookie['value'])
-            
-            response = session.get(pdf_url, timeout=30)
-            
-            if response.status_code == 200:
-                # Generate unique filename
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"judgment_{timestamp}_{hashlib.md5(pdf_url.encode()).hexdigest()[:8]}.pdf"
-                pdf_path = PDF_DIR / filename
-                
-                with open(pdf_path, 'wb') as f:
-                    f.write(response.content)
-                
-                logger.info(f"✅ PDF saved: {pdf_path.name}")
-                self.stats['pdfs_downloaded'] += 1
-                
-                return pdf_path
-            else:
-                logger.warning(f"⚠️ PDF download failed: HTTP {response.status_code}")
-                return None
+            return pdf_url
                 
         except Exception as e:
-            logger.warning(f"⚠️ PDF download error: {e}")
+            logger.warning(f"⚠️ PDF viewer error: {e}")
             return None
             
         finally:
@@ -743,7 +1582,10 @@ class BECAScraper:
     
     def extract_amount_from_pdf(self, pdf_path: Path) -> Tuple[Optional[float], str, int]:
         """
-        Extract judgment amount from PDF using pdfplumber and regex patterns.
+        Extract judgment amount from PDF text and regex patterns.
+        
+        Parsing runs in the PDF process pool; PDFs whose contents were
+        already processed are answered from the PDF cache without re-parsing.
         
         Returns:
             Tuple of (amount, extraction_method, confidence_score)
@@ -751,64 +1593,31 @@ class BECAScraper:
         logger.info(f"📖 Extracting text from PDF: {pdf_path.name}")
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                
-                # Extract text from all pages
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        full_text += f"\n--- Page {i+1} ---\n{text}"
-                
-                if not full_text:
-                    logger.warning("⚠️ No text extracted from PDF")
-                    return None, 'no_text', 0
+            if self.debug_text:
+                full_text, (amount, method, confidence) = self.pdf_pool.submit(
+                    extract_pdf, str(pdf_path)
+                ).result()
                 
                 # Save debug text file
-                text_file = pdf_path.with_suffix('.txt')
-                with open(text_file, 'w', encoding='utf-8') as f:
-                    f.write(full_text)
-                
-                # Apply regex patterns
-                candidates = []
-                
-                for pattern, method, priority in JUDGMENT_PATTERNS:
-                    matches = re.finditer(pattern, full_text, re.IGNORECASE | re.MULTILINE)
-                    
-                    for match in matches:
-                        try:
-                            amount_str = match.group(1).replace(',', '').replace('$', '').strip()
-                            amount = float(amount_str)
-                            
-                            # Sanity check: realistic judgment range
-                            if 10000 <= amount <= 5000000:
-                                candidates.append((amount, method, priority))
-                                logger.debug(f"  Found: ${amount:,.2f} via {method}")
-                                
-                        except (ValueError, IndexError):
-                            continue
-                
-                if not candidates:
-                    # Fallback: find maximum large number
-                    all_amounts = re.findall(r'\$?\s*([\d,]{6,}\.?\d*)', full_text)
-                    for amt_str in all_amounts:
-                        try:
-                            amount = float(amt_str.replace(',', ''))
-                            if 10000 <= amount <= 5000000:
-                                candidates.append((amount, 'fallback_max', 30))
-                        except:
-                            continue
-                
-                if candidates:
-                    # Sort by priority, then by amount (prefer higher priority, then higher amount)
-                    candidates.sort(key=lambda x: (x[2], x[0]), reverse=True)
-                    best = candidates[0]
-                    
-                    logger.info(f"✅ Judgment amount: ${best[0]:,.2f} ({best[1]}, confidence: {best[2]})")
-                    return best
-                
+                if full_text:
+                    text_file = pdf_path.with_suffix('.txt')
+                    with open(text_file, 'w', encoding='utf-8') as f:
+                        f.write(full_text)
+            else:
+                amount, method, confidence = self.pdf_pool.submit(
+                    extract_pdf_amount, str(pdf_path)
+                ).result()
+            
+            if method == 'no_text':
+                logger.warning("⚠️ No text extracted from PDF")
+                return None, 'no_text', 0
+            
+            if amount is None:
                 logger.warning("⚠️ No valid judgment amount found")
                 return None, 'not_found', 0
+            
+            logger.info(f"✅ Judgment amount: ${amount:,.2f} ({method}, confidence: {confidence})")
+            return amount, method, confidence
                 
         except Exception as e:
             logger.error(f"❌ PDF extraction error: {e}")
@@ -830,13 +1639,7 @@ class BECAScraper:
                 pass
             
             # Find foreclosure sale row
-            sale_patterns = [
-                "//tr[contains(., 'FORECLOSURE SALE')]",
-                "//tr[contains(., 'SALE DATE')]",
-                "//tr[contains(., 'AUCTION')]",
-            ]
-            
-            for pattern in sale_patterns:
+            for pattern in SALE_ROW_XPATHS:
                 try:
                     sale_row = self.driver.find_element(By.XPATH, pattern)
                     cells = sale_row.find_elements(By.TAG_NAME, 'td')
@@ -858,7 +1661,7 @@ class BECAScraper:
             logger.warning(f"⚠️ Auction date extraction error: {e}")
             return None, None
     
-    def scrape_case(self, year: str, case_type: str, seq_num: str) -> CaseResult:
+    def scrape_case(self, year: str, case_type: str, seq_num: str, force_refresh: bool = False) -> CaseResult:
         """
         Complete scraping workflow for a single case.
         
@@ -866,6 +1669,7 @@ class BECAScraper:
             year: Case year (e.g., '2024')
             case_type: Case type (e.g., 'CA')
             seq_num: Sequential number (e.g., '038092')
+            force_refresh: Scrape again even if an earlier run succeeded
         
         Returns:
             CaseResult object with all extracted data
@@ -877,14 +1681,23 @@ class BECAScraper:
         logger.info(f"PROCESSING: {case_id}")
         logger.info(f"{'='*60}")
         
-        self.stats['cases_processed'] += 1
+        self._count('cases_processed')
+        
+        # A case scraped successfully before needs no browser or PDF work
+        if self.extraction_cache and not force_refresh:
+            cached = self.extraction_cache.get_result(case_id)
+            if cached:
+                logger.info(f"♻️ {case_id} already scraped, reusing result")
+                self._count('cases_successful')
+                self._count('total_judgment_value', cached.judgment_amount)
+                return cached
         
         try:
             # Step 1: Search for case
             if not self.search_case(year, case_type, seq_num):
                 result.status = 'case_not_found'
                 result.errors.append('Case not found in BECA')
-                self.stats['cases_failed'] += 1
+                self._count('cases_failed')
                 return result
             
             # Step 2: Extract party information
@@ -905,6 +1718,17 @@ class BECAScraper:
                     result.document_number = doc_info.doc_number
                     result.judgment_date = doc_info.doc_date
                     
+                    # Step 4a: Reuse an earlier run's extraction of this document
+                    cached = (
+                        self.extraction_cache.get(case_id, doc_info.doc_number)
+                        if self.extraction_cache and doc_info.doc_number else None
+                    )
+                    if cached:
+                        (result.judgment_amount, result.extraction_method,
+                         result.confidence_score, result.pdf_path) = cached
+                        logger.info(f"♻️ {doc_info.doc_type} #{doc_info.doc_number} already extracted, skipping download")
+                        break
+                    
                     # Step 4: Download PDF
                     pdf_path = self.download_pdf(doc_info)
                     
@@ -918,6 +1742,11 @@ class BECAScraper:
                             result.judgment_amount = amount
                             result.extraction_method = method
                             result.confidence_score = confidence
+                            if self.extraction_cache and doc_info.doc_number:
+                                self.extraction_cache.put(
+                                    case_id, doc_info.doc_number, amount, method, confidence,
+                                    pdf_digest(pdf_path), str(pdf_path)
+                                )
                             break  # Success - stop trying documents
                         else:
                             result.errors.append(f"No amount found in {doc_info.doc_type}")
@@ -934,11 +1763,13 @@ class BECAScraper:
             # Determine final status
             if result.judgment_amount:
                 result.status = 'success'
-                self.stats['cases_successful'] += 1
-                self.stats['total_judgment_value'] += result.judgment_amount
+                self._count('cases_successful')
+                self._count('total_judgment_value', result.judgment_amount)
+                if self.extraction_cache:
+                    self.extraction_cache.put_result(result)
             else:
                 result.status = 'partial' if result.plaintiff else 'failed'
-                self.stats['cases_failed'] += 1
+                self._count('cases_failed')
             
             # Rate limiting delay
             time.sleep(self.request_delay)
@@ -949,21 +1780,30 @@ class BECAScraper:
             logger.error(f"❌ Case processing error: {e}")
             result.status = 'error'
             result.errors.append(str(e))
-            self.stats['cases_failed'] += 1
+            self._count('cases_failed')
             return result
     
-    def scrape_cases(self, cases: List[Tuple[str, str, str]]) -> List[CaseResult]:
+    def scrape_cases(
+        self,
+        cases: List[Tuple[str, str, str]],
+        workers: int = 1,
+        force_refresh: bool = False
+    ) -> List[CaseResult]:
         """
         Scrape multiple cases.
         
         Args:
             cases: List of (year, case_type, seq_num) tuples
+            workers: Browsers to scrape with in parallel (WebDriverPool when > 1)
+            force_refresh: Scrape every case again, ignoring stored results
         
         Returns:
             List of CaseResult objects
         """
         results = []
         self.stats['start_time'] = datetime.now().isoformat()
+        # Successful cases stream to Supabase in the background while scraping
+        self._supabase_writer = self._open_supabase_writer()
         
         logger.info(f"\n{'#'*60}")
         logger.info(f"BREVARD BIDDER AI - BECA SCRAPER V2.0")
@@ -971,23 +1811,27 @@ class BECAScraper:
         logger.info(f"{'#'*60}\n")
         
         try:
-            # Initialize browser
-            self.initialize_driver()
-            
-            # Accept disclaimers
-            if not self.accept_disclaimers():
-                logger.error("❌ Failed to accept disclaimers. Aborting.")
-                return results
-            
-            # Process each case
-            for i, (year, case_type, seq_num) in enumerate(cases, 1):
-                logger.info(f"\n[{i}/{len(cases)}] Processing case...")
-                result = self.scrape_case(year, case_type, seq_num)
-                results.append(result)
+            if workers > 1:
+                self._scrape_cases_pooled(cases, workers, results, force_refresh)
+            else:
+                # Initialize browser
+                self.initialize_driver()
                 
-                # Log progress
-                success_rate = (self.stats['cases_successful'] / self.stats['cases_processed']) * 100
-                logger.info(f"Progress: {i}/{len(cases)} | Success rate: {success_rate:.1f}%")
+                # Accept disclaimers
+                if not self.open_search():
+                    logger.error("❌ Failed to accept disclaimers. Aborting.")
+                    return results
+                
+                # Process each case
+                for i, (year, case_type, seq_num) in enumerate(cases, 1):
+                    logger.info(f"\n[{i}/{len(cases)}] Processing case...")
+                    result = self.scrape_case(year, case_type, seq_num, force_refresh)
+                    results.append(result)
+                    self._queue_for_supabase(result)
+                    
+                    # Log progress
+                    success_rate = (self.stats['cases_successful'] / self.stats['cases_processed']) * 100
+                    logger.info(f"Progress: {i}/{len(cases)} | Success rate: {success_rate:.1f}%")
             
         except KeyboardInterrupt:
             logger.info("\n⚠️ Scraping interrupted by user")
@@ -997,24 +1841,68 @@ class BECAScraper:
             
         finally:
             # Cleanup
-            if self.driver:
-                logger.info("🔒 Closing browser...")
-                self.driver.quit()
+            self.close_driver()
+            self.close_pdf_pool()
+            self._close_supabase_writer()
             
             self.stats['end_time'] = datetime.now().isoformat()
         
         # Export results
         self._export_results(results)
         
-        # Save to Supabase if available
-        if self.supabase:
-            self._save_to_supabase(results)
-        
         # Print summary
         self._print_summary()
         
         return results
     
+    def _prepare_pooled_driver(self, driver: webdriver.Chrome) -> bool:
+        """Take a pool browser past the BECA disclaimers."""
+        self.driver = driver
+        try:
+            return self.open_search()
+        finally:
+            self.driver = None
+    
+    def _scrape_pooled_case(
+        self,
+        pool: WebDriverPool,
+        case: Tuple[str, str, str],
+        force_refresh: bool = False
+    ) -> CaseResult:
+        """Scrape one case on a browser borrowed from the pool."""
+        self.driver = pool.acquire()
+        try:
+            return self.scrape_case(*case, force_refresh=force_refresh)
+        finally:
+            pool.release(self.driver)
+            self.driver = None
+    
+    def _scrape_cases_pooled(
+        self,
+        cases: List[Tuple[str, str, str]],
+        workers: int,
+        results: List[CaseResult],
+        force_refresh: bool = False
+    ):
+        """Scrape cases across a WebDriverPool, appending to results in input order."""
+        pool = WebDriverPool(
+            lambda: self.build_driver(page_load_strategy='eager'),
+            size=workers,
+            prepare=self._prepare_pooled_driver
+        )
+        
+        with pool, ThreadPoolExecutor(max_workers=len(pool.drivers)) as executor:
+            pooled = executor.map(
+                lambda case: self._scrape_pooled_case(pool, case, force_refresh), cases
+            )
+            for i, result in enumerate(pooled, 1):
+                results.append(result)
+                self._queue_for_supabase(result)
+                
+                # Log progress
+                success_rate = (self.stats['cases_successful'] / self.stats['cases_processed']) * 100
+                logger.info(f"Progress: {i}/{len(cases)} | Success rate: {success_rate:.1f}%")
+    
     def _export_results(self, results: List[CaseResult]):
         """Export results to CSV, JSON, and Excel."""
         if not results:
@@ -1024,13 +1912,16 @@ class BECAScraper:
         
         # Convert to dictionaries
         data = [r.to_dict() for r in results]
-        df = pd.DataFrame(data)
+        columns = list(CaseResult.__slots__)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # CSV
         csv_file = DATA_DIR / f'beca_results_{timestamp}.csv'
-        df.to_csv(csv_file, index=False)
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(data)
         logger.info(f"  CSV: {csv_file}")
         
         # JSON
@@ -1039,9 +1930,14 @@ class BECAScraper:
             json.dump(data, f, indent=2, default=str)
         logger.info(f"  JSON: {json_file}")
         
-        # Excel
+        # Excel (pandas is only imported here; it is slow to load and optional)
         try:
+            import pandas as pd
+            
             excel_file = DATA_DIR / f'beca_results_{timestamp}.xlsx'
+            df = pd.DataFrame.from_records(
+                [tuple(getattr(r, k) for k in columns) for r in results], columns=columns
+            )
             df.to_excel(excel_file, index=False, engine='openpyxl')
             logger.info(f"  Excel: {excel_file}")
         except:
@@ -1052,33 +1948,47 @@ class BECAScraper:
         with open(latest_file, 'w') as f:
             json.dump(data, f, indent=2, default=str)
     
-    def _save_to_supabase(self, results: List[CaseResult]):
-        """Save results to Supabase database."""
+    @staticmethod
+    def _supabase_row(result: CaseResult) -> Dict:
+        """foreclosure_judgments row for a case result."""
+        return {
+            'case_number': result.case_number,
+            'plaintiff': result.plaintiff,
+            'defendants': result.defendants,
+            'property_address': result.property_address,
+            'judgment_amount': result.judgment_amount,
+            'judgment_date': result.judgment_date,
+            'auction_date': result.auction_date,
+            'document_type': result.document_type,
+            'confidence_score': result.confidence_score,
+            'extracted_at': result.extracted_at
+        }
+    
+    def _open_supabase_writer(self) -> Optional['SupabaseBatchWriter']:
+        """Start a background batch writer for foreclosure_judgments, if Supabase is configured."""
         if not self.supabase:
-            return
-        
-        logger.info("💾 Saving to Supabase...")
-        
-        try:
-            for result in results:
-                if result.judgment_amount:
-                    self.supabase.table('foreclosure_judgments').upsert({
-                        'case_number': result.case_number,
-                        'plaintiff': result.plaintiff,
-                        'defendants': result.defendants,
-                        'property_address': result.property_address,
-                        'judgment_amount': result.judgment_amount,
-                        'judgment_date': result.judgment_date,
-                        'auction_date': result.auction_date,
-                        'document_type': result.document_type,
-                        'confidence_score': result.confidence_score,
-                        'extracted_at': result.extracted_at
-                    }).execute()
-            
-            logger.info(f"✅ Saved {len(results)} records to Supabase")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Supabase save failed: {e}")
+            return None
+        return SupabaseBatchWriter(self.supabase, 'foreclosure_judgments', max_retries=self.max_retries)
+    
+    def _queue_for_supabase(self, result: CaseResult):
+        """Hand a finished case to the Supabase writer (only cases with an amount)."""
+        if self._supabase_writer and result.judgment_amount:
+            self._supabase_writer.put(self._supabase_row(result))
+    
+    def _close_supabase_writer(self):
+        """Flush and stop the Supabase writer."""
+        if self._supabase_writer:
+            logger.info("💾 Saving to Supabase...")
+            self._supabase_writer.close()
+            logger.info(f"✅ Saved {self._supabase_writer.written} records to Supabase")
+            self._supabase_writer = None
+    
+    def _save_to_supabase(self, results: List[CaseResult]):
+        """Save results to Supabase database in batched upserts."""
+        self._supabase_writer = self._open_supabase_writer()
+        for result in results:
+            self._queue_for_supabase(result)
+        self._close_supabase_writer()
     
     def _print_summary(self):
         """Print scraping summary."""
@@ -1102,7 +2012,7 @@ class BECAScraper:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
-def scrape_december_3_2025():
+def scrape_december_3_2025(workers: int = 1, reuse_session: bool = False, force_refresh: bool = False):
     """Scrape all December 3, 2025 auction properties."""
     
     cases = [
@@ -1118,27 +2028,44 @@ def scrape_december_3_2025():
         ('2024', 'CA', '058538'),  # 8520 HIGHWAY 1
     ]
     
-    scraper = BECAScraper(headless=False)
-    results = scraper.scrape_cases(cases)
+    scraper = BECAScraper(headless=workers > 1, reuse_session=reuse_session)
+    results = scraper.scrape_cases(cases, workers=workers, force_refresh=force_refresh)
     
     return results
 
 
-def scrape_single_case(year: str, case_type: str, seq_num: str) -> CaseResult:
+def scrape_single_case(
+    year: str,
+    case_type: str,
+    seq_num: str,
+    reuse_session: bool = False,
+    force_refresh: bool = False
+) -> CaseResult:
     """Scrape a single case."""
-    scraper = BECAScraper(headless=False)
+    scraper = BECAScraper(headless=False, reuse_session=reuse_session)
     
     try:
         scraper.initialize_driver()
-        if scraper.accept_disclaimers():
-            return scraper.scrape_case(year, case_type, seq_num)
+        if scraper.open_search():
+            return scraper.scrape_case(year, case_type, seq_num, force_refresh)
     finally:
-        if scraper.driver:
-            scraper.driver.quit()
+        scraper.close_driver()
+        scraper.close_pdf_pool()
     
     return CaseResult(case_number=f"05-{year}-{case_type}-{seq_num}", status='failed')
 
 
+def reparse_downloaded_pdfs() -> List[Tuple[Path, Tuple[Optional[float], str, int]]]:
+    """Re-extract judgment amounts from every downloaded PDF in parallel."""
+    pdf_paths = sorted(PDF_DIR.glob('*.pdf'))
+    scraper = BECAScraper(headless=True)
+    
+    try:
+        return list(zip(pdf_paths, scraper.extract_amounts_from_pdfs(pdf_paths)))
+    finally:
+        scraper.close_pdf_pool()
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -1150,6 +2077,10 @@ if __name__ == '__main__':
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--case', type=str, help='Single case number (e.g., 2024-CA-038092)')
     parser.add_argument('--dec3', action='store_true', help='Scrape December 3, 2025 auction')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel browsers for --dec3')
+    parser.add_argument('--reparse', action='store_true', help='Re-extract amounts from downloaded PDFs')
+    parser.add_argument('--reuse-session', action='store_true', help='Attach to / leave open a browser across runs')
+    parser.add_argument('--force-refresh', action='store_true', help='Scrape cases again even if stored results are fresh')
     
     args = parser.parse_args()
     
@@ -1157,19 +2088,29 @@ if __name__ == '__main__':
         # Parse case number
         parts = args.case.split('-')
         if len(parts) >= 3:
-            result = scrape_single_case(parts[0], parts[1], parts[2])
+            result = scrape_single_case(
+                parts[0], parts[1], parts[2],
+                reuse_session=args.reuse_session, force_refresh=args.force_refresh
+            )
             print(f"\nResult: {result.to_dict()}")
         else:
             print("Invalid case format. Use: YYYY-CA-NNNNNN")
     
     elif args.dec3:
-        results = scrape_december_3_2025()
+        results = scrape_december_3_2025(
+            workers=args.workers, reuse_session=args.reuse_session, force_refresh=args.force_refresh
+        )
         print(f"\nExtracted {len([r for r in results if r.judgment_amount])} judgment amounts")
     
+    elif args.reparse:
+        for pdf_path, (amount, method, confidence) in reparse_downloaded_pdfs():
+            print(f"{pdf_path.name}: {amount} ({method}, confidence: {confidence})")
+    
     else:
         # Default: December 3 auction
         print("BidDeed.AI BECA Scraper V2.0")
         print("Usage:")
         print("  --dec3          Scrape December 3, 2025 auction")
         print("  --case CASE     Scrape single case (e.g., 2024-CA-038092)")
+        print("  --reparse       Re-extract amounts from downloaded PDFs")
         print("  --headless      Run without visible browser")
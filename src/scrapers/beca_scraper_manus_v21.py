@@ -14,6 +14,7 @@ V21 CRITICAL FIXES:
 8. Natural reading patterns before interactions
 9. Multiple fallback selectors for each element
 10. Cookie-authenticated PDF downloads
+11. Parallel batches over a pool of warm browser contexts (BECA_POOL_MIN/MAX)
 
 Author: Claude (AI Architect, BidDeed.AI)
 Date: December 11, 2025
@@ -32,9 +33,10 @@ import logging
 import asyncio
 import tempfile
 import hashlib
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Callable, Awaitable
 from dataclasses import dataclass, asdict, field
 
 # ============================================================================
@@ -49,6 +51,10 @@ BECA_SPLASH = "https://vweb2.brevardclerk.us/Beca/splash.cfm"
 BECA_CASE_SEARCH = "https://vweb2.brevardclerk.us/Beca/CaseSearch.cfm"
 BECA_SEARCH_ACTION = "https://vweb2.brevardclerk.us/Beca/CaseListing.cfm"
 
+# Browser contexts kept warm for parallel batches (BrowserPool)
+POOL_MIN = int(os.environ.get('BECA_POOL_MIN', '3'))
+POOL_MAX = int(os.environ.get('BECA_POOL_MAX', '3'))
+
 # Output directory
 OUTPUT_DIR = Path(os.environ.get('OUTPUT_DIR', '/tmp/beca_v21_output'))
 OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
@@ -399,6 +405,109 @@ def extract_address_from_pdf(pdf_text: str) -> Tuple[Optional[str], float, Optio
     return address, confidence or 0.0, method
 
 
+# ============================================================================
+# BROWSER POOL
+# ============================================================================
+
+class BrowserPool:
+    """
+    Warm Playwright browser contexts shared by async workers.
+    
+    Contexts share one browser process but keep their own cookies, so each
+    holds its own BECA session. min_size contexts are opened (and prepared,
+    e.g. taken past the disclaimers) up front; more are opened on demand,
+    up to max_size, while every context is busy.
+    """
+    
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        prepare: Optional[Callable[[Any], Awaitable[bool]]] = None
+    ):
+        """
+        Args:
+            factory: Opens a new browser context
+            min_size: Contexts opened by initialize (default: BECA_POOL_MIN)
+            max_size: Most contexts ever open (default: BECA_POOL_MAX)
+            prepare: Readies a new context; a False return discards it
+        """
+        self.factory = factory
+        self.max_size = max(1, max_size or POOL_MAX)
+        self.min_size = max(1, min(POOL_MIN if min_size is None else min_size, self.max_size))
+        self.prepare = prepare
+        self.contexts: List[Any] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._opening = 0
+    
+    async def _open(self):
+        context = await self.factory()
+        if self.prepare and not await self.prepare(context):
+            await context.close()
+            return None
+        return context
+    
+    async def initialize(self) -> 'BrowserPool':
+        """Open min_size contexts concurrently."""
+        opened = await asyncio.gather(
+            *(self._open() for _ in range(self.min_size)), return_exceptions=True
+        )
+        for context in opened:
+            if isinstance(context, BaseException):
+                logger.warning(f"Browser context start failed: {context}")
+            elif context:
+                self.contexts.append(context)
+                self._idle.put_nowait(context)
+        
+        if not self.contexts:
+            raise RuntimeError("No browser context in the pool could be started")
+        
+        logger.info(f"✅ Browser pool ready ({len(self.contexts)}/{self.max_size})")
+        return self
+    
+    async def acquire(self):
+        """Take an idle context, opening another if all are busy and the pool can grow."""
+        if self._idle.empty() and len(self.contexts) + self._opening < self.max_size:
+            self._opening += 1
+            try:
+                context = await self._open()
+            except Exception as e:
+                logger.warning(f"Browser context start failed: {e}")
+                context = None
+            finally:
+                self._opening -= 1
+            if context:
+                self.contexts.append(context)
+                return context
+        return await self._idle.get()
+    
+    async def release(self, context, reset_cookies: bool = False):
+        """
+        Return a context to the pool.
+        
+        The authenticated BECA session is kept unless reset_cookies is set.
+        """
+        if reset_cookies:
+            await context.clear_cookies()
+        self._idle.put_nowait(context)
+    
+    async def close(self):
+        """Close every context in the pool."""
+        for context in self.contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self.contexts.clear()
+    
+    async def __aenter__(self) -> 'BrowserPool':
+        return await self.initialize()
+    
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
 # ============================================================================
 # MAIN SCRAPER CLASS
 # ============================================================================
@@ -408,101 +517,131 @@ class BECAManusScraperV20:
     
     def __init__(self, headless: bool = True):
         self.headless = headless
+        self.playwright = None
         self.browser = None
-        self.context = None
-        self.page = None
+        # Each pooled worker task drives its own context/page (see scrape_batch)
+        self._context_var: ContextVar = ContextVar('beca_context', default=None)
+        self._page_var: ContextVar = ContextVar('beca_page', default=None)
         self.results: List[CaseResult] = []
         self.profile = random.choice(BROWSER_PROFILES)
         self.session_cookies = []
         self.disclaimer_accepted = False
-        
+    
+    @property
+    def context(self):
+        """Browser context used by the current task."""
+        return self._context_var.get()
+    
+    @context.setter
+    def context(self, context):
+        self._context_var.set(context)
+    
+    @property
+    def page(self):
+        """Page used by the current task."""
+        return self._page_var.get()
+    
+    @page.setter
+    def page(self, page):
+        self._page_var.set(page)
+    
     async def init_browser(self) -> bool:
         """Initialize Playwright browser with stealth settings."""
         try:
-            from playwright.async_api import async_playwright
-            
-            self.playwright = await async_playwright().start()
-            
-            # Launch with stealth args
-            launch_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--disable-infobars',
-                '--disable-background-networking',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-breakpad',
-                '--disable-component-update',
-                '--disable-default-apps',
-                '--disable-domain-reliability',
-                '--disable-extensions',
-                '--disable-features=TranslateUI',
-                '--disable-hang-monitor',
-                '--disable-ipc-flooding-protection',
-                '--disable-popup-blocking',
-                '--disable-prompt-on-repost',
-                '--disable-renderer-backgrounding',
-                '--disable-sync',
-                '--enable-features=NetworkService,NetworkServiceInProcess',
-                '--force-color-profile=srgb',
-                '--metrics-recording-only',
-                '--no-first-run',
-                '--password-store=basic',
-                '--use-mock-keychain',
-                f'--window-size={self.profile["viewport"]["width"]},{self.profile["viewport"]["height"]}',
-            ]
-            
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=launch_args,
-            )
-            
-            # Create context with fingerprint
-            self.context = await self.browser.new_context(
-                viewport=self.profile["viewport"],
-                user_agent=self.profile["user_agent"],
-                locale=self.profile["language"],
-                timezone_id=self.profile["timezone"],
-                permissions=['geolocation'],
-                geolocation={"latitude": 28.0836, "longitude": -80.6081},  # Melbourne, FL
-                color_scheme='light',
-                java_script_enabled=True,
-                bypass_csp=True,
-                ignore_https_errors=True,
-            )
-            
-            # Block tracking/analytics scripts
-            await self.context.route("**/*", self._route_handler)
-            
-            # Add stealth scripts
-            await self.context.add_init_script(self._get_stealth_script())
-            
-            self.page = await self.context.new_page()
-            
-            # Set extra headers
-            await self.page.set_extra_http_headers({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            })
+            await self.launch_browser()
+            self.context = await self.new_context()
+            self.page = self.context.pages[0]
             
             logger.info(f"✅ V20: Playwright browser initialized")
             logger.info(f"   Profile: {self.profile['platform']}, {self.profile['viewport']['width']}x{self.profile['viewport']['height']}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Browser init failed: {e}")
             import traceback
             traceback.print_exc()
             return False
     
+    async def launch_browser(self):
+        """Start Playwright and launch Chromium with stealth args."""
+        from playwright.async_api import async_playwright
+        
+        self.playwright = await async_playwright().start()
+        
+        # Launch with stealth args
+        launch_args = [
+            '--disable-blink-features=AutomationControlled',
+            '--disable-dev-shm-usage',
+            '--disable-infobars',
+            '--disable-background-networking',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-breakpad',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-domain-reliability',
+            '--disable-extensions',
+            '--disable-features=TranslateUI',
+            '--disable-hang-monitor',
+            '--disable-ipc-flooding-protection',
+            '--disable-popup-blocking',
+            '--disable-prompt-on-repost',
+            '--disable-renderer-backgrounding',
+            '--disable-sync',
+            '--enable-features=NetworkService,NetworkServiceInProcess',
+            '--force-color-profile=srgb',
+            '--metrics-recording-only',
+            '--no-first-run',
+            '--password-store=basic',
+            '--use-mock-keychain',
+            f'--window-size={self.profile["viewport"]["width"]},{self.profile["viewport"]["height"]}',
+        ]
+        
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=launch_args,
+        )
+    
+    async def new_context(self):
+        """Open a fingerprinted, tracker-blocking context with one page."""
+        # Create context with fingerprint
+        context = await self.browser.new_context(
+            viewport=self.profile["viewport"],
+            user_agent=self.profile["user_agent"],
+            locale=self.profile["language"],
+            timezone_id=self.profile["timezone"],
+            permissions=['geolocation'],
+            geolocation={"latitude": 28.0836, "longitude": -80.6081},  # Melbourne, FL
+            color_scheme='light',
+            java_script_enabled=True,
+            bypass_csp=True,
+            ignore_https_errors=True,
+        )
+        
+        # Block tracking/analytics scripts
+        await context.route("**/*", self._route_handler)
+        
+        # Add stealth scripts
+        await context.add_init_script(self._get_stealth_script())
+        
+        page = await context.new_page()
+        
+        # Set extra headers
+        await page.set_extra_http_headers({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0',
+        })
+        
+        return context
+    
     async def _route_handler(self, route):
         """Block tracking scripts while allowing main content."""
         url = route.request.url
@@ -1026,9 +1165,39 @@ class BECAManusScraperV20:
             logger.error(f"Case scrape error: {e}")
             return result
 
-    async def scrape_batch(self, cases: List[Dict], auction_date: str = None) -> List[CaseResult]:
-        """Scrape multiple cases with anti-detection measures."""
+    async def scrape_batch(self, cases: List[Dict], auction_date: str = None, workers: int = None) -> List[CaseResult]:
+        """
+        Scrape multiple cases with anti-detection measures.
+        
+        Args:
+            cases: Case dicts with a 'case_number' (or 'case') key
+            auction_date: Auction date recorded on every result
+            workers: Browser contexts to scrape with in parallel
+                (default: BECA_POOL_MAX; 1 scrapes serially on one page)
+        
+        Returns:
+            List of CaseResult objects, in input order
+        """
         results = []
+        workers = min(workers or POOL_MAX, len(cases))
+        
+        if workers > 1:
+            try:
+                await self.launch_browser()
+            except Exception as e:
+                logger.error(f"Browser init failed: {e}")
+                await self.close()
+                return results
+            
+            try:
+                results = await self._scrape_batch_pooled(cases, auction_date, workers)
+            except Exception as e:
+                logger.error(f"Pooled batch failed: {e}")
+            finally:
+                await self.close()
+            
+            self.results.extend(results)
+            return results
         
         if not await self.init_browser():
             logger.error("Browser init failed")
@@ -1051,20 +1220,70 @@ class BECAManusScraperV20:
                 
                 # Anti-detection delay between cases
                 if i < len(cases):
-                    delay = random.uniform(5, 12)  # Longer delays between cases
-                    logger.info(f"⏳ Waiting {delay:.1f}s before next case...")
-                    await asyncio.sleep(delay)
-                    
-                    # Occasionally refresh search page (like real user)
-                    if random.random() < 0.3:
-                        await self.page.goto(BECA_CASE_SEARCH, wait_until='networkidle')
-                        await human_delay(1, 2)
+                    await self._pause_between_cases()
         
         finally:
             await self.close()
         
         return results
     
+    async def _pause_between_cases(self):
+        """Wait like a user between cases, occasionally reloading the search page."""
+        delay = random.uniform(5, 12)  # Longer delays between cases
+        logger.info(f"⏳ Waiting {delay:.1f}s before next case...")
+        await asyncio.sleep(delay)
+        
+        # Occasionally refresh search page (like real user)
+        if random.random() < 0.3:
+            await self.page.goto(BECA_CASE_SEARCH, wait_until='networkidle')
+            await human_delay(1, 2)
+    
+    async def _prepare_pooled_context(self, context) -> bool:
+        """Take a pool context past the BECA disclaimers."""
+        self.context, self.page = context, context.pages[0]
+        return await self.accept_disclaimers()
+    
+    async def _scrape_batch_pooled(self, cases: List[Dict], auction_date: str, workers: int) -> List[CaseResult]:
+        """Scrape cases across a BrowserPool with one worker task per context."""
+        results: List[Optional[CaseResult]] = [None] * len(cases)
+        pending: asyncio.Queue = asyncio.Queue()
+        for i, case in enumerate(cases):
+            pending.put_nowait((i, case.get('case_number') or case.get('case')))
+        done = 0
+        
+        async def worker(pool: BrowserPool):
+            nonlocal done
+            while not pending.empty():
+                i, case_number = pending.get_nowait()
+                context = await pool.acquire()
+                # Set in this worker's task only, so each worker drives its own page
+                self.context, self.page = context, context.pages[0]
+                try:
+                    logger.info(f"[{i + 1}/{len(cases)}] Processing: {case_number}")
+                    results[i] = await self.scrape_case(case_number, auction_date)
+                    done += 1
+                    logger.info(f"Progress: {done}/{len(cases)}")
+                    
+                    # Anti-detection delay before this context's next case
+                    if not pending.empty():
+                        try:
+                            await self._pause_between_cases()
+                        except Exception as e:
+                            logger.warning(f"Pause between cases failed: {e}")
+                finally:
+                    await pool.release(context)
+        
+        pool = BrowserPool(
+            self.new_context,
+            min_size=min(POOL_MIN, workers),
+            max_size=workers,
+            prepare=self._prepare_pooled_context
+        )
+        async with pool:
+            await asyncio.gather(*(worker(pool) for _ in range(workers)))
+        
+        return results
+    
     async def close(self):
         """Clean up browser resources."""
         try:
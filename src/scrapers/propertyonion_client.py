@@ -0,0 +1,458 @@
+"""
+PropertyOnion API Client for BidDeed.AI
+=======================================
+Discovered API Endpoints:
+- Auth: POST https://propertyonion.com/api/auth/login
+- Search: POST https://propertyonion.com/api/search/api/search-by-county
+- Counties: GET https://propertyonion.com/api/common/county?fetchAll=true
+- Lookups: GET https://propertyonion.com/api/search/api/getlookups
+
+Usage:
+    client = PropertyOnionClient()
+    await client.login("email@example.com", "password")
+    results = await client.search_tax_deeds("Brevard", "2025-12-18")
+"""
+
+import asyncio
+import httpx
+import json
+import math
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Mapping
+
+# orjson parses/serializes in native code; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Where the PropertyOnion auth token is kept between runs
+PO_TOKEN_FILE = os.getenv("PO_TOKEN_FILE", "./.po_token.json")
+
+# Florida counties as name -> (PropertyOnion county id, FIPS code)
+# (discovered from /api/common/county); read-only
+COUNTIES: Mapping[str, Tuple[int, str]] = MappingProxyType({
+    "Brevard": (18, "12009"),
+    "Palm Beach": (1, "12099"),
+    "Broward": (2, "12011"),
+    "Miami-Dade": (3, "12086"),
+    "Orange": (10, "12095"),
+    "Hillsborough": (11, "12057"),
+    "Duval": (9, "12031"),
+    "Pinellas": (4, "12103"),
+    "Lee": (5, "12071"),
+    "Polk": (12, "12105"),
+    "Volusia": (13, "12127"),
+    "Seminole": (33, "12117"),
+    "Osceola": (34, "12097"),
+    "Sarasota": (19, "12115"),
+    "Manatee": (17, "12081"),
+    "Collier": (31, "12021"),
+    "Marion": (32, "12083"),
+    "Pasco": (15, "12101"),
+    "Lake": (35, "12069"),
+    "Escambia": (16, "12033"),
+    "St. Johns": (29, "12109"),
+    "Clay": (22, "12019"),
+    "Alachua": (28, "12001"),
+    "Charlotte": (14, "12015"),
+    "Indian River": (30, "12061"),
+    "Flagler": (20, "12035"),
+    "Hernando": (37, "12053"),
+    "Citrus": (23, "12017"),
+    "Martin": (6, "12085"),
+    "St. Lucie": (8, "12111"),
+    "Nassau": (38, "12089"),
+    "Putnam": (21, "12107"),
+    "Washington": (184, "12133"),
+    "Hendry": (188, "12051"),
+})
+COUNTY_NAMES = frozenset(COUNTIES)
+
+
+def county_id(name: str) -> int:
+    """PropertyOnion county id for a county name"""
+    return COUNTIES[name][0]
+
+
+def county_fips(name: str) -> str:
+    """FIPS code for a county name"""
+    return COUNTIES[name][1]
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode()
+
+
+class PropertyOnionClient:
+    """Complete PropertyOnion API client with authentication"""
+    
+    BASE_URL = "https://propertyonion.com/api"
+    PAGE_CONCURRENCY = 4  # Concurrent page fetches in get_all_results
+    DEFAULT_PAGE_SIZE = 500
+    PROBE_PAGE_SIZE = 1000  # First get_all_results request size until the server cap is known
+    _max_page_size: Optional[int] = None  # Largest pageSize the server honors (learned)
+    SEARCH_CACHE_TTL = 60.0  # Seconds a successful search response is reused
+    TOKEN_TTL = 3600  # Seconds a persisted token is trusted before logging in again
+    
+    COUNTIES = COUNTIES  # Kept as a class attribute for existing callers
+    
+    def __init__(self, token_file: Optional[str] = None):
+        self.token: Optional[str] = None
+        self.user_info: Optional[Dict] = None
+        self.token_file = Path(token_file or PO_TOKEN_FILE)
+        self._token_expires_at = 0.0
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._headers_token: Optional[str] = None
+        # Recent search responses and searches in flight, keyed by every search field
+        self._search_cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._search_inflight: Dict[tuple, asyncio.Future] = {}
+        # Per-county search payload bases, built once instead of per request
+        self._county_payloads: Dict[str, Dict[str, str]] = {
+            name: {"fips": fips, "state": "FL", "county": name}
+            for name, (_, fips) in COUNTIES.items()
+        }
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Get request headers with auth token if available (rebuilt only when the token changes)"""
+        if self._headers is not None and self._headers_token == self.token:
+            return self._headers
+        h = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Origin": "https://www.propertyonion.com",
+            "Referer": "https://www.propertyonion.com/"
+        }
+        if self.token:
+            h["Authorization"] = f"Bearer {self.token}"
+        self._headers, self._headers_token = h, self.token
+        return h
+    
+    def _search_payload(self, county: str, listing_type: str, status: str, page: int, page_size: int) -> Dict[str, Any]:
+        """search-by-county payload from the prebuilt county base"""
+        base = self._county_payloads.get(county) or {"fips": "12009", "state": "FL", "county": county}
+        return {**base, "listingType": listing_type, "auctionStatus": status, "page": page, "pageSize": page_size}
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive HTTP/2 client (one TLS handshake for every search page)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+                headers=self.headers
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self):
+        await self._get_client()
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.aclose()
+    
+    async def login(self, email: str, password: str) -> bool:
+        """
+        Authenticate with PropertyOnion
+        
+        Args:
+            email: Account email
+            password: Account password
+            
+        Returns:
+            True if login successful
+        """
+        self._credentials = (email, password)
+        client = await self._get_client()
+        response = await client.post(
+            f"{self.BASE_URL}/auth/login",
+            content=_json_dumps({"email": email, "password": password})
+        )
+        
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            self._set_token(data.get("token") or data.get("accessToken"))
+            self.user_info = data.get("user") or data
+            if self.token:
+                self._token_expires_at = time.time() + self.TOKEN_TTL
+                self._save_token()
+            return bool(self.token)
+        
+        return False
+    
+    async def _ensure_auth(self, email: str, password: str) -> bool:
+        """
+        Make sure a usable token is set, logging in only when needed
+        
+        Reuses the in-memory token, then the persisted one, until it expires
+        (or a request 401s); otherwise logs in.
+        """
+        self._credentials = (email, password)
+        if self.token and time.time() < self._token_expires_at:
+            return True
+        if self._load_token():
+            return True
+        return await self.login(email, password)
+    
+    def _set_token(self, token: Optional[str]):
+        """Set the token and keep the shared client's Authorization header in sync"""
+        self.token = token
+        if self._client is not None:
+            if token:
+                self._client.headers["Authorization"] = f"Bearer {token}"
+            else:
+                self._client.headers.pop("Authorization", None)
+    
+    def _load_token(self) -> bool:
+        """Adopt the persisted token if it hasn't expired"""
+        try:
+            data = json.loads(self.token_file.read_text())
+        except (OSError, ValueError):
+            return False
+        if not data.get("token") or data.get("expires_at", 0) <= time.time():
+            return False
+        self._set_token(data["token"])
+        self.user_info = data.get("user")
+        self._token_expires_at = data["expires_at"]
+        return True
+    
+    def _save_token(self):
+        """Persist the token (owner-only permissions)"""
+        data = {"token": self.token, "expires_at": self._token_expires_at, "user": self.user_info}
+        try:
+            fd = os.open(self.token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
+    
+    def _invalidate_token(self):
+        """Forget a token the server rejected, in memory and on disk"""
+        self._set_token(None)
+        self._token_expires_at = 0.0
+        try:
+            self.token_file.unlink()
+        except OSError:
+            pass
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request; on 401, log in again once and retry"""
+        client = await self._get_client()
+        response = await client.request(method, url, **kwargs)
+        if response.status_code == 401 and self._credentials:
+            self._invalidate_token()
+            if await self.login(*self._credentials):
+                response = await client.request(method, url, **kwargs)
+        return response
+    
+    async def get_counties(self) -> List[Dict]:
+        """Get all available counties"""
+        response = await self._request("GET", f"{self.BASE_URL}/common/county?fetchAll=true")
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            return data.get("payload", data)
+        return []
+    
+    async def _search(
+        self,
+        listing_type: str,
+        county: str,
+        auction_date: Optional[str] = None,
+        status: str = "sold",
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        POST one search-by-county page
+        
+        Successful responses are reused for SEARCH_CACHE_TTL seconds, and
+        concurrent identical searches share a single request. Callers get
+        the shared response dict and must not mutate it.
+        """
+        key = (listing_type, county, auction_date, status, page, page_size)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.SEARCH_CACHE_TTL:
+            return cached[1]
+        
+        task = self._search_inflight.get(key)
+        if task is None:
+            payload = self._search_payload(county, listing_type, status, page, page_size)
+            if auction_date:
+                payload["auctionDate"] = auction_date
+            task = asyncio.ensure_future(self._post_search(payload))
+            self._search_inflight[key] = task
+            task.add_done_callback(lambda _: self._search_inflight.pop(key, None))
+        
+        # Shielded so one cancelled caller doesn't cancel the request for the others
+        result = await asyncio.shield(task)
+        if "error" not in result:
+            now = time.monotonic()
+            if len(self._search_cache) >= 256:
+                self._search_cache = {
+                    k: v for k, v in self._search_cache.items()
+                    if now - v[0] < self.SEARCH_CACHE_TTL
+                }
+            self._search_cache[key] = (now, result)
+        return result
+    
+    async def _post_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self._request(
+            "POST",
+            f"{self.BASE_URL}/search/api/search-by-county",
+            content=_json_dumps(payload)
+        )
+        
+        if response.status_code == 200:
+            return _json_loads(response.content)
+        
+        return {"error": response.status_code, "message": response.text}
+    
+    async def search_tax_deeds(
+        self,
+        county: str,
+        auction_date: Optional[str] = None,
+        status: str = "sold",
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Search for tax deed auction results
+        
+        Args:
+            county: County name (e.g., "Brevard")
+            auction_date: Optional date filter (YYYY-MM-DD)
+            status: "sold", "active", "all"
+            page: Page number for pagination
+            page_size: Results per page (the server may cap it lower)
+            
+        Returns:
+            Dict with properties list and metadata
+        """
+        return await self._search("tax-deed-auction", county, auction_date, status, page, page_size)
+    
+    async def search_foreclosures(
+        self,
+        county: str,
+        auction_date: Optional[str] = None,
+        status: str = "sold",
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """Search for foreclosure auction results"""
+        return await self._search("foreclosure-auction", county, auction_date, status, page, page_size)
+    
+    async def get_all_results(
+        self,
+        county: str,
+        listing_type: str = "tax-deed-auction",
+        auction_date: Optional[str] = None,
+        status: str = "sold"
+    ) -> List[Dict]:
+        """
+        Get ALL results with automatic pagination
+        
+        Args:
+            county: County name
+            listing_type: "tax-deed-auction" or "foreclosure-auction"
+            auction_date: Optional date filter
+            status: "sold", "active", "all"
+            
+        Returns:
+            List of all properties
+        """
+        async def search(*args) -> Dict:
+            return await self._search(listing_type, *args)
+        
+        def page_properties(result: Dict) -> List[Dict]:
+            return result.get("properties", result.get("data", []))
+        
+        # Ask for as much as the server allows so most counties fit in one request
+        page_size = PropertyOnionClient._max_page_size or self.PROBE_PAGE_SIZE
+        
+        # Page 1 tells us the total (and the page size the server honors)
+        first = await search(county, auction_date, status, 1, page_size)
+        all_properties = list(page_properties(first))
+        total = first.get("total", first.get("totalCount", 0))
+        # A short page is the last page; no extra request to find an empty one
+        if not all_properties or len(all_properties) >= total:
+            return all_properties
+        
+        # More results than one page returned: the returned size is the server's cap
+        page_size = len(all_properties)
+        PropertyOnionClient._max_page_size = page_size
+        
+        # Fetch the remaining pages concurrently (bounded for rate limiting)
+        num_pages = math.ceil(total / page_size)
+        sem = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+        
+        async def fetch(page: int) -> Dict:
+            async with sem:
+                result = await search(county, auction_date, status, page, page_size)
+                await asyncio.sleep(0.1)  # Rate limiting
+                return result
+        
+        pages = await asyncio.gather(*(fetch(p) for p in range(2, num_pages + 1)))
+        for result in pages:
+            all_properties.extend(page_properties(result))
+        
+        return all_properties
+
+
+# Example usage and test
+async def main():
+    email = os.getenv("PO_EMAIL")
+    password = os.getenv("PO_PASSWORD")
+    if not email or not password:
+        print("Set PO_EMAIL and PO_PASSWORD to run the PropertyOnion client demo")
+        return
+    
+    client = PropertyOnionClient()
+    
+    print("🔐 Logging in to PropertyOnion...")
+    if await client.login(email, password):
+        print(f"   ✅ Logged in! Token: {client.token[:20]}...")
+        
+        print("\n📊 Searching Brevard County tax deeds (Dec 18, 2025)...")
+        results = await client.search_tax_deeds("Brevard", "2025-12-18")
+        
+        if "error" not in results:
+            properties = results.get("properties", [])
+            total = results.get("total", len(properties))
+            volume = sum(p.get("soldPrice", 0) or p.get("sold_amount", 0) for p in properties)
+            
+            print(f"   Found: {total} properties")
+            print(f"   Volume: ${volume:,.0f}")
+            
+            for p in properties[:5]:
+                addr = p.get("address", "Unknown")
+                sold = p.get("soldPrice") or p.get("sold_amount", 0)
+                print(f"   - ${sold:,.0f}: {addr}")
+        else:
+            print(f"   ❌ Error: {results}")
+    else:
+        print("   ❌ Login failed")
+    
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())